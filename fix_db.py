@@ -6,14 +6,17 @@ def fix_timestamps_path():
     story_id = "f366cc36-5d12-4235-b133-7558d8d8889c"
     story_dir = os.path.join("demo", "stories", story_id)
 
-    # Find the UUID-based JSON file
-    json_files = [f for f in os.listdir(
-        story_dir) if f.endswith('.json') and f != 'audio.json']
-    if not json_files:
-        print("No UUID-based JSON file found")
-        return
+    # The pipeline saves timestamps under a fixed name, so probe it directly
+    json_path = os.path.join(story_dir, "timestamps.json")
+    if not os.path.isfile(json_path):
+        # Older runs left the UUID-based JSON file; fall back to scanning
+        json_files = [f for f in os.listdir(
+            story_dir) if f.endswith('.json') and f != 'audio.json']
+        if not json_files:
+            print("No UUID-based JSON file found")
+            return
+        json_path = os.path.join(story_dir, json_files[0])
 
-    json_path = os.path.join(story_dir, json_files[0])
     print(f"Found JSON file: {json_path}")
 
     # Update the database
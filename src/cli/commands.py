@@ -80,7 +80,7 @@ def cli():
 @cli.command()
 @click.argument('subreddit')
 @click.option('--base-dir', default="demo/stories", help="Base directory for story files")
-@click.option('--model', default="base", help="Whisper model to use")
+@click.option('--model', default="distil-small.en", help="Whisper model to use")
 @click.option('--single', is_flag=True, help="Process only the first story from the feed")
 def crawl(subreddit: str, base_dir: str, model: str, single: bool):
     """Crawl stories from a subreddit and process them."""
@@ -355,12 +355,12 @@ def retry(story_id: str):
             'subreddit': story.subreddit,
             'base_dir': os.path.dirname(os.path.dirname(story.audio_path)) if story.audio_path else "demo/stories",
             'db_path': 'demo/story_pipeline.db',
-            'whisper_model': 'base'
+            'whisper_model': 'distil-small.en'
         }
 
-        # Run pipeline for this story
-        pipeline = StoryPipeline(config)
-        with console.status("Regenerating assets...", spinner="dots"):
+        # Run pipeline for this story; closing it commits its queued writes
+        with StoryPipeline(config) as pipeline, \
+                console.status("Regenerating assets...", spinner="dots"):
             pipeline.tts_processor.process([story_id])
             pipeline.subtitle_generator.process([story_id])
 
@@ -200,7 +200,7 @@ def _show_story_menu():
                 try:
                     ctx = click.get_current_context()
                     ctx.invoke(crawl, subreddit=subreddit,
-                               base_dir="demo/stories", model="base", single=single)
+                               base_dir="demo/stories", model="distil-small.en", single=single)
                 except Exception as e:
                     click.echo(f"Error crawling stories: {str(e)}")
             elif choice == 4:
@@ -457,18 +457,19 @@ def _show_file_menu() -> None:
                         click.echo("No backups found.")
                         continue
 
-                    backups = [f for f in os.listdir(
-                        backup_dir) if f.endswith('.zip')]
+                    # scandir returns each entry with its stat info, so the
+                    # listing needs no per-file size/mtime lookups
+                    with os.scandir(backup_dir) as entries:
+                        backups = [(entry.name, entry.stat()) for entry in entries
+                                   if entry.name.endswith('.zip')]
                     if not backups:
                         click.echo("No backup files found.")
                         continue
 
                     click.echo("\nAvailable backups:")
-                    for idx, backup in enumerate(backups, 1):
-                        backup_path = os.path.join(backup_dir, backup)
-                        size = os.path.getsize(backup_path) / 1024  # KB
-                        modified = datetime.fromtimestamp(
-                            os.path.getmtime(backup_path))
+                    for idx, (backup, stat) in enumerate(backups, 1):
+                        size = stat.st_size / 1024  # KB
+                        modified = datetime.fromtimestamp(stat.st_mtime)
                         click.echo(
                             f"{idx}. {backup} ({size:.2f} KB) - {modified}")
 
@@ -480,7 +481,7 @@ def _show_file_menu() -> None:
                         continue
                     if 1 <= choice <= len(backups):
                         backup_path = os.path.join(
-                            backup_dir, backups[choice - 1])
+                            backup_dir, backups[choice - 1][0])
                         ctx = click.get_current_context()
                         ctx.invoke(
                             restore, backup_path=backup_path, force=False)
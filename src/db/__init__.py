@@ -1,6 +1,7 @@
 from .models import Story
 from .manager import DatabaseManager
-from .utils import get_story_folder_path, get_story_file_paths
+from .utils import (get_story_folder_path, get_story_file_paths, get_decoded_audio_path,
+                    ensure_dir, clear_dir_cache)
 from .constants import StoryStatus
 
 __all__ = [
@@ -8,5 +9,16 @@ __all__ = [
     'DatabaseManager',
     'get_story_folder_path',
     'get_story_file_paths',
+    'get_decoded_audio_path',
+    'ensure_dir',
+    'clear_dir_cache',
     'StoryStatus'
 ]
+
+
+def __getattr__(name):
+    # AsyncDatabaseManager needs aiosqlite, so it is only imported on use
+    if name == 'AsyncDatabaseManager':
+        from .async_manager import AsyncDatabaseManager
+        return AsyncDatabaseManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
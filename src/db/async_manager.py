@@ -0,0 +1,177 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Sequence
+
+import aiosqlite
+
+from .models import Story
+from .constants import StoryStatus
+from .manager import (
+    DatabaseManager,
+    INSERT_STORY,
+    SELECT_STORY_BY_ID,
+    SELECT_STORIES_BY_STATUS,
+    SELECT_ALL_STORIES,
+)
+
+
+class AsyncDatabaseManager:
+    """Async SQLite access for the story pipeline.
+
+    Reads are served from a pool of warm reader connections so concurrent
+    processors don't serialize on one connection. All writes go through a
+    single writer connection, matching SQLite's single-writer model; WAL
+    mode lets the readers proceed while it commits.
+    """
+
+    def __init__(self, db_path: str = "demo/story_pipeline.db", pool_size: int = 4):
+        """Initialize the manager. Call ``open`` (or use ``async with``) before use.
+
+        Args:
+            db_path (str): Path to SQLite database file
+            pool_size (int): Number of pooled reader connections
+        """
+        self.db_path = db_path
+        self.pool_size = pool_size
+        # The queue and lock are created in open(): before Python 3.10 they
+        # bind to the loop current at construction, not the one that uses them
+        self._readers: "Optional[asyncio.Queue[aiosqlite.Connection]]" = None
+        self._reader_conns: List[aiosqlite.Connection] = []
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a connection configured for WAL access.
+
+        Returns:
+            aiosqlite.Connection: The new connection
+        """
+        conn = await aiosqlite.connect(self.db_path)
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    async def open(self) -> None:
+        """Create the schema and open the writer and reader connections."""
+        logging.debug("Opening async database pool for %s", self.db_path)
+        # Reuse the synchronous manager for table creation and migrations
+        DatabaseManager(self.db_path).close()
+
+        self._readers = asyncio.Queue()
+        self._write_lock = asyncio.Lock()
+        self._writer = await self._connect()
+        for _ in range(self.pool_size):
+            conn = await self._connect()
+            self._reader_conns.append(conn)
+            self._readers.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        for conn in self._reader_conns:
+            await conn.close()
+        self._reader_conns.clear()
+        self._readers = None
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+
+    async def __aenter__(self) -> 'AsyncDatabaseManager':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a reader connection from the pool.
+
+        Yields:
+            aiosqlite.Connection: A pooled reader connection
+        """
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
+    async def _fetch_stories(self, query: str, params: Sequence = ()) -> List[Story]:
+        """Run a story SELECT on a pooled reader connection.
+
+        Args:
+            query (str): SQL query selecting STORY_COLUMNS
+            params (Sequence): Query parameters
+
+        Returns:
+            List[Story]: Stories built from the returned rows
+        """
+        async with self.connection() as conn:
+            async with conn.execute(query, params) as cursor:
+                rows = await cursor.fetchall()
+        return [DatabaseManager._row_to_story(row) for row in rows]
+
+    async def _write(self, query: str, params: Sequence = ()) -> None:
+        """Execute and commit a mutation on the single writer connection.
+
+        Args:
+            query (str): SQL statement
+            params (Sequence): Statement parameters
+        """
+        async with self._write_lock:
+            await self._writer.execute(query, params)
+            await self._writer.commit()
+
+    async def get_story(self, story_id: str) -> Optional[Story]:
+        """Retrieve a story by its ID.
+
+        Args:
+            story_id (str): ID of the story to retrieve
+
+        Returns:
+            Optional[Story]: Story object if found, None otherwise
+        """
+        stories = await self._fetch_stories(SELECT_STORY_BY_ID, (story_id,))
+        return stories[0] if stories else None
+
+    async def get_stories_by_status(self, status: StoryStatus) -> List[Story]:
+        """Retrieve all stories with a given status.
+
+        Args:
+            status (StoryStatus): Status to filter by
+
+        Returns:
+            List[Story]: List of matching stories
+        """
+        return await self._fetch_stories(SELECT_STORIES_BY_STATUS, (str(status.value),))
+
+    async def get_all_stories(self) -> List[Story]:
+        """Retrieve all stories.
+
+        Returns:
+            List[Story]: List of all stories
+        """
+        return await self._fetch_stories(SELECT_ALL_STORIES)
+
+    async def add_story(self, story: Story) -> None:
+        """Add a new story to the database.
+
+        Args:
+            story (Story): Story object to add
+        """
+        await self._write(INSERT_STORY, DatabaseManager._story_params(story))
+
+    async def update_story_status(self, story_id: str, status: StoryStatus, error: Optional[str] = None) -> None:
+        """Update the processing status of a story.
+
+        Args:
+            story_id (str): ID of the story to update
+            status (StoryStatus): New status
+            error (Optional[str]): Error message if any
+        """
+        await self._write("""
+            UPDATE stories
+            SET status = ?, error = ?
+            WHERE id = ?
+        """, (str(status), error, story_id))
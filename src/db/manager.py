@@ -2,34 +2,67 @@ import os
 import sqlite3
 import logging
 import shutil
-from typing import Dict, List, Optional
+from pathlib import Path
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 from .models import Story
 from .constants import StoryStatus
+from .utils import clear_dir_cache, get_decoded_audio_path
+from .writer import WriterQueue
 
 logging.basicConfig(level=logging.INFO,
                     format='%(filename)s - %(lineno)d - %(asctime)s - %(levelname)s - %(message)s')
 
+# Hot queries are kept as module constants so the SQL text is identical on
+# every call and sqlite3's per-connection statement cache can reuse them
+INSERT_STORY = """
+    INSERT INTO stories (
+        id, title, author, subreddit, url, text, created_at,
+        status, audio_path, timestamps_path, subtitles_path, error
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Column order matches Story's fields so rows can be unpacked positionally
+STORY_COLUMNS = (
+    "id, title, author, subreddit, url, text, created_at, "
+    "status, audio_path, timestamps_path, subtitles_path, error"
+)
+SELECT_STORY_BY_ID = f"SELECT {STORY_COLUMNS} FROM stories WHERE id = ?"
+SELECT_STORY_PATHS = "SELECT audio_path, timestamps_path, subtitles_path FROM stories WHERE id = ?"
+SELECT_STORIES_BY_STATUS = f"SELECT {STORY_COLUMNS} FROM stories WHERE status = ? ORDER BY created_at DESC"
+SELECT_ALL_STORIES = f"SELECT {STORY_COLUMNS} FROM stories ORDER BY created_at DESC"
+SELECT_STORIES_WITHOUT_ERRORS = (
+    f"SELECT {STORY_COLUMNS} FROM stories WHERE error IS NULL OR error = '' ORDER BY created_at DESC"
+)
+
 
 class DatabaseManager:
     """Manages SQLite database operations for story pipeline."""
 
-    def __init__(self, db_path: str = "demo/story_pipeline.db"):
+    def __init__(self, db_path: str = "demo/story_pipeline.db", background_writes: bool = False):
         """Initialize database connection and create tables if they don't exist.
 
         Args:
             db_path (str): Path to SQLite database file
+            background_writes (bool): If True, inserts and updates are queued to
+                a single background writer thread and committed in batches
         """
         self.db_path = db_path
-        logging.debug(f"Initializing database connection to {db_path}")
+        logging.debug("Initializing database connection to %s", db_path)
         try:
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
             self.conn = sqlite3.connect(db_path)
             self.conn.row_factory = sqlite3.Row
+            # WAL lets readers proceed during writes and commits with fewer fsyncs
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            # Single cursor reused by the fetch helpers
+            self._cursor = self.conn.cursor()
+            self._stmt_cache: Dict[int, str] = {}
             logging.debug("Database connection established")
             self._create_tables()
+            self._writer = WriterQueue(db_path) if background_writes else None
         except Exception as e:
-            logging.error(f"Failed to initialize database: {str(e)}")
+            logging.error("Failed to initialize database: %s", e)
             raise
 
     def _create_tables(self):
@@ -44,7 +77,7 @@ class DatabaseManager:
                     subreddit TEXT NOT NULL,
                     url TEXT NOT NULL,
                     text TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    created_at INTEGER NOT NULL,
                     status TEXT DEFAULT '{default_status}',
                     audio_path TEXT,
                     timestamps_path TEXT,
@@ -52,40 +85,125 @@ class DatabaseManager:
                     error TEXT
                 )
             """)
+            # Let the status/error filters walk an index in created_at
+            # order instead of scanning the table and sorting
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_status_created
+                ON stories(status, created_at DESC)
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_error_status_created
+                ON stories(error, status, created_at DESC)
+            """)
+        self._migrate_created_at()
+
+    def _migrate_created_at(self) -> None:
+        """Convert legacy text ``created_at`` values to unix microseconds.
+
+        Databases created before ``created_at`` became an INTEGER column hold
+        'YYYY-MM-DD HH:MM:SS[.ffffff]' strings. SQLite columns are dynamically
+        typed, so the values can be rewritten in place without rebuilding the
+        table.
+        """
+        rows = self.conn.execute(
+            "SELECT id, created_at FROM stories WHERE typeof(created_at) = 'text'"
+        ).fetchall()
+        if not rows:
+            return
+
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE stories SET created_at = ? WHERE id = ?",
+                [(self._to_unix_micros(self._parse_datetime(row['created_at'])), row['id'])
+                 for row in rows]
+            )
+        logging.info("Migrated created_at to unix microseconds for %d stories", len(rows))
+
+    @staticmethod
+    def _story_params(story: Story) -> tuple:
+        """Build the INSERT parameters for a story.
+
+        Args:
+            story (Story): Story object to convert
+
+        Returns:
+            tuple: Values in INSERT_STORY column order
+        """
+        return (
+            story.id, story.title, story.author, story.subreddit,
+            story.url, story.text, DatabaseManager._to_unix_micros(story.created_at), str(story.status),
+            story.audio_path, story.timestamps_path, story.subtitles_path,
+            story.error
+        )
+
+    def _write(self, sql: str, params: Sequence = (), many: bool = False) -> Future:
+        """Execute a mutation, on the background writer if one is enabled.
 
-    def add_story(self, story: Story) -> None:
+        Args:
+            sql (str): SQL statement to execute
+            params (Sequence): Statement parameters, or a sequence of them if ``many``
+            many (bool): Whether to run the statement with executemany
+
+        Returns:
+            Future: Resolves once the mutation is committed. Without a
+                background writer it is already complete when returned.
+        """
+        if self._writer is not None:
+            return self._writer.submit(sql, params, many)
+
+        with self.conn:
+            if many:
+                self._cursor.executemany(sql, params)
+            else:
+                self._cursor.execute(sql, params)
+        future = Future()
+        future.set_result(None)
+        return future
+
+    def flush(self) -> None:
+        """Wait until all queued background writes are committed."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def add_story(self, story: Story) -> Future:
         """Add a new story to the database.
 
         Args:
             story (Story): Story object to add
+
+        Returns:
+            Future: Resolves once the insert is committed
         """
-        with self.conn:
-            self.conn.execute("""
-                INSERT INTO stories (
-                    id, title, author, subreddit, url, text, created_at,
-                    status, audio_path, timestamps_path, subtitles_path, error
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                story.id, story.title, story.author, story.subreddit,
-                story.url, story.text, story.created_at, str(story.status),
-                story.audio_path, story.timestamps_path, story.subtitles_path,
-                story.error
-            ))
-
-    def update_story_status(self, story_id: str, status: StoryStatus, error: Optional[str] = None) -> None:
+        return self._write(INSERT_STORY, self._story_params(story))
+
+    def add_stories(self, stories: List[Story]) -> Future:
+        """Add several stories to the database in a single transaction.
+
+        Args:
+            stories (List[Story]): Story objects to add
+
+        Returns:
+            Future: Resolves once the inserts are committed
+        """
+        return self._write(
+            INSERT_STORY, [self._story_params(story) for story in stories], many=True)
+
+    def update_story_status(self, story_id: str, status: StoryStatus, error: Optional[str] = None) -> Future:
         """Update the processing status of a story.
 
         Args:
             story_id (str): ID of the story to update
             status (StoryStatus): New status
             error (Optional[str]): Error message if any
+
+        Returns:
+            Future: Resolves once the update is committed
         """
-        with self.conn:
-            self.conn.execute("""
-                UPDATE stories
-                SET status = ?, error = ?
-                WHERE id = ?
-            """, (str(status), error, story_id))
+        return self._write("""
+            UPDATE stories
+            SET status = ?, error = ?
+            WHERE id = ?
+        """, (str(status), error, story_id))
 
     def update_story_paths(
         self,
@@ -93,7 +211,7 @@ class DatabaseManager:
         audio_path: Optional[str] = None,
         timestamps_path: Optional[str] = None,
         subtitles_path: Optional[str] = None
-    ) -> None:
+    ) -> Optional[Future]:
         """Update file paths for a story.
 
         Args:
@@ -101,6 +219,10 @@ class DatabaseManager:
             audio_path (Optional[str]): Path to audio file
             timestamps_path (Optional[str]): Path to timestamps file
             subtitles_path (Optional[str]): Path to subtitles file
+
+        Returns:
+            Optional[Future]: Resolves once the update is committed, or None
+                if there was nothing to update
         """
         updates = []
         values = []
@@ -114,14 +236,84 @@ class DatabaseManager:
             updates.append("subtitles_path = ?")
             values.append(subtitles_path)
 
-        if updates:
-            values.append(story_id)
-            with self.conn:
-                self.conn.execute(f"""
-                    UPDATE stories
-                    SET {', '.join(updates)}
-                    WHERE id = ?
-                """, values)
+        if not updates:
+            return None
+
+        values.append(story_id)
+        return self._write(f"""
+            UPDATE stories
+            SET {', '.join(updates)}
+            WHERE id = ?
+        """, values)
+
+    def update_story_paths_and_status(
+        self,
+        story_id: str,
+        status: StoryStatus,
+        *,
+        audio_path: Optional[str] = None,
+        timestamps_path: Optional[str] = None,
+        subtitles_path: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> Future:
+        """Update file paths and processing status of a story in one statement.
+
+        Equivalent to calling update_story_paths followed by
+        update_story_status, but issues a single UPDATE in one transaction.
+
+        Args:
+            story_id (str): ID of the story to update
+            status (StoryStatus): New status
+            audio_path (Optional[str]): Path to audio file
+            timestamps_path (Optional[str]): Path to timestamps file
+            subtitles_path (Optional[str]): Path to subtitles file
+            error (Optional[str]): Error message if any
+
+        Returns:
+            Future: Resolves once the update is committed
+        """
+        updates = ["status = ?", "error = ?"]
+        values = [str(status), error]
+        if audio_path is not None:
+            updates.append("audio_path = ?")
+            values.append(audio_path)
+        if timestamps_path is not None:
+            updates.append("timestamps_path = ?")
+            values.append(timestamps_path)
+        if subtitles_path is not None:
+            updates.append("subtitles_path = ?")
+            values.append(subtitles_path)
+
+        values.append(story_id)
+        return self._write(f"""
+            UPDATE stories
+            SET {', '.join(updates)}
+            WHERE id = ?
+        """, values)
+
+    @staticmethod
+    def _to_unix_micros(dt: datetime) -> int:
+        """Convert a datetime into integer unix microseconds for storage.
+
+        Args:
+            dt (datetime): Datetime to convert
+
+        Returns:
+            int: Microseconds since the unix epoch
+        """
+        return int(dt.timestamp()) * 1_000_000 + dt.microsecond
+
+    @staticmethod
+    def _from_unix_micros(micros: int) -> datetime:
+        """Convert stored unix microseconds back into a datetime.
+
+        Args:
+            micros (int): Microseconds since the unix epoch
+
+        Returns:
+            datetime: Corresponding local datetime
+        """
+        return datetime.fromtimestamp(micros / 1_000_000)
 
     def _parse_datetime(self, dt_str: str) -> datetime:
         """Parse datetime string from SQLite into datetime object.
@@ -133,16 +325,49 @@ class DatabaseManager:
             datetime: Parsed datetime object
         """
         try:
-            # Try parsing with microseconds
-            return datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S.%f')
+            # Legacy rows store 'YYYY-MM-DD HH:MM:SS[.ffffff]', so slice the
+            # fixed offsets directly instead of paying for strptime per row
+            microsecond = int(dt_str[20:26].ljust(6, '0')) if len(dt_str) > 19 else 0
+            return datetime(
+                int(dt_str[0:4]), int(dt_str[5:7]), int(dt_str[8:10]),
+                int(dt_str[11:13]), int(dt_str[14:16]), int(dt_str[17:19]),
+                microsecond
+            )
         except ValueError:
-            try:
-                # Try parsing without microseconds
-                return datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                # If all else fails, return current datetime
-                logging.warning(f"Could not parse datetime: {dt_str}")
-                return datetime.now()
+            # If all else fails, return current datetime
+            logging.warning("Could not parse datetime: %s", dt_str)
+            return datetime.now()
+
+    @staticmethod
+    def _row_to_story(row: Sequence) -> Story:
+        """Build a Story from a row selected with STORY_COLUMNS.
+
+        Args:
+            row (Sequence): Row in STORY_COLUMNS order
+
+        Returns:
+            Story: The corresponding story
+        """
+        # Convert created_at unix microseconds to datetime
+        return Story(
+            row[0], row[1], row[2], row[3], row[4], row[5],
+            DatabaseManager._from_unix_micros(row[6]),
+            row[7], row[8], row[9], row[10], row[11]
+        )
+
+    def _fetch_stories(self, query: str, params: Sequence = ()) -> List[Story]:
+        """Run a SELECT on the shared cursor and build Story objects.
+
+        Args:
+            query (str): SQL query selecting STORY_COLUMNS
+            params (Sequence): Query parameters
+
+        Returns:
+            List[Story]: Stories built from the returned rows
+        """
+        self.flush()
+        return [self._row_to_story(row)
+                for row in self._cursor.execute(query, params).fetchall()]
 
     def get_story(self, story_id: str) -> Optional[Story]:
         """Retrieve a story by its ID.
@@ -153,18 +378,8 @@ class DatabaseManager:
         Returns:
             Optional[Story]: Story object if found, None otherwise
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM stories WHERE id = ?
-        """, (story_id,))
-        row = cursor.fetchone()
-        if row:
-            row_dict = dict(row)
-            # Convert created_at string to datetime
-            if isinstance(row_dict['created_at'], str):
-                row_dict['created_at'] = self._parse_datetime(
-                    row_dict['created_at'])
-            return Story(**row_dict)
-        return None
+        stories = self._fetch_stories(SELECT_STORY_BY_ID, (story_id,))
+        return stories[0] if stories else None
 
     def get_stories_by_status(self, status: StoryStatus) -> List[Story]:
         """Retrieve all stories with a given status.
@@ -178,30 +393,43 @@ class DatabaseManager:
         try:
             # Get the actual value from the enum
             status_str = str(status.value)
-            query = "SELECT * FROM stories WHERE status = ? ORDER BY created_at DESC"
             params = (status_str,)
-            logging.debug(f"Executing query: {query} with params: {params}")
+            logging.debug(
+                "Executing query: %s with params: %s", SELECT_STORIES_BY_STATUS, params)
 
-            # Debug: show what's in the database
-            cursor = self.conn.execute("SELECT DISTINCT status FROM stories")
-            statuses = [row[0] for row in cursor.fetchall()]
-            logging.debug(f"All status values in database: {statuses}")
+            # Debug: show what's in the database (skip the extra scan unless logged)
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                self._cursor.execute("SELECT DISTINCT status FROM stories")
+                statuses = [row[0] for row in self._cursor.fetchall()]
+                logging.debug("All status values in database: %s", statuses)
 
-            cursor = self.conn.execute(query, params)
-            stories = []
-            for row in cursor.fetchall():
-                row_dict = dict(row)
-                if isinstance(row_dict['created_at'], str):
-                    row_dict['created_at'] = self._parse_datetime(
-                        row_dict['created_at'])
-                stories.append(Story(**row_dict))
+            stories = self._fetch_stories(SELECT_STORIES_BY_STATUS, params)
             logging.debug(
-                f"Found {len(stories)} stories with status {status_str}")
+                "Found %d stories with status %s", len(stories), status_str)
             return stories
         except Exception as e:
-            logging.error(f"Error in get_stories_by_status: {str(e)}")
+            logging.error("Error in get_stories_by_status: %s", e)
             raise
 
+    def _select_by_statuses_query(self, count: int) -> str:
+        """Get the cached IN-clause query for a given number of statuses.
+
+        Keeping the SQL text identical across calls lets sqlite3 reuse its
+        compiled statement instead of re-preparing it.
+
+        Args:
+            count (int): Number of status placeholders
+
+        Returns:
+            str: SQL query with ``count`` placeholders
+        """
+        query = self._stmt_cache.get(count)
+        if query is None:
+            placeholders = ','.join(['?'] * count)
+            query = f"SELECT {STORY_COLUMNS} FROM stories WHERE status IN ({placeholders}) ORDER BY created_at DESC"
+            self._stmt_cache[count] = query
+        return query
+
     def get_stories_by_multiple_statuses(self, statuses: List[StoryStatus]) -> List[Story]:
         """Retrieve all stories with any of the given statuses.
 
@@ -215,37 +443,30 @@ class DatabaseManager:
             # Convert to full enum strings as stored in database
             status_strings = [
                 f"StoryStatus.{status.name}" for status in statuses]
-            placeholders = ','.join(['?' for _ in status_strings])
-            query = f"SELECT * FROM stories WHERE status IN ({placeholders}) ORDER BY created_at DESC"
+            query = self._select_by_statuses_query(len(status_strings))
 
-            logging.info(f"Executing multiple status query: {query}")
-            logging.info(f"Status values being queried: {status_strings}")
+            logging.info("Executing multiple status query: %s", query)
+            logging.info("Status values being queried: %s", status_strings)
 
-            # Debug: show what's in the database before query
-            cursor = self.conn.execute("SELECT id, status FROM stories")
-            all_stories = cursor.fetchall()
-            logging.info(
-                f"All stories in database before query: {[(row[0], row[1]) for row in all_stories]}")
+            # Debug: show what's in the database before query (skip the extra scan unless logged)
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                self._cursor.execute("SELECT id, status FROM stories")
+                all_stories = self._cursor.fetchall()
+                logging.info(
+                    "All stories in database before query: %s", [(row[0], row[1]) for row in all_stories])
 
-            cursor = self.conn.execute(query, status_strings)
-            stories = []
-            for row in cursor.fetchall():
-                row_dict = dict(row)
-                if isinstance(row_dict['created_at'], str):
-                    row_dict['created_at'] = self._parse_datetime(
-                        row_dict['created_at'])
-                stories.append(Story(**row_dict))
+            stories = self._fetch_stories(query, status_strings)
 
             logging.info(
-                f"Found {len(stories)} stories with statuses {status_strings}")
+                "Found %d stories with statuses %s", len(stories), status_strings)
             for story in stories:
                 logging.info(
-                    f"Found story: id={story.id}, status={story.status}")
+                    "Found story: id=%s, status=%s", story.id, story.status)
 
             return stories
         except Exception as e:
             logging.error(
-                f"Error in get_stories_by_multiple_statuses: {str(e)}")
+                "Error in get_stories_by_multiple_statuses: %s", e)
             raise
 
     def get_all_stories(self) -> List[Story]:
@@ -255,45 +476,94 @@ class DatabaseManager:
             List[Story]: List of all stories
         """
         try:
-            query = "SELECT * FROM stories ORDER BY created_at DESC"
-            logging.debug(f"Executing query: {query}")
-            cursor = self.conn.execute(query)
-            stories = []
-            for row in cursor.fetchall():
-                row_dict = dict(row)
-                if isinstance(row_dict['created_at'], str):
-                    row_dict['created_at'] = self._parse_datetime(
-                        row_dict['created_at'])
-                stories.append(Story(**row_dict))
-            logging.debug(f"Found {len(stories)} stories")
+            logging.debug("Executing query: %s", SELECT_ALL_STORIES)
+            stories = self._fetch_stories(SELECT_ALL_STORIES)
+            logging.debug("Found %d stories", len(stories))
             return stories
         except Exception as e:
-            logging.error(f"Error in get_all_stories: {str(e)}")
+            logging.error("Error in get_all_stories: %s", e)
             raise
 
+    def _get_story_paths(self, story_id: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """Fetch only the file paths of a story.
+
+        Avoids materializing the story text when just the paths are needed.
+
+        Args:
+            story_id (str): ID of the story
+
+        Returns:
+            Optional[Tuple]: (audio_path, timestamps_path, subtitles_path), or
+                None if the story does not exist
+        """
+        self.flush()
+        row = self._cursor.execute(SELECT_STORY_PATHS, (story_id,)).fetchone()
+        return tuple(row) if row else None
+
+    def get_stories_awaiting_subtitles(self, story_ids: List[str]) -> List[Dict[str, str]]:
+        """Fetch the fields subtitle generation needs for stories with audio.
+
+        Only stories in AUDIO_GENERATED status with an audio path are
+        returned, and only the columns the subtitle step reads are selected.
+
+        Args:
+            story_ids (List[str]): IDs of the candidate stories
+
+        Returns:
+            List[Dict[str, str]]: Dicts with id, title, audio_path and timestamps_path
+        """
+        if not story_ids:
+            return []
+        self.flush()
+        status = StoryStatus.AUDIO_GENERATED
+        placeholders = ','.join(['?'] * len(story_ids))
+        self._cursor.execute(f"""
+            SELECT id, title, audio_path, timestamps_path FROM stories
+            WHERE id IN ({placeholders})
+            AND status IN (?, ?)
+            AND audio_path IS NOT NULL AND audio_path != ''
+        """, (*story_ids, str(status), status.value))
+        return [dict(row) for row in self._cursor.fetchall()]
+
+    @staticmethod
+    def _with_decoded_audio(paths: Sequence[Optional[str]]) -> List[str]:
+        """Return the set paths of a story, plus the audio's decoded-samples cache.
+
+        Args:
+            paths (Sequence[Optional[str]]): (audio_path, timestamps_path, subtitles_path)
+
+        Returns:
+            List[str]: Files to remove
+        """
+        files = [path for path in paths if path]
+        if paths[0]:
+            files.append(get_decoded_audio_path(paths[0]))
+        return files
+
     def delete_story(self, story_id: str) -> None:
         """Delete a story and its associated files.
 
         Args:
             story_id (str): ID of the story to delete
         """
-        story = self.get_story(story_id)
-        if story:
-            # Delete associated files
-            for path in [story.audio_path, story.timestamps_path, story.subtitles_path]:
-                if path and os.path.exists(path):
-                    try:
-                        os.remove(path)
-                    except OSError as e:
-                        logging.error(f"Failed to delete file {path}: {e}")
-
-            # Delete from database
+        paths = self._get_story_paths(story_id)
+        if paths is not None:
+            # Delete the row and its files in one transaction
             with self.conn:
-                self.conn.execute(
+                self._cursor.execute(
                     "DELETE FROM stories WHERE id = ?", (story_id,))
 
+                for path in self._with_decoded_audio(paths):
+                    try:
+                        Path(path).unlink(missing_ok=True)
+                    except OSError as e:
+                        logging.error("Failed to delete file %s: %s", path, e)
+
     def close(self):
-        """Close the database connection."""
+        """Commit any queued writes and close the database connection."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
         self.conn.close()
 
     def __enter__(self):
@@ -308,20 +578,7 @@ class DatabaseManager:
         Returns:
             List[Story]: List of stories without errors
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM stories 
-            WHERE error IS NULL OR error = ''
-            ORDER BY created_at DESC
-        """)
-        stories = []
-        for row in cursor.fetchall():
-            row_dict = dict(row)
-            # Convert created_at string to datetime
-            if isinstance(row_dict['created_at'], str):
-                row_dict['created_at'] = self._parse_datetime(
-                    row_dict['created_at'])
-            stories.append(Story(**row_dict))
-        return stories
+        return self._fetch_stories(SELECT_STORIES_WITHOUT_ERRORS)
 
     def cleanup_database(self, remove_files: bool = True) -> None:
         """Performs a complete cleanup of the database and optionally removes associated files.
@@ -341,12 +598,16 @@ class DatabaseManager:
                 stories = self.get_all_stories()
 
             # Delete all records
+            self.flush()
             with self.conn:
                 self.conn.execute("DELETE FROM stories")
             logging.info("Cleared all records from database")
 
             # Remove files if requested
             if remove_files:
+                # Story directories are about to be deleted
+                clear_dir_cache()
+
                 for story in stories:
                     self._remove_story_files(story)
 
@@ -360,12 +621,12 @@ class DatabaseManager:
                         shutil.rmtree(dir_path)
                         os.makedirs(dir_path, exist_ok=True)
                         logging.info(
-                            f"Cleaned and recreated directory: {dir_path}")
+                            "Cleaned and recreated directory: %s", dir_path)
 
             logging.info("Database cleanup completed successfully")
 
         except Exception as e:
-            logging.error(f"Error during database cleanup: {str(e)}")
+            logging.error("Error during database cleanup: %s", e)
             raise
 
     def _remove_story_files(self, story: Story) -> None:
@@ -376,24 +637,24 @@ class DatabaseManager:
         """
         try:
             # Remove individual files
-            for file_path in [story.audio_path, story.timestamps_path, story.subtitles_path]:
-                if file_path and os.path.exists(file_path):
-                    os.remove(file_path)
-                    logging.debug(f"Removed file: {file_path}")
+            for file_path in self._with_decoded_audio(
+                    [story.audio_path, story.timestamps_path, story.subtitles_path]):
+                Path(file_path).unlink(missing_ok=True)
+                logging.debug("Removed file: %s", file_path)
 
             # Remove story directory if it exists
             story_dir = os.path.join("demo/stories", story.id)
             if os.path.exists(story_dir):
                 shutil.rmtree(story_dir)
-                logging.debug(f"Removed directory: {story_dir}")
+                logging.debug("Removed directory: %s", story_dir)
 
             # Remove video directory if it exists
             video_dir = os.path.join("demo/videos", story.id)
             if os.path.exists(video_dir):
                 shutil.rmtree(video_dir)
-                logging.debug(f"Removed directory: {video_dir}")
+                logging.debug("Removed directory: %s", video_dir)
 
         except Exception as e:
             logging.warning(
-                f"Error removing files for story {story.id}: {str(e)}")
+                "Error removing files for story %s: %s", story.id, e)
             # Don't raise the error as this is a cleanup operation
@@ -1,11 +1,15 @@
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Union
 from .constants import StoryStatus
 import logging
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Story:
     """Data class representing a story and its processing state."""
     id: str
@@ -23,17 +27,19 @@ class Story:
 
     def __post_init__(self):
         """Convert status string to enum if needed."""
-        if isinstance(self.status, str):
+        # The dataclass is frozen, so fields are set through object.__setattr__
+        if isinstance(self.status, str) and not isinstance(self.status, StoryStatus):
             try:
                 # If it's the full enum string (e.g., 'StoryStatus.NEW')
                 if self.status.startswith('StoryStatus.'):
-                    self.status = getattr(
+                    status = getattr(
                         StoryStatus, self.status.split('.')[-1])
                 else:
                     # If it's just the value (e.g., 'new')
-                    self.status = StoryStatus(self.status)
+                    status = StoryStatus(self.status)
             except (ValueError, AttributeError) as e:
                 # If conversion fails, default to NEW
                 logging.warning(
                     f"Invalid status value '{self.status}', defaulting to NEW: {str(e)}")
-                self.status = StoryStatus.NEW
+                status = StoryStatus.NEW
+            object.__setattr__(self, 'status', status)
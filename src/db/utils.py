@@ -1,5 +1,40 @@
 import os
-from typing import Dict
+from typing import Dict, Set
+
+# Directories already created by this process, so repeat lookups skip makedirs
+_MKDIR_CACHE: Set[str] = set()
+
+
+def ensure_dir(path: str) -> str:
+    """Create a directory once per process.
+
+    Args:
+        path (str): Directory to create
+
+    Returns:
+        str: The same path, for chaining
+    """
+    if path not in _MKDIR_CACHE:
+        os.makedirs(path, exist_ok=True)
+        _MKDIR_CACHE.add(path)
+    return path
+
+
+def clear_dir_cache() -> None:
+    """Forget created directories, e.g. after they were removed from disk."""
+    _MKDIR_CACHE.clear()
+
+
+def get_decoded_audio_path(audio_path: str) -> str:
+    """Get the path of the decoded-samples cache kept beside an audio file.
+
+    Args:
+        audio_path (str): Path to the audio file
+
+    Returns:
+        str: Path to the ``.pcm16k.npy`` cache
+    """
+    return os.path.splitext(audio_path)[0] + ".pcm16k.npy"
 
 
 def get_story_folder_path(story_id: str, base_dir: str = "demo/stories") -> str:
@@ -12,9 +47,7 @@ def get_story_folder_path(story_id: str, base_dir: str = "demo/stories") -> str:
     Returns:
         str: Path to the story folder
     """
-    folder_path = os.path.join(base_dir, story_id)
-    os.makedirs(folder_path, exist_ok=True)
-    return folder_path
+    return ensure_dir(os.path.join(base_dir, story_id))
 
 
 def get_story_file_paths(story_id: str, base_dir: str = "demo/stories") -> Dict[str, str]:
@@ -0,0 +1,160 @@
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Sequence, Tuple
+
+# Sentinel telling the writer thread to exit
+_STOP = object()
+
+WriteOp = Tuple[str, Sequence, bool, Future]
+
+
+class WriterQueue:
+    """Applies database mutations from a single background thread.
+
+    Callers enqueue ``(sql, params)`` and get back a Future that resolves once
+    the statement is committed. The writer thread drains the queue in batches
+    and commits each batch in one ``BEGIN IMMEDIATE`` transaction, so many
+    small updates cost one fsync instead of one each and never contend with
+    each other for SQLite's write lock.
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 100, batch_wait_ms: float = 5):
+        """Start the writer thread.
+
+        Args:
+            db_path (str): Path to SQLite database file
+            batch_size (int): Maximum number of operations committed together
+            batch_wait_ms (float): How long to wait for more operations before committing
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait_ms / 1000
+        self.q: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, sql: str, params: Sequence = (), many: bool = False) -> Future:
+        """Queue a mutation.
+
+        Args:
+            sql (str): SQL statement to execute
+            params (Sequence): Statement parameters, or a sequence of them if ``many``
+            many (bool): Whether to run the statement with executemany
+
+        Returns:
+            Future: Resolves to None once committed, or raises the statement's error
+        """
+        future = Future()
+        self.q.put((sql, params, many, future))
+        return future
+
+    def flush(self) -> None:
+        """Block until every queued mutation has been committed."""
+        self.q.join()
+
+    def close(self) -> None:
+        """Commit outstanding mutations and stop the writer thread."""
+        self.q.put(_STOP)
+        self._thread.join()
+
+    def _collect_batch(self, first: WriteOp) -> Tuple[List[WriteOp], bool]:
+        """Gather queued operations until the batch is full or the wait expires.
+
+        Args:
+            first: Operation that started the batch
+
+        Returns:
+            Tuple[List[WriteOp], bool]: The batch and whether a stop was requested
+        """
+        batch = [first]
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                op = self.q.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if op is _STOP:
+                self.q.task_done()
+                return batch, True
+            batch.append(op)
+        return batch, False
+
+    @staticmethod
+    def _execute(conn: sqlite3.Connection, op: WriteOp) -> None:
+        """Run a single queued operation on the writer connection."""
+        sql, params, many, _ = op
+        if many:
+            conn.executemany(sql, params)
+        else:
+            conn.execute(sql, params)
+
+    @staticmethod
+    def _rollback(conn: sqlite3.Connection) -> None:
+        """Roll back an open transaction, ignoring a connection that can't."""
+        try:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+        except sqlite3.Error as e:
+            logging.error("Rollback failed: %s", e)
+
+    def _commit_batch(self, conn: sqlite3.Connection, batch: List[WriteOp]) -> None:
+        """Commit a batch in one transaction, isolating failures per operation.
+
+        Args:
+            conn: The writer thread's connection
+            batch: Operations to apply
+        """
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op in batch:
+                self._execute(conn, op)
+            conn.execute("COMMIT")
+            for op in batch:
+                op[3].set_result(None)
+            return
+        except Exception as e:
+            self._rollback(conn)
+            logging.debug("Batch of %d writes failed, retrying individually: %s",
+                          len(batch), e)
+
+        # Replay one by one so only the failing statements report errors
+        for op in batch:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                self._execute(conn, op)
+                conn.execute("COMMIT")
+                op[3].set_result(None)
+            except Exception as e:
+                # Any error, not just sqlite3.Error (e.g. unbindable params),
+                # goes to the caller; the writer thread must keep running
+                self._rollback(conn)
+                logging.error("Database write failed: %s", e)
+                op[3].set_exception(e)
+
+    def _run(self) -> None:
+        """Writer thread main loop."""
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            stopping = False
+            while not stopping:
+                op = self.q.get()
+                if op is _STOP:
+                    self.q.task_done()
+                    break
+                batch, stopping = self._collect_batch(op)
+                try:
+                    self._commit_batch(conn, batch)
+                finally:
+                    for _ in batch:
+                        self.q.task_done()
+        finally:
+            conn.close()
@@ -27,7 +27,7 @@ class ConfigService:
             'story_pipeline': {
                 'base_dir': 'demo/stories',
                 'db_path': 'demo/story_pipeline.db',
-                'whisper_model': 'base'
+                'whisper_model': 'distil-small.en'
             },
             'video_pipeline': {
                 'output_dir': 'demo/videos',
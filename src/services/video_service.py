@@ -80,10 +80,8 @@ class VideoService:
             )
 
             # Update story status to ready and save output path
-            self.db_manager.update_story_status(
-                story_id, StoryStatus.VIDEO_READY)
-            self.db_manager.update_story_paths(
-                story_id, subtitles_path=output_path)
+            self.db_manager.update_story_paths_and_status(
+                story_id, StoryStatus.VIDEO_READY, subtitles_path=output_path)
 
         except Exception as e:
             # Update story status to error if something goes wrong
@@ -1,85 +1,248 @@
-import json
+import asyncio
+import contextlib
 import csv
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import WebDriverException
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# Characters stripped from post bodies, replaced in a single translate pass
+_TEXT_TRANSLATION = str.maketrans({'\n': ' ', '\\': ' '})
 
-def setup_webdriver(headless: bool = True) -> webdriver.Chrome:
-    """Set up the WebDriver with optional headless mode and user-agent spoofing.
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+
+# Rate limiting and transient server errors, retried by both crawlers
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Longest exponential backoff between retries, as urllib3's Retry caps it
+BACKOFF_MAX = 120
+
+
+@lru_cache(maxsize=None)
+def get_session(retries: int = 10) -> requests.Session:
+    """Get a shared HTTP session with user-agent spoofing and retries.
+
+    Sessions are cached per retry count so repeated crawls reuse the same
+    connection pool instead of reconnecting to Reddit each time.
+
+    Args:
+        retries (int): Number of times to retry failed requests
+
+    Returns:
+        requests.Session: The configured session
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET'])
+    )
+    session.mount('https://', HTTPAdapter(max_retries=retry))
+    return session
+
+
+def _extract_posts(list_of_posts: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Extract post metadata from the children of a Reddit listing.
 
     Args:
-        headless (bool): Whether to run Chrome in headless mode
+        list_of_posts (List[Dict[str, Any]]): The listing's ``children`` entries
 
     Returns:
-        webdriver.Chrome: The configured WebDriver instance
+        Dict[str, Dict[str, Any]]: Dictionary of posts keyed by Reddit post ID
     """
-    chrome_options = Options()
-    if headless:
-        chrome_options.add_argument("--headless")
-    chrome_options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    return webdriver.Chrome(options=chrome_options)
+    # Key by Reddit's post ID so posts sharing a title don't overwrite each other
+    return {
+        post['data']['id']: {
+            'title': post['data']['title'],
+            'author': post['data']['author'],
+            'permalink': post['data']['permalink'],
+            'upvote_ratio': post['data']['upvote_ratio'],
+            "text": post['data']['selftext']
+        }
+        for post in list_of_posts
+    }
 
 
-def get_posts(feed: str, limit: int = 10, single: bool = False) -> Dict[str, Dict[str, Any]]:
+def get_posts(feed: str, limit: int = 10, single: bool = False, timeout: float = 10) -> Dict[str, Dict[str, Any]]:
     """Crawl Reddit posts from a specified feed.
 
     Args:
         feed (str): The subreddit feed to crawl
-        limit (int): Maximum number of posts to retrieve
+        limit (int): Maximum number of retries for the request
         single (bool): If True, only return the first post
+        timeout (float): Request timeout in seconds
 
     Returns:
-        Dict[str, Dict[str, Any]]: Dictionary of posts with their metadata
+        Dict[str, Dict[str, Any]]: Dictionary of posts keyed by Reddit post ID
     """
-    tries = 0
-    success = False
-    posts = {}  # Initialize posts dictionary outside try block
+    posts = {}
+
+    try:
+        url = f"https://www.reddit.com/r/{feed}.json"
+        response = get_session(limit).get(url, timeout=timeout)
+        response.raise_for_status()
+        list_of_posts = response.json()['data']['children']
+
+        # If single is True, only process the first post
+        if single and list_of_posts:
+            list_of_posts = [list_of_posts[0]]
+
+        posts = _extract_posts(list_of_posts)
+    except (requests.RequestException, ValueError, KeyError) as e:
+        print(f"An error occurred: {e}")
+
+    return posts
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): The header value, if the response had one
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+async def fetch_feed(
+    session: aiohttp.ClientSession,
+    feed: str,
+    after: Optional[str] = None,
+    timeout: float = 10,
+    retries: int = 10,
+    backoff_factor: float = 0.5,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> Dict[str, Any]:
+    """Fetch one page of a subreddit listing.
+
+    Rate limiting, transient server errors and connection failures are
+    retried like the ``Retry`` policy of :func:`get_session`: a server's
+    ``Retry-After`` is honoured, otherwise the delay doubles after each
+    attempt up to ``BACKOFF_MAX`` seconds.
 
-    while tries <= limit and not success:
-        driver = setup_webdriver()
+    Args:
+        session (aiohttp.ClientSession): Session to issue the request on
+        feed (str): The subreddit feed to crawl
+        after (Optional[str]): Pagination cursor from the previous page
+        timeout (float): Request timeout in seconds
+        retries (int): Number of times to retry a failed request
+        backoff_factor (float): Base delay in seconds, doubled after each retry
+        semaphore (Optional[asyncio.Semaphore]): Limits in-flight requests; it
+            is held for each attempt and released while backing off
+
+    Returns:
+        Dict[str, Any]: The parsed listing JSON
+    """
+    url = f"https://www.reddit.com/r/{feed}.json"
+    params = {'after': after} if after else None
+    for attempt in range(retries + 1):
+        last_attempt = attempt == retries
+        delay = None
         try:
-            url = f"https://www.reddit.com/r/{feed}.json"
-            driver.set_page_load_timeout(10)
-            driver.get(url)
-            json_data = driver.find_element(By.TAG_NAME, 'pre').text
-            response = json.loads(json_data)
-
-            if response:
-                success = True
-                list_of_posts = response['data']['children']
-
-                # If single is True, only process the first post
-                if single and list_of_posts:
-                    list_of_posts = [list_of_posts[0]]
-
-                for post in list_of_posts:
-                    data = post['data']
-                    title = data['title']
-                    author = data['author']
-                    permalink = data['permalink']
-                    upvote_ratio = data['upvote_ratio']
-                    text = data['selftext']
-                    posts[title] = {
-                        'title': title,
-                        'author': author,
-                        'permalink': permalink,
-                        'upvote_ratio': upvote_ratio,
-                        "text": text
-                    }
-        except (WebDriverException, json.JSONDecodeError, KeyError) as e:
-            print(f"An error occurred: {e}")
-        finally:
-            driver.quit()
-        tries += 1
+            async with semaphore or contextlib.nullcontext():
+                async with session.get(url, params=params,
+                                       timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    if response.status not in RETRY_STATUSES or last_attempt:
+                        response.raise_for_status()
+                        return await response.json()
+                    delay = _retry_after(response.headers.get('Retry-After'))
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+        if delay is None:
+            delay = min(backoff_factor * 2 ** attempt, BACKOFF_MAX)
+        await asyncio.sleep(delay)
+
+
+async def _crawl_feed(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    feed: str,
+    pages: int
+) -> Dict[str, Dict[str, Any]]:
+    """Crawl consecutive pages of a single feed.
 
+    Pages of one feed depend on the previous page's ``after`` cursor, so they
+    are fetched in order; different feeds run concurrently.
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        semaphore (asyncio.Semaphore): Limits the number of in-flight requests
+        feed (str): The subreddit feed to crawl
+        pages (int): Number of listing pages to fetch
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Dictionary of posts keyed by Reddit post ID
+    """
+    posts = {}
+    after = None
+    try:
+        for _ in range(pages):
+            response = await fetch_feed(session, feed, after, semaphore=semaphore)
+            posts.update(_extract_posts(response['data']['children']))
+            after = response['data'].get('after')
+            if not after:
+                break
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError) as e:
+        print(f"An error occurred while crawling r/{feed}: {e}")
     return posts
 
 
+async def crawl(feeds: List[str], pages: int = 1, concurrency: int = 8) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Crawl several subreddit feeds concurrently.
+
+    Args:
+        feeds (List[str]): The subreddit feeds to crawl
+        pages (int): Number of listing pages to fetch per feed
+        concurrency (int): Maximum number of in-flight requests
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, Any]]]: Posts for each feed, keyed by feed name
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency * 2)
+    async with aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT}) as session:
+        results = await asyncio.gather(
+            *(_crawl_feed(session, semaphore, feed, pages) for feed in feeds))
+    return dict(zip(feeds, results))
+
+
+def crawl_feeds(feeds: List[str], pages: int = 1, concurrency: int = 8) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Synchronous wrapper around :func:`crawl`.
+
+    Args:
+        feeds (List[str]): The subreddit feeds to crawl
+        pages (int): Number of listing pages to fetch per feed
+        concurrency (int): Maximum number of in-flight requests
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, Any]]]: Posts for each feed, keyed by feed name
+    """
+    return asyncio.run(crawl(feeds, pages, concurrency))
+
+
 def parse_text(text: str) -> str:
     """Parse text to remove unwanted characters and whitespace.
 
@@ -89,9 +252,7 @@ def parse_text(text: str) -> str:
     Returns:
         str: The parsed text
     """
-    text = text.replace('\n', ' ')
-    text = text.replace('\\', ' ')
-    return text
+    return text.translate(_TEXT_TRANSLATION)
 
 
 def write_to_csv(posts: Dict[str, Dict[str, Any]], filename: str) -> None:
@@ -101,18 +262,15 @@ def write_to_csv(posts: Dict[str, Dict[str, Any]], filename: str) -> None:
         posts (Dict[str, Dict[str, Any]]): A dictionary of posts with their metadata
         filename (str): The name of the file to write to
     """
-    with open(filename, 'w', newline='', encoding='utf-8') as file:
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as file:
         writer = csv.writer(file)
         writer.writerow(
             ['Title', 'Author', 'Permalink', 'Upvote Ratio', 'Text'])
-        for post in posts.values():
-            writer.writerow([
-                post['title'],
-                post['author'],
-                post['permalink'],
-                post['upvote_ratio'],
-                post['text']
-            ])
+        writer.writerows(
+            (post['title'], post['author'], post['permalink'],
+             post['upvote_ratio'], post['text'])
+            for post in posts.values()
+        )
 
 
 def main() -> None:
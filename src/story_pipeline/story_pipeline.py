@@ -1,14 +1,15 @@
 import os
 import logging
 import uuid
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from .reddit_crawl import get_posts, parse_text
 from .elevenlabs_api import process_csv
-from .whisper_api import transcribe_audio, load_whisper_model
-from ..db import DatabaseManager, Story, get_story_file_paths
+from .whisper_api import DEFAULT_WHISPER_MODEL, WHISPER_WORKERS, transcribe_audio, load_whisper_model
+from ..db import DatabaseManager, Story, get_story_file_paths, ensure_dir
 from ..load_env import load_env
 from ..db import StoryStatus
 
@@ -16,6 +17,14 @@ logging.basicConfig(level=logging.INFO,
                     format='%(filename)s - %(lineno)d - %(asctime)s - %(levelname)s - %(message)s')
 
 
+def _file_size(path: str) -> int:
+    """Return a file's size in bytes, or 0 if it cannot be read."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
 class InputValidator:
     """Validates input parameters and configurations for the story pipeline processing."""
 
@@ -28,7 +37,7 @@ class InputValidator:
         """
         for dir_name, dir_path in output_dirs.items():
             if not os.path.exists(dir_path):
-                logging.info(f"Creating {dir_name} directory: {dir_path}")
+                logging.info("Creating %s directory: %s", dir_name, dir_path)
                 os.makedirs(dir_path, exist_ok=True)
             elif not os.path.isdir(dir_path):
                 raise ValueError(
@@ -68,113 +77,167 @@ class RedditStoryProcessor(StoryProcessor):
         Returns:
             List[str]: List of story IDs that were processed
         """
-        logging.info(f"Crawling stories from r/{self.subreddit}")
+        logging.info("Crawling stories from r/%s", self.subreddit)
         posts = get_posts(self.subreddit, single=self.single_story)
-        story_ids = []
-
-        for title, post_data in posts.items():
-            story_id = str(uuid.uuid4())
-            story = Story(
-                id=story_id,
-                title=title,
+        stories = []
+        # Stories from one crawl share a single creation timestamp
+        now = datetime.now()
+
+        for post_data in posts.values():
+            stories.append(Story(
+                id=str(uuid.uuid4()),
+                title=post_data['title'],
                 author=post_data['author'],
                 subreddit=self.subreddit,
                 url=post_data['permalink'],
                 text=parse_text(post_data['text']),
-                created_at=datetime.now(),
+                created_at=now,
                 status=StoryStatus.NEW
-            )
-            self.db_manager.add_story(story)
-            story_ids.append(story_id)
+            ))
+
+        # Insert all crawled stories in one transaction; wait for the commit
+        # so a failed insert raises instead of passing on unsaved IDs
+        self.db_manager.add_stories(stories).result()
+        story_ids = [story.id for story in stories]
 
         if self.single_story:
             logging.info("Saved first story to database")
         else:
-            logging.info(f"Saved {len(story_ids)} stories to database")
+            logging.info("Saved %d stories to database", len(story_ids))
         return story_ids
 
 
 class TextToSpeechProcessor(StoryProcessor):
     """Handles text-to-speech conversion using ElevenLabs API."""
 
-    def __init__(self, db_manager: DatabaseManager, base_dir: str = "demo/stories"):
+    def __init__(self, db_manager: DatabaseManager, base_dir: str = "demo/stories", max_workers: int = 8):
         self.db_manager = db_manager
         self.base_dir = base_dir
+        self.max_workers = max_workers
         self.api_key = load_env("eleven-labs")[0]
         self.voice_id = "YFpUSo240svj7tcmDapZ"
 
+    def _synthesize(self, story: Story) -> Optional[Tuple[str, str]]:
+        """Generates audio and alignment timestamps for a single story.
+
+        Runs in a worker thread, so it only touches the filesystem and the
+        ElevenLabs API; database updates are left to the calling thread.
+
+        Args:
+            story (Story): Story to convert
+
+        Returns:
+            Optional[Tuple[str, str]]: Audio and timestamps paths, or None if
+                no alignment data was received
+        """
+        # Get paths for this story
+        story_dir = ensure_dir(os.path.join(self.base_dir, story.id))
+
+        audio_path = os.path.join(story_dir, "audio.mp3")
+
+        # Process TTS
+        from .elevenlabs_api import _make_headers, _make_payload, _handle_timestamps_mode
+        headers = _make_headers(self.api_key)
+        payload = _make_payload(story.text)
+
+        json_id = _handle_timestamps_mode(
+            self.voice_id,
+            headers,
+            payload,
+            audio_path,
+            story_dir  # Pass the story directory
+        )
+
+        if not json_id:
+            return None
+
+        # Rename the JSON file to a consistent name
+        json_path = os.path.normpath(
+            os.path.join(story_dir, "timestamps.json"))
+        temp_json_path = os.path.join(story_dir, f"{json_id}.json")
+        if os.path.exists(temp_json_path):
+            os.rename(temp_json_path, json_path)
+
+        return os.path.normpath(audio_path), json_path
+
     def process(self, story_ids: List[str]) -> None:
         """Converts text to speech using ElevenLabs API.
 
+        API calls are I/O bound, so stories are synthesized concurrently in a
+        thread pool while status updates stay on this thread's connection.
+
         Args:
             story_ids (List[str]): List of story IDs to process
         """
         logging.info("Starting text-to-speech conversion")
 
-        for story_id in story_ids:
-            story = self.db_manager.get_story(story_id)
-            if not story:
-                continue
-
-            try:
-                # Get paths for this story
-                story_dir = os.path.join(self.base_dir, story_id)
-                os.makedirs(story_dir, exist_ok=True)
+        stories = [story for story in map(self.db_manager.get_story, story_ids) if story]
 
-                audio_path = os.path.join(story_dir, "audio.mp3")
+        updates = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._synthesize, story): story.id
+                       for story in stories}
 
-                # Process TTS
-                from .elevenlabs_api import _make_headers, _make_payload, _handle_timestamps_mode
-                headers = _make_headers(self.api_key)
-                payload = _make_payload(story.text)
-
-                json_id = _handle_timestamps_mode(
-                    self.voice_id,
-                    headers,
-                    payload,
-                    audio_path,
-                    story_dir  # Pass the story directory
-                )
+            for future in as_completed(futures):
+                story_id = futures[future]
+                try:
+                    paths = future.result()
+                except Exception as e:
+                    updates.append(self.db_manager.update_story_status(
+                        story_id,
+                        StoryStatus.ERROR,
+                        f'TTS generation failed: {str(e)}'
+                    ))
+                    continue
 
-                if json_id:
+                if paths:
+                    audio_path, json_path = paths
                     # Update database with new paths, including the actual JSON file path
-                    json_path = os.path.normpath(
-                        os.path.join(story_dir, "timestamps.json"))
-                    audio_path = os.path.normpath(audio_path)
-
-                    # Rename the JSON file to a consistent name
-                    temp_json_path = os.path.join(story_dir, f"{json_id}.json")
-                    if os.path.exists(temp_json_path):
-                        os.rename(temp_json_path, json_path)
-
-                    self.db_manager.update_story_paths(
+                    updates.append(self.db_manager.update_story_paths_and_status(
                         story_id,
+                        StoryStatus.AUDIO_GENERATED,
                         audio_path=audio_path,
                         timestamps_path=json_path  # Use the consistent JSON file path
-                    )
-                    self.db_manager.update_story_status(
-                        story_id, StoryStatus.AUDIO_GENERATED)
+                    ))
                 else:
-                    self.db_manager.update_story_status(
+                    updates.append(self.db_manager.update_story_status(
                         story_id,
                         StoryStatus.ERROR,
                         'Failed to generate audio timestamps'
-                    )
-            except Exception as e:
-                self.db_manager.update_story_status(
-                    story_id,
-                    StoryStatus.ERROR,
-                    f'TTS generation failed: {str(e)}'
-                )
+                    ))
+
+        # Queued updates commit in batches; surface any that failed
+        for update in updates:
+            update.result()
 
 
 class SubtitleGenerator(StoryProcessor):
     """Handles subtitle generation using Whisper API."""
 
-    def __init__(self, db_manager: DatabaseManager, model_name: str = "base"):
+    def __init__(self, db_manager: DatabaseManager, model_name: str = DEFAULT_WHISPER_MODEL,
+                 max_workers: int = WHISPER_WORKERS):
         self.db_manager = db_manager
         self.model_name = model_name
-        self.model = None
+        # The shared model transcribes WHISPER_WORKERS stories at once; extra
+        # threads only queue, so the default matches it
+        self.max_workers = max_workers
+
+    def _transcribe(self, story: Dict[str, str]) -> None:
+        """Runs Whisper on a single story's audio from a worker thread.
+
+        Args:
+            story (Dict[str, str]): Story fields from get_stories_awaiting_subtitles
+        """
+        logging.info("Generating subtitles for story: %s", story['title'])
+        # Get the directory from the timestamps path
+        json_dir = os.path.dirname(story['timestamps_path'])
+
+        # Generate subtitles
+        transcribe_audio(
+            audio_path=story['audio_path'],
+            model=load_whisper_model(self.model_name),
+            json_folder=json_dir
+        )
 
     def process(self, story_ids: List[str]) -> None:
         """Generates subtitles for stories.
@@ -184,43 +247,44 @@ class SubtitleGenerator(StoryProcessor):
         """
         logging.info("Starting subtitle generation")
 
-        # Load Whisper model once for all files
-        if not self.model:
-            self.model = load_whisper_model(self.model_name)
-
-        for story_id in story_ids:
-            story = self.db_manager.get_story(story_id)
-            if not story or not story.audio_path or story.status != StoryStatus.AUDIO_GENERATED:
-                continue
-
-            logging.info(f"Generating subtitles for story: {story.title}")
-            try:
-                # Get the directory from the timestamps path
-                json_dir = os.path.dirname(story.timestamps_path)
-
-                # Generate subtitles
-                transcribe_audio(
-                    audio_path=story.audio_path,
-                    model=self.model,
-                    json_folder=json_dir
-                )
-
-                # Verify the file exists before updating status
-                if os.path.exists(story.timestamps_path):
-                    self.db_manager.update_story_status(
-                        story_id, StoryStatus.READY)
-                else:
-                    self.db_manager.update_story_status(
-                        story_id,
+        # Load Whisper model once for all files; workers share the cached instance
+        load_whisper_model(self.model_name)
+
+        stories = self.db_manager.get_stories_awaiting_subtitles(story_ids)
+        # Start the longest recordings first so similar lengths run together
+        # and a long story doesn't trail at the end
+        stories.sort(key=lambda s: _file_size(s['audio_path']), reverse=True)
+
+        updates = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._transcribe, story): story
+                       for story in stories}
+
+            for future in as_completed(futures):
+                story = futures[future]
+                try:
+                    future.result()
+
+                    # Verify the file exists before updating status
+                    if os.path.exists(story['timestamps_path']):
+                        updates.append(self.db_manager.update_story_status(
+                            story['id'], StoryStatus.READY))
+                    else:
+                        updates.append(self.db_manager.update_story_status(
+                            story['id'],
+                            StoryStatus.ERROR,
+                            'Subtitle file was not generated'
+                        ))
+                except Exception as e:
+                    updates.append(self.db_manager.update_story_status(
+                        story['id'],
                         StoryStatus.ERROR,
-                        'Subtitle file was not generated'
-                    )
-            except Exception as e:
-                self.db_manager.update_story_status(
-                    story_id,
-                    StoryStatus.ERROR,
-                    f'Subtitle generation failed: {str(e)}'
-                )
+                        f'Subtitle generation failed: {str(e)}'
+                    ))
+
+        # Queued updates commit in batches; surface any that failed
+        for update in updates:
+            update.result()
 
 
 class StoryPipeline:
@@ -236,13 +300,17 @@ class StoryPipeline:
                 - db_path: Path to SQLite database
                 - whisper_model: Name of Whisper model to use
                 - single_story: Whether to process only one story
+                - tts_workers: Concurrent ElevenLabs requests (default 8)
+                - subtitle_workers: Concurrent Whisper transcriptions (default WHISPER_WORKERS)
+                - background_writes: Queue DB updates to a writer thread (default True)
         """
         self.config = config
         self.validate_config()
 
         # Initialize database manager
         self.db_manager = DatabaseManager(
-            config.get('db_path', 'demo/story_pipeline.db'))
+            config.get('db_path', 'demo/story_pipeline.db'),
+            background_writes=config.get('background_writes', True))
 
         # Create processors
         self.reddit_processor = RedditStoryProcessor(
@@ -253,12 +321,14 @@ class StoryPipeline:
 
         self.tts_processor = TextToSpeechProcessor(
             self.db_manager,
-            config.get('base_dir', 'demo/stories')
+            config.get('base_dir', 'demo/stories'),
+            config.get('tts_workers', 8)
         )
 
         self.subtitle_generator = SubtitleGenerator(
             self.db_manager,
-            config.get('whisper_model', 'base')
+            config.get('whisper_model', DEFAULT_WHISPER_MODEL),
+            config.get('subtitle_workers', WHISPER_WORKERS)
         )
 
     def validate_config(self) -> None:
@@ -284,10 +354,20 @@ class StoryPipeline:
             logging.info("Story pipeline completed successfully")
 
         except Exception as e:
-            logging.error(f"Pipeline failed: {str(e)}")
+            logging.error("Pipeline failed: %s", e)
             raise
         finally:
-            self.db_manager.close()
+            self.close()
+
+    def close(self) -> None:
+        """Commit any queued database writes and close the database."""
+        self.db_manager.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 def main():
@@ -297,7 +377,7 @@ def main():
         'subreddit': 'tifu',
         'base_dir': 'demo/stories',
         'db_path': 'demo/story_pipeline.db',
-        'whisper_model': 'base',
+        'whisper_model': DEFAULT_WHISPER_MODEL,
         'single_story': False
     }
 
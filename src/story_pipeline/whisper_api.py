@@ -1,14 +1,34 @@
-import json
-import whisper
 import logging
 import os
+from functools import lru_cache
 from typing import Dict, Optional, Union, Any
 from pathlib import Path
 
+import ctranslate2
+import numpy as np
+import orjson
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+
+from ..db.utils import get_decoded_audio_path
+
+__all__ = ["DEFAULT_WHISPER_MODEL", "WHISPER_WORKERS", "load_whisper_model", "transcribe_audio"]
+
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s',
                     datefmt='%Y-%m-%d %H:%M:%S')
 
+# Narration is clean single-speaker English TTS, which the distilled English
+# model transcribes as well as "base" at a fraction of the cost. Use "base" or
+# "small" for noisier audio.
+DEFAULT_WHISPER_MODEL = "distil-small.en"
+
+# Transcriptions one loaded model runs at once. Every caller shares the model,
+# so this is set here rather than per caller; more threads queue behind them.
+WHISPER_WORKERS = 2
+
+# TTS narration has short natural pauses; only cut silences longer than this
+DEFAULT_VAD_PARAMETERS = {'min_silence_duration_ms': 500, 'speech_pad_ms': 200}
+
 
 def _get_json_path(audio_path: str, json_folder: str = "demo/json") -> str:
     """Generate JSON output path based on audio file name.
@@ -30,25 +50,130 @@ def _get_json_path(audio_path: str, json_folder: str = "demo/json") -> str:
     return os.path.join(json_folder, f"{base_name}.json")
 
 
-def load_whisper_model(model_name: str = "base") -> whisper.Whisper:
-    """Load the Whisper model.
+def _get_or_decode_audio(audio_path: Union[str, Path]) -> np.ndarray:
+    """Decode audio to 16 kHz mono samples, caching them beside the file.
+
+    Re-transcribing the same audio then skips the mp3 decode and resample.
+    The cache is rebuilt when the audio is newer than it. At about 64 KB per
+    second of audio it is several times the mp3's size, so it only pays off
+    for audio that is transcribed repeatedly.
+
+    Args:
+        audio_path: Path to the audio file
+
+    Returns:
+        np.ndarray: float32 samples at 16 kHz
+    """
+    cache_path = get_decoded_audio_path(str(audio_path))
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(audio_path):
+            return np.load(cache_path)
+    except (OSError, ValueError):
+        pass
+
+    samples = decode_audio(str(audio_path), sampling_rate=16000)
+    try:
+        np.save(cache_path, samples)
+    except OSError as e:
+        logging.warning("Could not cache decoded audio %s: %s", cache_path, e)
+    return samples
+
+
+def _warm_up(model: WhisperModel) -> None:
+    """Decode one second of silence so the first real transcription doesn't
+    pay for kernel selection and buffer allocation.
+
+    Args:
+        model: Freshly loaded Whisper model
+    """
+    segments, _ = model.transcribe(
+        np.zeros(16000, dtype=np.float32), language="en", beam_size=1)
+    for _ in segments:
+        pass
+
+
+def _default_device() -> str:
+    """Return "cuda" when CTranslate2 can see a GPU, else "cpu"."""
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+
+def _default_compute_type(device: str, quantize: bool) -> str:
+    """Pick the fastest compute type for a device.
+
+    Args:
+        device (str): "cuda" or "cpu"
+        quantize (bool): Whether to use int8 weights
+
+    Returns:
+        str: CTranslate2 compute type
+    """
+    if device == "cuda":
+        return "int8_float16" if quantize else "float16"
+    return "int8" if quantize else "float32"
+
+
+@lru_cache(maxsize=4)
+def _load(model_name: str, device: str, compute_type: str) -> WhisperModel:
+    """Load and warm up a Whisper model; cached so each is built once per process.
 
     Args:
-        model_name (str): Name of the Whisper model to load. Defaults to "base".
-                         Options: ["tiny", "base", "small", "medium", "large"]
+        model_name (str): Name of the Whisper model to load
+        device (str): "cuda" or "cpu"
+        compute_type (str): CTranslate2 compute type
 
     Returns:
-        whisper.Whisper: Loaded Whisper model
+        WhisperModel: Loaded Whisper model
+    """
+    logging.info("Loading Whisper model: %s (%s, %s)", model_name, device, compute_type)
+    # Half the cores in total, shared between the concurrent workers
+    cpu_threads = max(1, (os.cpu_count() or 2) // 2 // WHISPER_WORKERS)
+    model = WhisperModel(model_name, device=device,
+                         compute_type=compute_type,
+                         cpu_threads=cpu_threads,
+                         num_workers=WHISPER_WORKERS)
+    _warm_up(model)
+    logging.info("Successfully loaded Whisper model")
+    return model
+
+
+def load_whisper_model(
+    model_name: str = DEFAULT_WHISPER_MODEL,
+    quantize: bool = True,
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None
+) -> WhisperModel:
+    """Load the Whisper model on the CTranslate2 backend.
+
+    Every caller shares one instance per model; the first call loads and
+    warms it up, later calls return the cached model.
+
+    Runs on the GPU whenever one is visible, with float16 activations. With
+    ``quantize`` the weights are int8, which roughly halves the memory
+    traffic of the matmul-bound decoder. CPU inference is limited to half the
+    cores so intra-op threads don't oversubscribe with the pipeline's workers.
+
+    CTranslate2 runs at most ``WHISPER_WORKERS`` transcriptions at once;
+    calls from more threads than that queue up behind them.
+
+    Args:
+        model_name (str): Name of the Whisper model to load. Defaults to "distil-small.en".
+                         Options: ["tiny", "base", "small", "medium", "large",
+                         "distil-small.en", "distil-large-v3"]
+        quantize (bool): Whether to use int8 weights. Defaults to True.
+        device (Optional[str]): "cuda" or "cpu". Defaults to the GPU if present.
+        compute_type (Optional[str]): CTranslate2 compute type, e.g.
+            "int8_float16". Overrides ``quantize`` when given.
+
+    Returns:
+        WhisperModel: Loaded Whisper model
 
     Raises:
-        ValueError: If model_name is not valid
         RuntimeError: If model loading fails
     """
     try:
-        logging.info("Loading Whisper model: %s", model_name)
-        model = whisper.load_model(model_name, device="cpu")
-        logging.info("Successfully loaded Whisper model")
-        return model
+        device = device or _default_device()
+        compute_type = compute_type or _default_compute_type(device, quantize)
+        return _load(model_name, device, compute_type)
     except Exception as e:
         logging.error("Failed to load Whisper model: %s", str(e))
         raise RuntimeError(f"Failed to load Whisper model: {str(e)}")
@@ -56,8 +181,8 @@ def load_whisper_model(model_name: str = "base") -> whisper.Whisper:
 
 def transcribe_audio(
     audio_path: Union[str, Path],
-    model: str = "base",
-    verbose: bool = False,
+    model: Optional[Union[str, WhisperModel]] = None,
+    json_folder: str = "demo/json",
     temperature: float = 0,
     compression_ratio_threshold: float = 2.4,
     logprob_threshold: float = -1.0,
@@ -67,14 +192,18 @@ def transcribe_audio(
     word_timestamps: bool = False,
     prepend_punctuations: str = "'\"({[",
     append_punctuations: str = "'\",.!?:)}]",
-    fp16: bool = True
+    beam_size: int = 1,
+    vad_filter: bool = True,
+    vad_parameters: Optional[Dict[str, Any]] = None,
+    batch_size: int = 8,
+    cache_audio: bool = False
 ) -> Dict[str, Any]:
-    """Transcribe audio using Whisper API.
+    """Transcribe audio using Whisper.
 
     Args:
         audio_path: Path to the audio file
-        model: Whisper model to use
-        verbose: Whether to print debug information
+        model: Loaded Whisper model, or the name of one to load
+        json_folder: Folder to save the transcription JSON in
         temperature: Temperature for sampling
         compression_ratio_threshold: Compression ratio threshold
         logprob_threshold: Log probability threshold
@@ -84,10 +213,19 @@ def transcribe_audio(
         word_timestamps: Whether to include word timestamps
         prepend_punctuations: Punctuations to prepend
         append_punctuations: Punctuations to append
-        fp16: Whether to use FP16
+        beam_size: Beam width; 1 decodes greedily
+        vad_filter: Whether to drop non-speech audio with Silero VAD before
+            decoding; segment times stay on the original timeline
+        vad_parameters: Silero VAD options, e.g. ``min_silence_duration_ms``.
+            Defaults to trimming pauses longer than 500 ms
+        batch_size: Number of ~30s chunks encoded and decoded together;
+            1 transcribes sequentially, as does turning off ``vad_filter``
+        cache_audio: Whether to cache decoded samples beside the file and
+            reuse them; only worth it when the same audio is transcribed again
 
     Returns:
-        Dict[str, Any]: Transcription result containing text and metadata
+        Dict[str, Any]: Transcription result with ``text`` and ``segments``
+        in openai-whisper's layout
     """
     try:
         if not os.path.exists(audio_path):
@@ -96,21 +234,63 @@ def transcribe_audio(
         logging.info("Starting transcription of: %s", audio_path)
 
         # Load model if not provided
-        if model is None:
-            model = load_whisper_model(model_name)
-
-        # Perform transcription
-        result = model.transcribe(
-            audio_path,
-            verbose=verbose,
-            fp16=fp16
+        if model is None or isinstance(model, str):
+            model = load_whisper_model(model or DEFAULT_WHISPER_MODEL)
+
+        # Split the audio into chunks and run them through the model as one batch.
+        # The batched pipeline takes its chunks from the VAD speech regions and
+        # can't split audio past 30s without them, so it needs vad_filter.
+        options = {}
+        if batch_size > 1 and vad_filter:
+            model = BatchedInferencePipeline(model=model)
+            options['batch_size'] = batch_size
+
+        # Perform transcription; segments are decoded lazily as we iterate
+        audio = _get_or_decode_audio(audio_path) if cache_audio else str(audio_path)
+        segments, info = model.transcribe(
+            audio,
+            beam_size=beam_size,
+            temperature=temperature,
+            compression_ratio_threshold=compression_ratio_threshold,
+            log_prob_threshold=logprob_threshold,
+            no_speech_threshold=no_speech_threshold,
+            condition_on_previous_text=condition_on_previous_text,
+            initial_prompt=initial_prompt,
+            word_timestamps=word_timestamps,
+            prepend_punctuations=prepend_punctuations,
+            append_punctuations=append_punctuations,
+            vad_filter=vad_filter,
+            vad_parameters=vad_parameters or DEFAULT_VAD_PARAMETERS,
+            without_timestamps=False,
+            **options
         )
 
+        result = {
+            'text': '',
+            'segments': [],
+            'language': info.language
+        }
+        for segment in segments:
+            entry = {
+                'id': segment.id,
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text
+            }
+            if segment.words is not None:
+                entry['words'] = [
+                    {'word': w.word, 'start': w.start,
+                     'end': w.end, 'probability': w.probability}
+                    for w in segment.words
+                ]
+            result['segments'].append(entry)
+        result['text'] = ''.join(seg['text'] for seg in result['segments'])
+
         # Generate and save JSON output
         output_json = _get_json_path(audio_path, json_folder)
         logging.info("Saving transcription to: %s", output_json)
-        with open(output_json, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        Path(output_json).write_bytes(orjson.dumps(
+            result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
         logging.info("Transcription completed successfully")
         return result
@@ -126,11 +306,7 @@ def main() -> None:
         # Example usage
         audio_path = r'demo\mp3\TIFU_by_correcting_my_manager_on_a_phrase_she_was_using.mp3'
 
-        result = transcribe_audio(
-            audio_path=audio_path,
-            verbose=True,
-            fp16=False
-        )
+        result = transcribe_audio(audio_path=audio_path)
 
         logging.info("Transcribed text: %s", result["text"][:100] + "...")
 
@@ -1,7 +1,8 @@
 """Subtitle parser implementations for different subtitle formats."""
 
-import json
+import orjson
 import logging
+import numpy as np
 from abc import ABC, abstractmethod
 from typing import List, Tuple
 
@@ -28,17 +29,26 @@ class WhisperSubtitleParser(SubtitleParser):
 
     def parse(self, file_path: str) -> List[Tuple[Tuple[float, float], str]]:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
 
             if 'segments' not in data:
                 raise ValueError("Invalid Whisper format: missing segments")
 
-            return [
-                ((segment['start'], segment['end']), segment['text'].strip())
-                for segment in data['segments']
-                if all(key in segment for key in ['start', 'end', 'text'])
-            ]
+            entries = []
+            for segment in data['segments']:
+                # Prefer Whisper's own word timings when they were requested
+                words = segment.get('words')
+                if words:
+                    entries.extend(
+                        ((word['start'], word['end']), word['word'].strip())
+                        for word in words
+                        if word['word'].strip()
+                    )
+                elif all(key in segment for key in ['start', 'end', 'text']):
+                    entries.append(
+                        ((segment['start'], segment['end']), segment['text'].strip()))
+            return entries
         except Exception as e:
             logging.error(f"Error parsing Whisper subtitle file: {str(e)}")
             raise
@@ -49,8 +59,8 @@ class ElevenLabsSubtitleParser(SubtitleParser):
 
     def parse(self, file_path: str) -> List[Tuple[Tuple[float, float], str]]:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
 
             if not isinstance(data, list):
                 raise ValueError("Invalid ElevenLabs format")
@@ -63,15 +73,27 @@ class ElevenLabsSubtitleParser(SubtitleParser):
                 chars = segment['characters']
                 times = segment['character_start_times_seconds']
 
-                if len(chars) != len(times):
+                if not chars or len(chars) != len(times):
                     continue
 
-                # Group characters into words
-                text = ''.join(chars)
-                start_time = times[0]
-                end_time = times[-1] + 0.1  # Add small buffer
-
-                entries.append(((start_time, end_time), text))
+                # Group characters into words: split at spaces with NumPy
+                # instead of walking every character in Python
+                chars_arr = np.asarray(chars)
+                times_arr = np.asarray(times, dtype=float)
+                spaces = np.flatnonzero(chars_arr == ' ')
+                word_starts = np.concatenate(([0], spaces + 1))
+                word_ends = np.concatenate((spaces, [len(chars)]))
+                non_empty = word_ends > word_starts
+                word_starts = word_starts[non_empty]
+                word_ends = word_ends[non_empty]
+
+                start_times = times_arr[word_starts].tolist()
+                end_times = (times_arr[word_ends - 1] + 0.1).tolist()  # Add small buffer
+                entries.extend(
+                    ((start, end), ''.join(chars[s:e]))
+                    for start, end, s, e in zip(start_times, end_times,
+                                                word_starts.tolist(), word_ends.tolist())
+                )
 
             return entries
         except Exception as e:
@@ -84,14 +106,19 @@ class SubtitleParserFactory:
 
     @staticmethod
     def create_parser(file_path: str) -> SubtitleParser:
-        """Create appropriate parser based on file content."""
+        """Create appropriate parser based on file content.
+
+        Only the first bytes are read: Whisper output is a JSON object and
+        ElevenLabs output a JSON array. The chosen parser validates the full
+        structure when it loads the file.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                head = f.read(64).lstrip(b'\xef\xbb\xbf \t\r\n')
 
-            if isinstance(data, dict) and 'segments' in data:
+            if head.startswith(b'{'):
                 return WhisperSubtitleParser()
-            elif isinstance(data, list) and data and 'characters' in data[0]:
+            elif head.startswith(b'['):
                 return ElevenLabsSubtitleParser()
             else:
                 raise ValueError("Unsupported subtitle format")
@@ -0,0 +1,293 @@
+"""Subtitle clip that renders each distinct caption only once."""
+
+import bisect
+import itertools
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from moviepy.video.VideoClip import TextClip, VideoClip
+from PIL import Image, ImageDraw, ImageFont
+
+SubtitleEntries = List[Tuple[Tuple[float, float], str]]
+Caption = Tuple[np.ndarray, np.ndarray]
+
+
+class CaptionStyle(NamedTuple):
+    """Text style shared by every caption in a video; hashable for caching."""
+    font: str
+    font_size: int
+    color: str
+    stroke_color: str
+    stroke_width: int
+    width: int
+
+    def make_textclip(self, text: str) -> TextClip:
+        """Build the styled TextClip for a caption."""
+        return TextClip(
+            text=text,
+            font=self.font,
+            font_size=self.font_size,
+            color=self.color,
+            stroke_color=self.stroke_color,
+            stroke_width=self.stroke_width,
+            method="caption",
+            size=(self.width, None),
+            text_align="center"
+        )
+
+
+def _rasterize(clip: TextClip) -> Caption:
+    """Capture a text clip's pixels and alpha, then release it."""
+    rgb = clip.get_frame(0)
+    if clip.mask is not None:
+        alpha = clip.mask.get_frame(0).astype(np.float32)
+    else:
+        alpha = np.ones(rgb.shape[:2], dtype=np.float32)
+    clip.close()
+    return rgb, alpha
+
+
+@lru_cache(maxsize=8)
+def _load_font(font: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a font file once per size."""
+    return ImageFont.truetype(font, size)
+
+
+def _wrap_text(text: str, font: ImageFont.FreeTypeFont, width: float) -> str:
+    """Break text into lines no wider than ``width``, splitting on spaces.
+
+    Each word is measured once and line widths are summed, rather than
+    re-measuring the whole line after every word; kerning across a space
+    is negligible at caption sizes.
+    """
+    words = text.split()
+    space = font.getlength(' ')
+    lines = []
+    line: List[str] = []
+    line_width = 0.0
+    for word in words:
+        word_width = font.getlength(word)
+        if line and line_width + space + word_width > width:
+            lines.append(' '.join(line))
+            line, line_width = [word], word_width
+        else:
+            line_width += space + word_width if line else word_width
+            line.append(word)
+    lines.append(' '.join(line))
+    return '\n'.join(lines)
+
+
+def rasterize_text(text: str, style: CaptionStyle) -> Caption:
+    """Draw a caption with Pillow, laid out like ``CaptionStyle.make_textclip``.
+
+    Text is wrapped to the style width, centred, and drawn with its stroke
+    straight into an RGBA image, without building TextClip and mask clips
+    just to read one frame back from each.
+
+    Args:
+        text: Caption text
+        style: Caption style
+
+    Returns:
+        Caption: RGB array and alpha mask, centred and at most
+            ``style.width`` pixels wide
+    """
+    font = _load_font(style.font, style.font_size)
+    margin = style.stroke_width
+    text = _wrap_text(text, font, style.width - 2 * margin)
+    anchor = (style.width / 2, margin)
+    options = dict(font=font, anchor='ma', align='center',
+                   stroke_width=style.stroke_width)
+
+    # Draw on a canvas tall enough for any line, then crop to the ink,
+    # instead of laying the text out twice to measure it first
+    ascent, descent = font.getmetrics()
+    line_height = ascent + descent + 2 * style.stroke_width + 4  # 4: line spacing
+    image = Image.new('RGBA', (style.width, line_height * (text.count('\n') + 1) + margin))
+    ImageDraw.Draw(image).multiline_text(
+        anchor, text, fill=style.color, stroke_fill=style.stroke_color, **options)
+
+    # Trim the empty columns equally from both sides: the text stays centred
+    # and blending touches only the text's own columns, not the full width.
+    # The top is kept, since captions are positioned by their top edge
+    left, _, right, bottom = image.getbbox() or (0, 0, style.width, 0)
+    trim = min(left, style.width - right)
+    pixels = np.asarray(image)[:max(bottom + margin, 1), trim:style.width - trim]
+    return (np.ascontiguousarray(pixels[..., :3]),
+            pixels[..., 3].astype(np.float32) / 255)
+
+
+# Bitmaps are trimmed to the text, but the RGB array plus float32 mask still
+# take a couple of hundred KB for one word and a few MB for a wrapped sentence,
+# so the cache is sized for the common words and phrases rather than every
+# caption ever shown
+@lru_cache(maxsize=256)
+def render_caption(text: str, style: CaptionStyle) -> Caption:
+    """Rasterize a caption, reusing earlier renders of the same text and style.
+
+    Args:
+        text: Caption text
+        style: Caption style
+
+    Returns:
+        Caption: Read-only RGB array and alpha mask
+    """
+    rgb, alpha = rasterize_text(text, style)
+    # The arrays are shared between videos, so guard against in-place edits
+    rgb.setflags(write=False)
+    alpha.setflags(write=False)
+    return rgb, alpha
+
+
+class SubtitleAtlasClip(VideoClip):
+    """Subtitle overlay backed by pre-rendered caption bitmaps.
+
+    Every distinct caption is rasterized once up front and kept as an RGB
+    array plus alpha mask. At frame time the active caption is found by
+    binary search and pasted onto a fixed-size canvas, so rendering never
+    calls back into text layout.
+    """
+
+    def __init__(self, subtitles: SubtitleEntries,
+                 make_textclip: Optional[Callable[[str], TextClip]] = None,
+                 style: Optional[CaptionStyle] = None):
+        """Rasterize the captions.
+
+        Args:
+            subtitles: Subtitle entries as ((start, end), text)
+            make_textclip: Builds the styled TextClip for a caption
+            style: Caption style; when given, renders go through the shared
+                ``render_caption`` cache instead of ``make_textclip``
+        """
+        if make_textclip is None and style is None:
+            raise ValueError("Either make_textclip or style is required")
+
+        self.subtitles = sorted(subtitles, key=lambda entry: entry[0][0])
+        self._starts = [start for (start, _), _ in self.subtitles]
+
+        self._atlas: Dict[str, Caption] = {}
+        for _, text in self.subtitles:
+            if text not in self._atlas:
+                self._atlas[text] = (render_caption(text, style) if style is not None
+                                     else _rasterize(make_textclip(text)))
+
+        # Pad to the largest caption so the clip keeps a constant size; captions
+        # are centred horizontally and anchored at the top like SubtitlesClip
+        width = max((rgb.shape[1] for rgb, _ in self._atlas.values()), default=1)
+        height = max((rgb.shape[0] for rgb, _ in self._atlas.values()), default=1)
+        self._blank = (np.zeros((height, width, 3), dtype=np.uint8),
+                       np.zeros((height, width), dtype=np.float32))
+        self._last_text = None
+        self._last_frame = self._blank
+        # Premultiplied colour and inverse alpha per caption, for overlay_on
+        self._blend_cache: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        duration = max((end for (_, end), _ in self.subtitles), default=0)
+        super().__init__(frame_function=lambda t: self._frame_at(t)[0],
+                         duration=duration)
+        self.mask = VideoClip(frame_function=lambda t: self._frame_at(t)[1],
+                              is_mask=True, duration=duration)
+
+    def _text_at(self, t: float):
+        """Return the caption shown at time ``t``, or None."""
+        i = bisect.bisect_right(self._starts, t) - 1
+        if i >= 0:
+            (start, end), text = self.subtitles[i]
+            if start <= t < end:
+                return text
+        return None
+
+    def _frame_at(self, t: float) -> Caption:
+        """Return the padded (rgb, alpha) frame for time ``t``.
+
+        Consecutive frames almost always show the same caption, so the last
+        padded frame is reused instead of being pasted again.
+        """
+        text = self._text_at(t)
+        if text == self._last_text:
+            return self._last_frame
+
+        if text is None:
+            frame = self._blank
+        else:
+            rgb, alpha = self._atlas[text]
+            canvas, mask = (np.zeros_like(a) for a in self._blank)
+            h, w = alpha.shape
+            x = (canvas.shape[1] - w) // 2
+            canvas[:h, x:x + w] = rgb
+            mask[:h, x:x + w] = alpha
+            frame = (canvas, mask)
+
+        self._last_text, self._last_frame = text, frame
+        return frame
+
+    @staticmethod
+    def _resolve_position(spec, frame_size: int, size: int, relative: bool) -> int:
+        """Turn one coordinate of a MoviePy position into pixels."""
+        if isinstance(spec, str):
+            return {'left': 0, 'top': 0, 'center': (frame_size - size) // 2,
+                    'right': frame_size - size, 'bottom': frame_size - size}[spec]
+        return int(spec * frame_size) if relative else int(spec)
+
+    def _blend_caption(self, frame: np.ndarray, text: str, t: float) -> None:
+        """Alpha-blend one caption into ``frame`` in place.
+
+        Only the caption's own pixels are touched. Its position is the padded
+        canvas position set with ``with_position``, as CompositeVideoClip
+        would place this clip.
+        """
+        rgb, alpha = self._atlas[text]
+        cached = self._blend_cache.get(text)
+        if cached is None:
+            # +0.5 so the cast back to uint8 rounds instead of truncating
+            cached = self._blend_cache[text] = (
+                rgb * alpha[..., None] + 0.5, (1 - alpha)[..., None])
+        premultiplied, inverse_alpha = cached
+
+        frame_h, frame_w = frame.shape[:2]
+        canvas_h, canvas_w = self._blank[1].shape
+        h, w = alpha.shape
+        pos_x, pos_y = self.pos(t)
+        x = self._resolve_position(pos_x, frame_w, canvas_w, self.relative_pos)
+        x += (canvas_w - w) // 2
+        y = self._resolve_position(pos_y, frame_h, canvas_h, self.relative_pos)
+
+        # Clip to the frame
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, frame_w), min(y + h, frame_h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        src = (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+        region = frame[y0:y1, x0:x1]
+        region[...] = region * inverse_alpha[src] + premultiplied[src]
+
+    def overlay_on(self, background: VideoClip, buffers: int = 16) -> VideoClip:
+        """Draw the captions straight onto another clip's frames.
+
+        Replaces CompositeVideoClip for a background plus captions: each
+        background frame is copied into one of ``buffers`` preallocated
+        frames, reused round-robin, and only the active caption's pixels are
+        blended into it. No full-size arrays are allocated per frame, so a
+        consumer must be done with a frame before ``buffers`` more are made.
+
+        Args:
+            background: Clip to draw the captions on
+            buffers: Number of output frames to cycle through
+
+        Returns:
+            VideoClip: The background with captions, keeping its audio
+        """
+        width, height = background.size
+        pool = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(buffers)]
+        slots = itertools.cycle(pool)
+
+        def draw(get_frame, t):
+            frame = next(slots)
+            np.copyto(frame, get_frame(t))
+            text = self._text_at(t)
+            if text is not None:
+                self._blend_caption(frame, text, t)
+            return frame
+
+        return background.transform(draw, apply_to=[])
@@ -4,7 +4,7 @@ import os
 import logging
 from typing import Dict, Optional
 
-from ..story_pipeline.whisper_api import transcribe_audio, load_whisper_model
+from ..story_pipeline.whisper_api import DEFAULT_WHISPER_MODEL, transcribe_audio, load_whisper_model
 
 
 class WhisperGenerator:
@@ -17,13 +17,11 @@ class WhisperGenerator:
             config: Optional configuration for Whisper model
         """
         self.config = config or {}
-        self.model_name = self.config.get('whisper_model', 'base')
-        self.model = None
+        self.model_name = self.config.get('whisper_model', DEFAULT_WHISPER_MODEL)
 
     def _ensure_model_loaded(self):
-        """Ensure Whisper model is loaded."""
-        if not self.model:
-            self.model = load_whisper_model(self.model_name)
+        """Return the shared Whisper model, loading it on first use."""
+        return load_whisper_model(self.model_name)
 
     def generate(self, audio_path: str, output_path: str) -> str:
         """Generate subtitles from audio file.
@@ -36,11 +34,12 @@ class WhisperGenerator:
             str: Path to the generated subtitle file
         """
         try:
-            self._ensure_model_loaded()
             return transcribe_audio(
                 audio_path=audio_path,
-                model=self.model,
-                json_folder=os.path.dirname(output_path)
+                model=self._ensure_model_loaded(),
+                json_folder=os.path.dirname(output_path),
+                # Word timings drive per-word subtitles without realignment
+                word_timestamps=True
             )
         except Exception as e:
             logging.error(f"Failed to generate subtitles: {str(e)}")
@@ -2,10 +2,11 @@
 
 import logging
 from typing import Dict, List, Tuple, Optional
-from moviepy.video.tools.subtitles import SubtitlesClip
-from moviepy.video.VideoClip import TextClip
+from moviepy.video.VideoClip import TextClip, VideoClip
 from moviepy.video import vfx
 
+from .subtitle_atlas import CaptionStyle, SubtitleAtlasClip
+
 
 class SubtitleStyler:
     """Handles subtitle styling and rendering."""
@@ -28,26 +29,27 @@ class SubtitleStyler:
         self.stroke_width = self.config.get('stroke_width', 2)
         self.resolution = self.config.get('vertical_resolution', (1080, 1920))
         self.position = self.config.get('subtitle_position', ('center', 0.70))
+        self._update_caption_style()
+
+    def _update_caption_style(self):
+        """Rebuild the caption style from the current settings.
+
+        Rendered captions are cached per style, so a changed setting must
+        produce a new style rather than reuse bitmaps drawn with the old one.
+        """
+        self.caption_style = CaptionStyle(
+            self.font, self.font_size, self.color, self.stroke_color,
+            self.stroke_width, self.resolution[0])
 
     def _create_text_clip(self, txt: str) -> TextClip:
         """Create a TextClip with current style settings."""
-        return TextClip(
-            text=txt,
-            font=self.font,
-            font_size=self.font_size,
-            color=self.color,
-            stroke_color=self.stroke_color,
-            stroke_width=self.stroke_width,
-            method="caption",
-            size=(self.resolution[0], None),
-            text_align="center"
-        )
-
-    def _add_effects(self, subtitles: SubtitlesClip) -> SubtitlesClip:
+        return self.caption_style.make_textclip(txt)
+
+    def _add_effects(self, subtitles: VideoClip) -> VideoClip:
         """Add visual effects to subtitles."""
         return subtitles.with_effects([vfx.CrossFadeIn(0.1), vfx.CrossFadeOut(0.1)])
 
-    def create_clip(self, subtitle_data: List[Tuple[Tuple[float, float], str]], duration: Optional[float] = None) -> SubtitlesClip:
+    def create_clip(self, subtitle_data: List[Tuple[Tuple[float, float], str]], duration: Optional[float] = None) -> VideoClip:
         """Create a styled subtitle clip.
 
         Args:
@@ -55,13 +57,11 @@ class SubtitleStyler:
             duration: Optional video duration for sync check
 
         Returns:
-            SubtitlesClip: Styled subtitle clip
+            VideoClip: Styled subtitle clip
         """
         try:
-            subtitles = SubtitlesClip(
-                subtitle_data,
-                make_textclip=self._create_text_clip
-            )
+            subtitles = SubtitleAtlasClip(
+                subtitle_data, style=self.caption_style)
 
             subtitles = subtitles.with_position(self.position, relative=True)
 
@@ -93,6 +93,8 @@ class SubtitleStyler:
             else:
                 logging.warning(f"Ignoring invalid style parameter: {param}")
 
+        self._update_caption_style()
+
     def get_current_style(self) -> Dict:
         """Get current style settings.
 
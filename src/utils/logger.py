@@ -2,7 +2,7 @@
 
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional
 from pathlib import Path
 from datetime import datetime
 
@@ -17,6 +17,12 @@ PROD_FORMAT = '%(message)s'
 # Global debug flag
 DEBUG = False
 
+# Loggers already returned by get_logger, keyed by module name
+_configured: Dict[Optional[str], logging.Logger] = {}
+
+# Whether the verbose third-party loggers have been silenced
+_silenced = False
+
 
 def setup_logger(
     debug: bool = False,
@@ -33,7 +39,7 @@ def setup_logger(
     Returns:
         logging.Logger: Configured logger instance
     """
-    global DEBUG
+    global DEBUG, _silenced
     DEBUG = debug
 
     # Get or create logger
@@ -64,8 +70,9 @@ def setup_logger(
         file_handler.setFormatter(logging.Formatter(DEBUG_FORMAT))
         logger.addHandler(file_handler)
 
-    # Configure specific loggers in production
-    if not debug:
+    # Configure specific loggers in production (once per process)
+    if not debug and not _silenced:
+        _silenced = True
         # Silence verbose loggers
         for logger_name in [
             'whisper',
@@ -76,6 +83,7 @@ def setup_logger(
         ]:
             logging.getLogger(logger_name).setLevel(LOG_LEVEL_PRODUCTION)
 
+    _configured[module_name] = logger
     return logger
 
 
@@ -88,6 +96,10 @@ def get_logger(module_name: Optional[str] = None) -> logging.Logger:
     Returns:
         logging.Logger: Logger instance
     """
+    logger = _configured.get(module_name)
+    if logger is not None:
+        return logger
+
     logger = logging.getLogger(
         module_name) if module_name else logging.getLogger()
 
@@ -98,4 +110,5 @@ def get_logger(module_name: Optional[str] = None) -> logging.Logger:
             module_name=module_name
         )
 
+    _configured[module_name] = logger
     return logger
@@ -0,0 +1,645 @@
+"""Single-pass video rendering with the ffmpeg command line.
+
+MoviePy composes every frame in Python and pipes it to ffmpeg. For the plain
+background + narration + subtitles layout the whole graph can instead run
+inside one ffmpeg process, with subtitles burned in from an ASS file, or
+overlaid from pre-rendered caption images when ffmpeg lacks libass.
+"""
+
+import logging
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from moviepy.config import FFMPEG_BINARY
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+from PIL import Image
+
+from ..subtitle_processing.subtitle_atlas import CaptionStyle, _load_font, render_caption
+
+SubtitleEntries = List[Tuple[Tuple[float, float], str]]
+
+
+class RenderJob(NamedTuple):
+    """One video of an ffmpeg render batch."""
+    output_path: str
+    tts_path: str
+    duration: float
+    entries: SubtitleEntries
+
+# Output audio format: AAC's native 48 kHz, stereo. Mixes are produced at this
+# rate so the encoder never has to resample
+AUDIO_FPS = 48000
+AUDIO_CHANNELS = 2
+
+# Quality/speed options per encoder, tuned to comparable output quality
+ENCODER_PARAMS = {
+    'h264_nvenc': ['-preset', 'p4', '-tune', 'hq', '-rc', 'vbr', '-cq', '23', '-b:v', '0'],
+    'hevc_nvenc': ['-preset', 'p4', '-tune', 'hq', '-rc', 'vbr', '-cq', '25', '-b:v', '0'],
+    'h264_qsv': ['-preset', 'veryfast', '-global_quality', '23'],
+    'h264_videotoolbox': ['-q:v', '60'],
+    'libx264': ['-preset', 'veryfast', '-crf', '23'],
+    'libsvtav1': ['-preset', '12', '-crf', '35', '-svtav1-params', 'tune=0'],
+}
+
+# Hardware decoders paired with hardware encoders. The filters (fades, libass)
+# run on the CPU, so decoded frames are still downloaded, but decoding moves
+# off the CPU; ffmpeg falls back to software decoding if the device fails.
+HWACCEL_FOR_ENCODER = {
+    'h264_nvenc': 'cuda',
+    'hevc_nvenc': 'cuda',
+    'h264_videotoolbox': 'videotoolbox',
+}
+
+# Concurrent encode sessions consumer GPU drivers allow; sessions beyond the
+# cap fail to open. The ``max_encoder_sessions`` config key overrides this
+ENCODER_SESSION_LIMITS = {
+    'h264_nvenc': 3,
+    'hevc_nvenc': 3,
+}
+
+# Hardware H.264 encoders in order of preference
+_HW_ENCODERS = ['h264_nvenc', 'h264_qsv', 'h264_videotoolbox']
+SOFTWARE_ENCODER = ('libx264', ENCODER_PARAMS['libx264'])
+
+# ASS colours are &HAABBGGRR; only the names the configs use need mapping
+_NAMED_COLORS = {
+    'white': (255, 255, 255),
+    'black': (0, 0, 0),
+    'yellow': (255, 255, 0),
+    'red': (255, 0, 0),
+    'green': (0, 128, 0),
+    'blue': (0, 0, 255),
+}
+
+
+@lru_cache(maxsize=1)
+def ffmpeg_available() -> bool:
+    """Check once whether the ffmpeg binary can be executed.
+
+    Returns:
+        bool: True if ``ffmpeg -version`` runs successfully
+    """
+    try:
+        subprocess.run([FFMPEG_BINARY, '-version'], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+
+@lru_cache(maxsize=1)
+def libass_available() -> bool:
+    """Check once whether ffmpeg has the libass ``subtitles`` filter.
+
+    Returns:
+        bool: True if the filter is listed by ``ffmpeg -filters``
+    """
+    try:
+        listed = subprocess.run(
+            [FFMPEG_BINARY, '-hide_banner', '-filters'], check=True,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return ' subtitles ' in listed
+
+
+_MAX_VOLUME = re.compile(r"max_volume: (-?[\d.]+) dB")
+
+
+def peak_gain(audio_path: str, audio_filter: str = '',
+              timeout: Optional[float] = None) -> float:
+    """Measure the gain that brings an audio file's peak to full scale.
+
+    Matches MoviePy's AudioNormalize, which the MoviePy render path uses, so
+    both paths produce the same levels. ``volumedetect`` decodes the audio
+    only, so this costs a small fraction of the render.
+
+    Args:
+        audio_path: Audio file to measure
+        audio_filter: Filters to apply before measuring, e.g. fades that
+            the render applies ahead of normalization
+        timeout: Seconds to allow ffmpeg
+
+    Returns:
+        float: Linear gain; 1.0 for silent or unreadable levels
+
+    Raises:
+        RuntimeError: If ffmpeg fails or times out
+    """
+    filters = f"{audio_filter},volumedetect" if audio_filter else "volumedetect"
+    try:
+        stderr = subprocess.run(
+            [FFMPEG_BINARY, '-hide_banner', '-nostats', '-i', audio_path, '-vn',
+             '-af', filters, '-f', 'null', '-'],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            text=True, timeout=timeout).stderr
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffmpeg could not measure {audio_path}: {e.stderr.strip()}") from e
+    except subprocess.TimeoutExpired as e:
+        raise RuntimeError(f"ffmpeg timed out measuring {audio_path}") from e
+
+    match = _MAX_VOLUME.search(stderr)
+    if not match:
+        return 1.0
+    return 10 ** (-float(match.group(1)) / 20)
+
+
+@lru_cache(maxsize=4)
+def _music_gain(music_path: str, mtime: float, timeout: Optional[float]) -> float:
+    """Peak gain of the background music, measured once per file version."""
+    return peak_gain(music_path, timeout=timeout)
+
+
+@lru_cache(maxsize=4)
+def _video_size(video_path: str, mtime: float) -> Tuple[int, int]:
+    """Frame size of a video, probed once per file version."""
+    return tuple(ffmpeg_parse_infos(video_path)['video_size'])
+
+
+def _encoder_works(codec: str) -> bool:
+    """Encode one synthetic frame to check the encoder has usable hardware.
+
+    ``ffmpeg -encoders`` only lists what was compiled in, not whether a GPU
+    is actually present, so a listed encoder can still fail at runtime.
+    """
+    try:
+        subprocess.run(
+            [FFMPEG_BINARY, '-loglevel', 'error', '-f', 'lavfi',
+             '-i', 'color=c=black:s=256x256:d=0.1', '-frames:v', '1',
+             '-c:v', codec, '-f', 'null', '-'],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=30)
+        return True
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+@lru_cache(maxsize=1)
+def select_h264_encoder() -> Tuple[str, List[str]]:
+    """Pick the fastest working H.264 encoder, probed once per process.
+
+    Prefers NVENC, then Quick Sync, then VideoToolbox on macOS, and falls
+    back to libx264.
+
+    Returns:
+        Tuple[str, List[str]]: Encoder name and its quality/speed options
+    """
+    try:
+        listed = subprocess.run(
+            [FFMPEG_BINARY, '-hide_banner', '-encoders'], check=True,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return SOFTWARE_ENCODER
+
+    for codec in _HW_ENCODERS:
+        if codec == 'h264_videotoolbox' and sys.platform != 'darwin':
+            continue
+        if f" {codec} " in listed and _encoder_works(codec):
+            logging.info("Using hardware video encoder: %s", codec)
+            return codec, ENCODER_PARAMS[codec]
+    return SOFTWARE_ENCODER
+
+
+def resolve_encoder(config: Dict) -> Tuple[str, List[str]]:
+    """Choose the video encoder for a render from the pipeline config.
+
+    ``video_codec`` names an encoder explicitly; the default "auto" probes for
+    hardware encoders unless ``hardware_encoding`` is False. ``x264_preset``
+    overrides the libx264 speed preset (default "veryfast"), and
+    ``render_threads`` caps the encoder's threads (0 lets ffmpeg decide).
+
+    Args:
+        config: Pipeline configuration
+
+    Returns:
+        Tuple[str, List[str]]: Encoder name and its quality/speed options
+    """
+    codec = config.get('video_codec', 'auto')
+    if codec != 'auto':
+        params = ENCODER_PARAMS.get(codec, [])
+    elif not config.get('hardware_encoding', True):
+        codec, params = SOFTWARE_ENCODER
+    else:
+        codec, params = select_h264_encoder()
+
+    preset = config.get('x264_preset')
+    if codec == 'libx264' and preset:
+        # ENCODER_PARAMS['libx264'] leads with its preset
+        params = ['-preset', preset] + params[2:]
+    threads = config.get('render_threads', 0)
+    if threads:
+        params = params + ['-threads', str(threads)]
+    return codec, params
+
+
+def format_ass_time(seconds: float) -> str:
+    """Format seconds as an ASS timestamp (H:MM:SS.cc).
+
+    Args:
+        seconds: Time in seconds
+
+    Returns:
+        str: ASS timestamp
+    """
+    centis = int(round(max(seconds, 0) * 100))
+    hours, centis = divmod(centis, 360000)
+    minutes, centis = divmod(centis, 6000)
+    secs, centis = divmod(centis, 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centis:02d}"
+
+
+def ass_color(color: str) -> str:
+    """Convert a colour name or #RRGGBB string to ASS notation.
+
+    Args:
+        color: Colour name or hex string
+
+    Returns:
+        str: Colour as &H00BBGGRR
+
+    Raises:
+        ValueError: If the colour is not recognised
+    """
+    color = color.strip().lower()
+    if color in _NAMED_COLORS:
+        r, g, b = _NAMED_COLORS[color]
+    elif color.startswith('#') and len(color) == 7:
+        r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    else:
+        raise ValueError(f"Unsupported subtitle colour: {color}")
+    return f"&H00{b:02X}{g:02X}{r:02X}"
+
+
+def _escape_ass_text(text: str) -> str:
+    """Escape characters that ASS would treat as override codes."""
+    return (text.replace('\\', '\\\\').replace('{', '\\{')
+            .replace('}', '\\}').replace('\n', '\\N'))
+
+
+def _escape_filter_path(path: str) -> str:
+    """Escape a path for use as an ffmpeg filter option value."""
+    path = os.path.abspath(path).replace('\\', '/')
+    return path.replace(':', '\\:').replace("'", "\\'")
+
+
+def _escape_concat_path(path: str) -> str:
+    """Quote a path for an ffconcat ``file`` line."""
+    path = os.path.abspath(path).replace('\\', '/')
+    return "'" + path.replace("'", "'\\''") + "'"
+
+
+def _font_family(font_path: str, font_size: int) -> str:
+    """Return the family name libass matches a font by.
+
+    Falls back to the file name for fonts Pillow can't open, such as a
+    bare system font name.
+    """
+    try:
+        return _load_font(font_path, font_size).getname()[0]
+    except OSError:
+        return os.path.splitext(os.path.basename(font_path))[0]
+
+
+def write_ass(entries: SubtitleEntries, ass_path: str, config: Dict,
+              frame_size: Tuple[int, int]) -> str:
+    """Write subtitle entries to an ASS file styled like the MoviePy captions.
+
+    The script resolution is the output frame size, so font size, stroke and
+    positions are in output pixels as they are for the MoviePy captions.
+
+    Args:
+        entries: Subtitle entries as ((start, end), text)
+        ass_path: Where to write the file
+        config: Pipeline configuration with the subtitle style keys
+        frame_size: Output frame (width, height)
+
+    Returns:
+        str: The ASS file path
+    """
+    width, height = frame_size
+    font_size = config.get('font_size', 70)
+    font_name = _font_family(config.get('font_path', 'Arial-Bold'), font_size)
+    rel_y = config.get('subtitle_position', ('center', 0.85))[1]
+    # MoviePy wraps captions to the configured width, centred in the frame
+    caption_width = config.get('vertical_resolution', (1080, 1920))[0]
+    margin_x = max((width - caption_width) // 2, 0)
+
+    # Alignment 8 anchors the top of the text, matching MoviePy's relative
+    # position of the caption's top edge
+    style = ",".join(str(v) for v in (
+        'Default', font_name, font_size,
+        ass_color(config.get('subtitle_color', 'white')), '&H000000FF',
+        ass_color(config.get('stroke_color', 'black')), '&H00000000',
+        0, 0, 0, 0, 100, 100, 0, 0, 1,
+        config.get('stroke_width', 2), 0, 8, margin_x, margin_x, int(rel_y * height), 1))
+
+    lines = [
+        '[Script Info]',
+        'ScriptType: v4.00+',
+        f'PlayResX: {width}',
+        f'PlayResY: {height}',
+        'WrapStyle: 0',
+        '',
+        '[V4+ Styles]',
+        'Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, '
+        'OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, '
+        'ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, '
+        'Alignment, MarginL, MarginR, MarginV, Encoding',
+        f'Style: {style}',
+        '',
+        '[Events]',
+        'Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, '
+        'Effect, Text',
+    ]
+    # MoviePy cross-fades the whole caption track in and out over 100 ms, so
+    # only a caption at the very start fades in and one at the very end out
+    track_end = max((end for (_, end), _ in entries), default=0)
+    for (start, end), text in entries:
+        fade_in = 100 if start <= 0 else 0
+        fade_out = 100 if end >= track_end else 0
+        fade = f"{{\\fad({fade_in},{fade_out})}}" if fade_in or fade_out else ""
+        lines.append(
+            f"Dialogue: 0,{format_ass_time(start)},{format_ass_time(end)},"
+            f"Default,,0,0,0,,{fade}{_escape_ass_text(text)}")
+
+    with open(ass_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return ass_path
+
+
+def write_caption_track(entries: SubtitleEntries, work_dir: str, config: Dict) -> str:
+    """Pre-render captions to PNG files timed by an ffconcat list.
+
+    Each distinct caption is rasterized once, through the shared caption
+    cache, and padded to a common size so the list plays as one transparent
+    video stream for ffmpeg's ``overlay`` filter. Gaps show a blank image.
+
+    Args:
+        entries: Subtitle entries as ((start, end), text)
+        work_dir: Directory for the images and the list
+        config: Pipeline configuration with the subtitle style keys
+
+    Returns:
+        str: Path of the ffconcat list
+    """
+    style = CaptionStyle(
+        config.get('font_path', 'Arial-Bold'), config.get('font_size', 70),
+        config.get('subtitle_color', 'white'), config.get('stroke_color', 'black'),
+        config.get('stroke_width', 2), config.get('vertical_resolution', (1080, 1920))[0])
+    entries = sorted(entries, key=lambda entry: entry[0][0])
+    captions = {text: render_caption(text, style) for _, text in entries}
+    width = max((rgb.shape[1] for rgb, _ in captions.values()), default=1)
+    height = max((rgb.shape[0] for rgb, _ in captions.values()), default=1)
+
+    def save(name: str, rgb: np.ndarray, alpha: np.ndarray) -> str:
+        # Centred horizontally and anchored at the top, like SubtitleAtlasClip
+        rgba = np.zeros((height, width, 4), dtype=np.uint8)
+        h, w = alpha.shape
+        x = (width - w) // 2
+        rgba[:h, x:x + w, :3] = rgb
+        rgba[:h, x:x + w, 3] = np.round(alpha * 255)
+        path = os.path.join(work_dir, name)
+        Image.fromarray(rgba, 'RGBA').save(path)
+        return _escape_concat_path(path)
+
+    blank = save('blank.png', np.zeros((1, 1, 3), dtype=np.uint8),
+                 np.zeros((1, 1), dtype=np.float32))
+    files = {text: save(f'caption_{i}.png', *caption)
+             for i, (text, caption) in enumerate(captions.items())}
+
+    lines = ['ffconcat version 1.0']
+    shown_until = 0.0
+    for i, ((start, end), text) in enumerate(entries):
+        # Overlapping captions are cut where the next one starts
+        if i + 1 < len(entries):
+            end = min(end, entries[i + 1][0][0])
+        if start > shown_until:
+            lines += [f"file {blank}", f"duration {start - shown_until:.3f}"]
+            shown_until = start
+        if end > shown_until:
+            lines += [f"file {files[text]}", f"duration {end - shown_until:.3f}"]
+            shown_until = end
+    # The last file's duration is only honoured when another file follows
+    lines.append(f"file {blank}")
+
+    list_path = os.path.join(work_dir, 'captions.ffconcat')
+    with open(list_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return list_path
+
+
+class FfmpegRenderer:
+    """Renders background video, narration, music and subtitles in one ffmpeg run."""
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self._parse_config(config)
+
+    def _parse_config(self, config: Dict) -> None:
+        self.resolution = config.get('vertical_resolution', (1080, 1920))
+        self.fade_duration = config.get('fade_duration', 0.5)
+        self.tts_volume = config.get('tts_volume', 1.0)
+        self.music_volume = config.get('music_volume', 0.3)
+        self.font_path = config.get('font_path', 'Arial-Bold')
+        self.subtitle_y = config.get('subtitle_position', ('center', 0.85))[1]
+        # Seconds allowed per video before a stuck ffmpeg is killed
+        self.render_timeout = config.get('render_timeout', 600)
+
+    def _frame_size(self, video_path: str) -> Tuple[int, int]:
+        """Output frame size: the background scaled to the output height,
+        keeping its aspect ratio with an even width like ``scale=-2``."""
+        src_width, src_height = _video_size(video_path, os.path.getmtime(video_path))
+        height = self.resolution[0]
+        return 2 * round(src_width * height / src_height / 2), height
+
+    def _narration_fades(self, duration: float) -> str:
+        """Fade filters for a narration of ``duration`` seconds, or "" if disabled."""
+        fade = self.fade_duration
+        if fade <= 0:
+            return ""
+        fade_out_start = max(duration - fade, 0)
+        return (f"afade=t=in:d={fade},"
+                f"afade=t=out:st={fade_out_start:.3f}:d={fade}")
+
+    def _filter_graph(self, durations: List[float],
+                      ass_paths: Optional[List[str]] = None,
+                      narration_gains: Optional[List[float]] = None,
+                      music_gain: float = 1.0) -> str:
+        """Build the -filter_complex graph for one or more videos.
+
+        Input 0 is the background video and input 1 the music, followed by
+        each video's narration and, without ASS files, each video's caption
+        track. The background and music are decoded and normalized once and
+        split between the videos; each branch is trimmed to its video's
+        length so finished branches stop consuming frames.
+
+        Args:
+            durations: Output duration of each video (its narration length)
+            ass_paths: Burned-in subtitle file per video; without them,
+                captions are overlaid from the caption track inputs
+            narration_gains: Peak-normalizing gain per narration, measured
+                after its fades (see ``peak_gain``); 1.0 each if omitted
+            music_gain: Peak-normalizing gain of the music
+
+        Returns:
+            str: Filter graph; video k is labelled [v{k}] and [a{k}]
+        """
+        n = len(durations)
+        fade = self.fade_duration
+        if narration_gains is None:
+            narration_gains = [1.0] * n
+        # Peak normalization then the configured volume, as on the MoviePy path
+        graph = [
+            f"[0:v]scale=-2:{self.resolution[0]},setsar=1,split={n}"
+            + "".join(f"[bg{k}]" for k in range(n)),
+            f"[1:a]volume={music_gain * self.music_volume:.6f},asplit={n}"
+            + "".join(f"[music{k}]" for k in range(n)),
+        ]
+
+        for k, duration in enumerate(durations):
+            fade_out_start = max(duration - fade, 0)
+            narration_volume = narration_gains[k] * self.tts_volume
+            # A fade_duration of 0 disables the fades rather than adding
+            # zero-length ones that still pass every frame and sample through
+            video_fades = ""
+            if fade > 0:
+                video_fades = (f",fade=t=in:d={fade}"
+                               f",fade=t=out:st={fade_out_start:.3f}:d={fade}")
+            audio_fades = self._narration_fades(duration)
+            if audio_fades:
+                audio_fades += ","
+            background = f"[bg{k}]trim=duration={duration:.3f}{video_fades}"
+
+            if ass_paths is not None:
+                subtitles = f"subtitles=filename='{_escape_filter_path(ass_paths[k])}'"
+                fonts_dir = os.path.dirname(self.font_path)
+                if fonts_dir and os.path.isdir(fonts_dir):
+                    subtitles += f":fontsdir='{_escape_filter_path(fonts_dir)}'"
+                graph.append(f"{background},{subtitles}[v{k}]")
+            else:
+                graph += [
+                    f"{background}[base{k}]",
+                    f"[{2 + n + k}:v]format=rgba[captions{k}]",
+                    f"[base{k}][captions{k}]overlay=x=(W-w)/2:y=H*{self.subtitle_y}"
+                    f":eof_action=pass[v{k}]",
+                ]
+
+            graph += [
+                f"[{2 + k}:a]{audio_fades}volume={narration_volume:.6f}[tts{k}]",
+                f"[music{k}]atrim=duration={duration:.3f}[bgm{k}]",
+                f"[tts{k}][bgm{k}]amix=inputs=2:duration=first:normalize=0,"
+                f"aresample={AUDIO_FPS}[a{k}]",
+            ]
+
+        return ";".join(graph)
+
+    def render(self, output_path: str, tts_path: str, music_path: str,
+               video_path: str, duration: float, entries: SubtitleEntries,
+               fps: int = 30) -> None:
+        """Render the final video.
+
+        Args:
+            output_path: Where to write the video
+            tts_path: Narration audio; its duration drives the output length
+            music_path: Background music, looped as needed
+            video_path: Background video, looped as needed
+            duration: Narration duration in seconds
+            entries: Subtitle entries as ((start, end), text)
+            fps: Output frame rate
+
+        Raises:
+            RuntimeError: If ffmpeg exits with an error or times out
+        """
+        self.render_batch([RenderJob(output_path, tts_path, duration, entries)],
+                          music_path, video_path, fps=fps)
+
+    def render_batch(self, jobs: List[RenderJob], music_path: str,
+                     video_path: str, fps: int = 30) -> None:
+        """Render several videos that share a background in one ffmpeg process.
+
+        Process start-up, input probing, background decoding and music
+        normalization are paid once for the batch. Each video still gets its
+        own encoder, so keep batches small with NVENC, whose concurrent
+        session count is limited on consumer GPUs.
+
+        Every frame is re-encoded. Stream-copying the GOPs of the fixed-GOP
+        background cache that show no caption would only save work in long
+        silent stretches: captions follow the narration throughout, and the
+        first and last GOPs carry the fades.
+
+        Args:
+            jobs: The videos to render
+            music_path: Background music, looped as needed
+            video_path: Background video, looped as needed
+            fps: Output frame rate
+
+        Raises:
+            RuntimeError: If ffmpeg exits with an error or exceeds
+                ``render_timeout`` seconds per video; no output of the batch
+                should then be trusted
+        """
+        codec, codec_params = resolve_encoder(self.config)
+        hwaccel = HWACCEL_FOR_ENCODER.get(codec)
+        decode_params = ['-hwaccel', hwaccel] if hwaccel else []
+        durations = [job.duration for job in jobs]
+        # Narration is normalized after its fades, as AudioProcessor does
+        narration_gains = [
+            peak_gain(job.tts_path, self._narration_fades(job.duration),
+                      self.render_timeout or None)
+            for job in jobs]
+        music_gain = _music_gain(os.path.abspath(music_path), os.path.getmtime(music_path),
+                                 self.render_timeout or None)
+        with tempfile.TemporaryDirectory() as work_dir:
+            caption_inputs = []
+            if libass_available():
+                frame_size = self._frame_size(video_path)
+                ass_paths = [
+                    write_ass(job.entries, os.path.join(work_dir, f'subtitles_{k}.ass'),
+                              self.config, frame_size)
+                    for k, job in enumerate(jobs)]
+                graph = self._filter_graph(durations, ass_paths, narration_gains, music_gain)
+            else:
+                logging.info("ffmpeg has no libass; overlaying pre-rendered captions")
+                for k, job in enumerate(jobs):
+                    job_dir = os.path.join(work_dir, str(k))
+                    os.makedirs(job_dir)
+                    track = write_caption_track(job.entries, job_dir, self.config)
+                    caption_inputs += ['-f', 'concat', '-safe', '0', '-i', track]
+                graph = self._filter_graph(
+                    durations, narration_gains=narration_gains, music_gain=music_gain)
+
+            cmd = [
+                FFMPEG_BINARY, '-y', '-loglevel', 'error',
+                *decode_params, '-stream_loop', '-1', '-i', video_path,
+                '-stream_loop', '-1', '-i', music_path,
+            ]
+            for job in jobs:
+                cmd += ['-i', job.tts_path]
+            cmd += [*caption_inputs, '-filter_complex', graph]
+            for k, job in enumerate(jobs):
+                cmd += [
+                    '-map', f'[v{k}]', '-map', f'[a{k}]',
+                    '-t', f"{job.duration:.3f}", '-r', str(fps),
+                    '-c:v', codec, *codec_params, '-pix_fmt', 'yuv420p',
+                    '-c:a', 'aac', '-ac', str(AUDIO_CHANNELS),
+                    '-movflags', '+faststart', job.output_path
+                ]
+
+            logging.debug("Running ffmpeg: %s", ' '.join(cmd))
+            # A corrupt input can leave ffmpeg waiting forever, which would
+            # stall the whole batch; run() kills it when the time is up
+            timeout = self.render_timeout * len(jobs) if self.render_timeout else None
+            try:
+                subprocess.run(cmd, check=True, stderr=subprocess.PIPE, text=True,
+                               timeout=timeout)
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"ffmpeg render failed: {e.stderr.strip()}") from e
+            except subprocess.TimeoutExpired as e:
+                raise RuntimeError(
+                    f"ffmpeg render timed out after {timeout:.0f} seconds") from e
@@ -1,12 +1,118 @@
 import os
 import logging
-from typing import Dict, Optional, List, NoReturn
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Optional, List, NoReturn, Tuple
 from ..db import DatabaseManager, Story
 from ..db.constants import StoryStatus
-from .video_pipeline import VideoPipeline, DEFAULT_CONFIG
+from .ffmpeg_renderer import ENCODER_SESSION_LIMITS, resolve_encoder
+from .video_pipeline import VideoPipeline, DEFAULT_CONFIG, close_source_clips
 
-logging.basicConfig(level=logging.INFO,
-                    format='%(filename)s - %(lineno)d - %(asctime)s - %(levelname)s - %(message)s')
+# Default background assets used for every story
+MUSIC_PATH = os.path.join("demo", "mp3", "bg_music.mp3")
+BACKGROUND_VIDEO_PATH = os.path.join("demo", "mp4", "background.mp4")
+
+
+def default_render_workers() -> int:
+    """Number of videos to render at once by default.
+
+    Half the cores, since each render's encoder is itself multithreaded.
+
+    Returns:
+        int: Worker count, at least 1
+    """
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def capped_render_workers(max_workers: int, codec: str, batch_size: int = 1,
+                          max_sessions: Optional[int] = None) -> int:
+    """Limit concurrent renders to the encoder sessions the hardware allows.
+
+    Each video in a render batch holds its own encoder session, and consumer
+    GPUs refuse NVENC sessions beyond a small cap, so running more workers
+    would only turn the extra renders into errors.
+
+    Args:
+        max_workers: Requested number of concurrent renders
+        codec: Resolved video encoder
+        batch_size: Videos rendered per worker at once
+        max_sessions: Session cap overriding ``ENCODER_SESSION_LIMITS``
+
+    Returns:
+        int: Worker count, at least 1
+    """
+    sessions = max_sessions or ENCODER_SESSION_LIMITS.get(codec)
+    if not sessions:
+        return max_workers
+    if batch_size > sessions:
+        logging.warning("render_batch_size %d exceeds the %d %s sessions available",
+                        batch_size, sessions, codec)
+    capped = max(1, sessions // batch_size)
+    if capped < max_workers:
+        logging.info("Rendering %d videos at once to stay within %d %s sessions",
+                     capped, sessions, codec)
+        return capped
+    return max_workers
+
+
+def _render_story(video_config: Dict, output_path: str, tts_path: str,
+                  text: str, subtitle_json: str) -> str:
+    """Render one story's video. Runs in a worker process, so it must not
+    touch the database.
+
+    Args:
+        video_config: Configuration for video pipeline
+        output_path: Where to write the final video
+        tts_path: Path to the story's narration audio
+        text: Story text
+        subtitle_json: Path to the subtitle timing JSON
+
+    Returns:
+        str: The output path
+    """
+    with VideoPipeline(video_config) as pipeline:
+        pipeline.execute(
+            output_path=output_path,
+            tts_path=tts_path,
+            music_path=MUSIC_PATH,
+            video_path=BACKGROUND_VIDEO_PATH,
+            text=text,
+            subtitle_json=subtitle_json
+        )
+    return output_path
+
+
+def _render_batch(video_config: Dict,
+                  jobs: List[Tuple[str, str, str, str]]) -> List[Optional[str]]:
+    """Render several stories' videos in one ffmpeg process. Runs in a
+    worker process, so it must not touch the database.
+
+    If the batch fails, each video is rendered on its own so one bad story
+    does not fail the others.
+
+    Args:
+        video_config: Configuration for video pipeline
+        jobs: (output_path, tts_path, text, subtitle_json) for each story
+
+    Returns:
+        List[Optional[str]]: Per job, None if it rendered, else the error
+    """
+    if len(jobs) > 1:
+        try:
+            with VideoPipeline(video_config) as pipeline:
+                pipeline.execute_batch(
+                    jobs, MUSIC_PATH, BACKGROUND_VIDEO_PATH)
+            return [None] * len(jobs)
+        except Exception as e:
+            logging.warning("Batched render failed, rendering videos one by one: %s", e)
+
+    errors = []
+    for job in jobs:
+        try:
+            _render_story(video_config, *job)
+            errors.append(None)
+        except Exception as e:
+            errors.append(str(e))
+    return errors
 
 
 class VideoManager:
@@ -49,16 +155,18 @@ class VideoManager:
             f"Found {len(valid_stories)} stories ready for video creation")
         return valid_stories
 
-    def create_video_for_story(self, story: Story, output_path: Optional[str] = None) -> None:
-        """Create a video for a specific story.
+    def _start_video(self, story: Story, output_path: Optional[str] = None) -> str:
+        """Validate a story and mark it as processing.
 
         Args:
             story: Story object to create video for
             output_path: Optional custom output path for the video
 
+        Returns:
+            str: Output path for the video
+
         Raises:
             ValueError: If story is not ready for video creation or missing required files
-            Exception: If video creation fails
         """
         if story.status not in StoryStatus.get_video_ready_statuses():
             raise ValueError(
@@ -67,59 +175,153 @@ class VideoManager:
         if not all([story.audio_path, story.timestamps_path]):
             raise ValueError(f"Story {story.id} is missing required files")
 
-        try:
-            # Generate output path if not provided
-            if not output_path:
-                output_dir = os.path.join("demo", "videos", story.id)
-                os.makedirs(output_dir, exist_ok=True)
-                output_path = os.path.join(output_dir, "final.mp4")
+        # Generate output path if not provided
+        if not output_path:
+            output_dir = os.path.join("demo", "videos", story.id)
+            os.makedirs(output_dir, exist_ok=True)
+            output_path = os.path.join(output_dir, "final.mp4")
 
-            # Update story status
-            self.db_manager.update_story_status(
-                story.id, StoryStatus.VIDEO_PROCESSING)
+        # Update story status
+        self.db_manager.update_story_status(
+            story.id, StoryStatus.VIDEO_PROCESSING)
+        return output_path
 
+    def _fail_video(self, story: Story, error: Exception) -> None:
+        """Record a failed render on the story.
+
+        Args:
+            story: Story whose video failed
+            error: The failure
+        """
+        error_msg = f"Failed to create video: {str(error)}"
+        logging.error(error_msg)
+        self.db_manager.update_story_status(
+            story.id, StoryStatus.VIDEO_ERROR, error_msg)
+
+    def create_video_for_story(self, story: Story, output_path: Optional[str] = None) -> None:
+        """Create a video for a specific story.
+
+        Args:
+            story: Story object to create video for
+            output_path: Optional custom output path for the video
+
+        Raises:
+            ValueError: If story is not ready for video creation or missing required files
+            Exception: If video creation fails
+        """
+        output_path = self._start_video(story, output_path)
+
+        try:
             # Create video using pipeline
-            with VideoPipeline(self.video_config) as pipeline:
-                pipeline.execute(
-                    output_path=output_path,
-                    tts_path=story.audio_path,
-                    # Default background music
-                    music_path=os.path.join("demo", "mp3", "bg_music.mp3"),
-                    # Default background video
-                    video_path=os.path.join("demo", "mp4", "background.mp4"),
-                    text=story.text,
-                    subtitle_json=story.timestamps_path
-                )
+            _render_story(self.video_config, output_path, story.audio_path,
+                          story.text, story.timestamps_path)
 
             # Update story status and path
-            self.db_manager.update_story_status(
-                story.id, StoryStatus.VIDEO_READY)
-            self.db_manager.update_story_paths(
-                story.id, subtitles_path=output_path)
+            self.db_manager.update_story_paths_and_status(
+                story.id, StoryStatus.VIDEO_READY, subtitles_path=output_path)
 
             logging.info(f"Successfully created video for story {story.id}")
 
         except Exception as e:
-            error_msg = f"Failed to create video: {str(e)}"
-            logging.error(error_msg)
-            self.db_manager.update_story_status(
-                story.id, StoryStatus.VIDEO_ERROR, error_msg)
+            self._fail_video(story, e)
             raise
 
-    def process_ready_stories(self) -> None:
-        """Process all stories that are ready for video creation."""
+    def process_ready_stories(self, max_workers: Optional[int] = None) -> None:
+        """Process all stories that are ready for video creation.
+
+        Renders run in separate processes so one story's frame compositing
+        overlaps another's encoding; status updates stay in this process.
+        At most two submissions per worker are queued at a time, so stories
+        are only marked as processing shortly before a worker picks them up.
+        With ``render_batch_size`` above 1, each submission renders that many
+        stories in one ffmpeg process.
+
+        Args:
+            max_workers: Number of videos rendered at once; 1 renders
+                serially. Defaults to half the CPU cores.
+        """
         stories = self.get_stories_ready_for_video()
         if not stories:
             logging.info("No stories ready for video creation")
             return
 
+        if max_workers is None:
+            max_workers = default_render_workers()
+
         logging.info(f"Found {len(stories)} stories ready for video creation")
-        for story in stories:
+        if max_workers <= 1:
             try:
-                self.create_video_for_story(story)
-            except Exception as e:
-                logging.error(f"Failed to process story {story.id}: {str(e)}")
-                continue
+                for story in stories:
+                    try:
+                        self.create_video_for_story(story)
+                    except Exception as e:
+                        logging.error(
+                            f"Failed to process story {story.id}: {str(e)}")
+                        continue
+            finally:
+                close_source_clips()
+            return
+
+        # With the ffmpeg renderer, render_batch_size stories can share one
+        # ffmpeg process; each submission is one batch
+        batch_size = max(1, self.video_config.get('render_batch_size', 1))
+        worker_config = dict(self.video_config)
+        # Probe for a hardware encoder once here rather than in every worker
+        if worker_config.get('video_codec', 'auto') == 'auto':
+            worker_config['video_codec'] = resolve_encoder(worker_config)[0]
+        max_workers = capped_render_workers(
+            max_workers, worker_config['video_codec'], batch_size,
+            worker_config.get('max_encoder_sessions'))
+        # Split the cores between the workers' encoders instead of letting
+        # each one start a thread per core
+        if not worker_config.get('render_threads'):
+            worker_config['render_threads'] = max(1, (os.cpu_count() or 1) // max_workers)
+        pending_stories = iter(stories)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            while True:
+                batch = []
+                for story in pending_stories:
+                    # Any failure here skips the story; its status is only
+                    # set to VIDEO_PROCESSING once everything else succeeded
+                    try:
+                        batch.append((story, self._start_video(story)))
+                    except Exception as e:
+                        logging.error("Failed to process story %s: %s", story.id, e)
+                        continue
+                    if len(batch) == batch_size:
+                        break
+                if batch:
+                    jobs = [(output_path, story.audio_path, story.text, story.timestamps_path)
+                            for story, output_path in batch]
+                    futures[executor.submit(_render_batch, worker_config, jobs)] = batch
+                    if len(futures) < max_workers * 2:
+                        continue
+
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = futures.pop(future)
+                    try:
+                        errors = future.result()
+                    except Exception as e:
+                        errors = [str(e)] * len(batch)
+
+                    for (story, output_path), error in zip(batch, errors):
+                        # Record each story on its own so one failed update
+                        # doesn't strand the rest in VIDEO_PROCESSING
+                        try:
+                            if error is not None:
+                                self._fail_video(story, RuntimeError(error))
+                                continue
+                            self.db_manager.update_story_paths_and_status(
+                                story.id, StoryStatus.VIDEO_READY, subtitles_path=output_path)
+                            logging.info("Successfully created video for story %s", story.id)
+                        except Exception as e:
+                            logging.error("Failed to record video for story %s: %s",
+                                          story.id, e)
 
     def retry_failed_video(self, story_id: str) -> None:
         """Retry video creation for a failed story.
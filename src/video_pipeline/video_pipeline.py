@@ -1,15 +1,82 @@
+import bisect
 import os
-import json
+import orjson
 import logging
+import queue
+import stat
+import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from types import TracebackType
 from typing import List, Tuple, Optional, Dict, Union, Type
 from abc import ABC, abstractmethod
+import numpy as np
 from moviepy import *
+from moviepy.audio.AudioClip import AudioArrayClip
+from moviepy.config import FFMPEG_BINARY
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
 from moviepy.video.tools.subtitles import SubtitlesClip
 
-logging.basicConfig(level=logging.INFO,
-                    format='%(filename)s - %(lineno)d - %(asctime)s - %(levelname)s - %(message)s')
+from ..subtitle_processing.parsers import SubtitleParserFactory as WordSubtitleParserFactory
+from ..subtitle_processing.subtitle_atlas import CaptionStyle, SubtitleAtlasClip
+from .ffmpeg_renderer import (AUDIO_CHANNELS, AUDIO_FPS, HWACCEL_FOR_ENCODER, FfmpegRenderer,
+                              RenderJob, ffmpeg_available, resolve_encoder)
+
+# Write buffer for the raw-frame pipe into ffmpeg
+FRAME_PIPE_BUFFER = 1 << 20
+
+# Frames composed ahead of the ffmpeg writer; a 1080x1920 RGB frame is ~6 MB
+FRAME_QUEUE_SIZE = 8
+
+# Background sources opened once per process and shared by every render,
+# keyed by (kind, absolute path)
+_SOURCE_CLIPS: Dict[Tuple[str, str], Tuple[float, Union[VideoFileClip, AudioFileClip]]] = {}
+
+
+def open_source_clip(kind: str, path: str) -> Union[VideoFileClip, AudioFileClip]:
+    """Open a background video or music file once and reuse it.
+
+    Every story uses the same background assets, so keeping their readers
+    open saves an ffmpeg probe and process start per render. Derived clips
+    (subclips, effects) share the reader of the cached clip. The clip is
+    reopened if the file changes.
+
+    Args:
+        kind: 'audio', or 'video'; other video kinds such as 'video_tail'
+            open an independent reader on the same file
+        path: Path to the media file
+
+    Returns:
+        Union[VideoFileClip, AudioFileClip]: The shared clip
+    """
+    key = (kind, os.path.abspath(path))
+    mtime = os.path.getmtime(path)
+    cached = _SOURCE_CLIPS.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    if cached is not None:
+        cached[1].close()
+
+    # The background video's own audio is always replaced, so skip decoding it
+    clip = AudioFileClip(path) if kind == 'audio' else VideoFileClip(path, audio=False)
+    _SOURCE_CLIPS[key] = (mtime, clip)
+    return clip
+
+
+def is_shared_source(clip) -> bool:
+    """Check whether a clip reads from one of the shared source clips."""
+    reader = getattr(clip, 'reader', None)
+    return reader is not None and any(
+        reader is source.reader for _, source in _SOURCE_CLIPS.values())
+
+
+def close_source_clips() -> None:
+    """Close every shared source clip opened by this process."""
+    for _, clip in _SOURCE_CLIPS.values():
+        clip.close()
+    _SOURCE_CLIPS.clear()
 
 
 class InputValidator:
@@ -17,7 +84,8 @@ class InputValidator:
 
     Handles validation of input/output paths and duration compatibility checks."""
 
-    def validate_inputs(self, output_path: str, tts_path: str, music_path: str, video_path: str):
+    def validate_inputs(self, output_path: str, tts_path: str, music_path: str, video_path: str,
+                        subtitle_json: Optional[str] = None):
         """Validates existence and accessibility of all required input and output files.
 
         Args:
@@ -25,10 +93,14 @@ class InputValidator:
             tts_path: Path to text-to-speech audio file
             music_path: Path to background music file
             video_path: Path to input video file
+            subtitle_json: Optional path to the subtitle timing file; checked
+                here so a missing file fails before any audio is decoded
         """
         self._validate_file(tts_path, "TTS file")
         self._validate_file(music_path, "Music file")
         self._validate_file(video_path, "Video file")
+        if subtitle_json is not None:
+            self._validate_file(subtitle_json, "Subtitle file")
         self._validate_output_dir(output_path)
 
     def validate_durations(self, audio_duration: float, video_duration: float) -> None:
@@ -54,9 +126,14 @@ class InputValidator:
             path: Path to the file to validate
             file_desc: Description of the file (e.g., "TTS file", "Music file", "Video file")
         """
-        if not path or not os.path.exists(path):
+        # One stat call answers both questions
+        try:
+            mode = os.stat(path).st_mode if path else None
+        except OSError:
+            mode = None
+        if mode is None:
             raise FileNotFoundError(f"{file_desc} not found at {path}")
-        if not os.path.isfile(path):
+        if not stat.S_ISREG(mode):
             raise ValueError(f"{file_desc} is not a file")
 
     def _validate_output_dir(self, output_path: str):
@@ -66,11 +143,60 @@ class InputValidator:
             output_path: Path to the output video file
         """
         output_dir = os.path.dirname(output_path) or "."
+        # A writable directory passes with one access() call; only a
+        # failure needs the second check to tell the two cases apart
+        if os.access(output_dir, os.W_OK):
+            return
         if not os.path.exists(output_dir):
             raise FileNotFoundError(
                 f"Output directory not found at {output_dir}")
-        if not os.access(output_dir, os.W_OK):
-            raise PermissionError(f"No write access to {output_dir}")
+        raise PermissionError(f"No write access to {output_dir}")
+
+
+def _add_looped(target: np.ndarray, samples: np.ndarray) -> None:
+    """Add ``samples`` into ``target`` in place, looping or trimming them to fit.
+
+    Adds one repetition at a time instead of tiling the samples into a
+    full-length copy first.
+    """
+    for start in range(0, len(target), len(samples)):
+        chunk = target[start:start + len(samples)]
+        chunk += samples[:len(chunk)]
+
+
+@lru_cache(maxsize=2)
+def _load_music_samples(music_path: str, mtime: float, volume: float) -> np.ndarray:
+    """Decode background music once, peak-normalized and scaled to ``volume``.
+
+    Every story uses the same music, so the processed samples are kept for
+    the next render; ``mtime`` is only part of the cache key so an edited
+    file is decoded again.
+
+    Args:
+        music_path: Absolute path to the music file
+        mtime: Modification time of the file
+        volume: Volume to scale the normalized samples to
+
+    Returns:
+        np.ndarray: Read-only samples, shape (n_samples, channels)
+
+    Raises:
+        ValueError: If the file contains no audio
+    """
+    clip = AudioFileClip(music_path)
+    try:
+        samples = clip.to_soundarray(fps=AUDIO_FPS)
+    finally:
+        clip.close()
+    samples = samples.reshape(len(samples), -1)
+    if not len(samples):
+        raise ValueError(f"Background music is empty: {music_path}")
+
+    # Same result as AudioNormalize followed by with_volume_scaled
+    peak = np.abs(samples).max()
+    samples *= volume / peak if peak > 0 else volume
+    samples.setflags(write=False)
+    return samples
 
 
 class AudioProcessor:
@@ -84,18 +210,6 @@ class AudioProcessor:
         self.music_volume = config.get('music_volume', 0.3)
         self.fade_duration = config.get('fade_duration', 0.5)
 
-    def _adjust_volume(self, clip: AudioFileClip, volume: float) -> AudioFileClip:
-        """Adjusts the volume of an audio clip.
-
-        Args:
-            clip: The audio clip to adjust
-            volume: The volume level to set (1.0 is normal, 0.5 is half volume)
-
-        Returns:
-            AudioFileClip: Volume-adjusted audio clip
-        """
-        return clip.with_volume_scaled(volume)
-
     def _create_master_audio(self, duration: float) -> AudioClip:
         """Creates a master audio clip with the specified duration and no audio.
 
@@ -107,67 +221,66 @@ class AudioProcessor:
         """
         return AudioClip(duration=duration)
 
-    def _loop_music_to_duration(self, music_clip: AudioFileClip, target_duration: float) -> AudioFileClip:
-        """Loops or trims the background music to match the target duration.
+    def _narration_samples(self, tts_clip: AudioFileClip) -> np.ndarray:
+        """Decodes the narration with its fades, normalization and volume.
 
-        This method handles two scenarios:
-        1. If music is longer than target duration: Trims the music to fit
-        2. If music is shorter than target duration: Loops the music using moviepy's AudioLoop
-           effect to seamlessly fill the entire duration without abrupt transitions
+        Chaining AudioFadeIn, AudioFadeOut, AudioNormalize and
+        with_volume_scaled decodes the file twice, once for AudioNormalize to
+        find the peak and again when the samples are read, and evaluates each
+        effect per chunk. Here the file is decoded once and the same linear
+        fades and peak gain are applied to the array.
 
         Args:
-            music_clip: The background music clip to process
-            target_duration: The desired final duration in seconds
+            tts_clip: The TTS audio clip to process
 
         Returns:
-            AudioFileClip: A new audio clip that exactly matches the target duration, either
-                         trimmed or seamlessly looped using AudioLoop effect
+            np.ndarray: Processed samples, shape (n_samples, channels)
         """
-        if music_clip.duration >= target_duration:
-            return music_clip.subclipped(0, target_duration)
-
-        # Use AudioLoop effect to loop the music
-        return music_clip.with_effects([afx.AudioLoop(duration=target_duration)])
+        samples = tts_clip.to_soundarray(fps=AUDIO_FPS)
+        samples = samples.reshape(len(samples), -1)
 
-    def _apply_tts_effects(self, tts_clip: AudioFileClip) -> AudioFileClip:
-        """Applies fade in/out effects to the TTS audio.
+        if self.fade_duration > 0:
+            t = np.arange(len(samples)) / AUDIO_FPS
+            envelope = np.minimum(t, tts_clip.duration - t) / self.fade_duration
+            samples *= np.minimum(envelope, 1)[:, None]
 
-        Adds a subtle fade in at the start and fade out at the end of the TTS
-        to create smoother transitions and avoid abrupt audio changes.
-
-        Args:
-            tts_clip: The TTS audio clip to process
+        peak = np.abs(samples).max(initial=0)
+        samples *= self.tts_volume / peak if peak > 0 else self.tts_volume
+        return samples
 
-        Returns:
-            AudioFileClip: TTS clip with fade effects applied
-        """
-        return tts_clip.with_effects([
-            afx.AudioFadeIn(self.fade_duration),
-            afx.AudioFadeOut(self.fade_duration)
-        ])
+    def _premix(self, narration: np.ndarray, music: np.ndarray) -> AudioArrayClip:
+        """Mixes narration and music into one sample array.
 
-    def _normalize_volume(self, clip: AudioFileClip) -> AudioFileClip:
-        """ Normalizes the volume of an audio clip based on the afx.AudioNormalize module from moviepy.
+        CompositeAudioClip re-reads and sums both sources for every chunk the
+        renderer pulls; rendering both once and adding them with NumPy leaves
+        a plain array for the encoder.
 
         Args:
-            clip: The audio clip to normalize
+            narration: Processed narration samples, which set the length
+            music: Processed background music samples; they are looped or
+                trimmed to the narration length as they are added
 
         Returns:
-            AudioFileClip: Normalized audio clip
+            AudioArrayClip: The mixed audio
         """
-        return clip.with_effects([afx.AudioNormalize()])
+        mixed = narration
+        if mixed.shape[1] < music.shape[1]:
+            # Mono narration over stereo music
+            mixed = np.repeat(mixed, music.shape[1], axis=1)
+        _add_looped(mixed, music)
+        return AudioArrayClip(mixed, fps=AUDIO_FPS)
 
     def process_audio(self, tts_path: str, music_path: str) -> AudioFileClip:
         """Creates a synchronized audio composition from TTS and background music.
 
         This method implements a multi-step audio processing pipeline:
-        1. Loads the TTS and background music clips from their respective paths
+        1. Loads the TTS clip and the background music samples, which are decoded,
+           normalized and volume-adjusted once and reused across renders
         2. Uses the TTS duration as the master duration for the final composition
-        3. Applies fade in/out effects to the TTS audio for smooth transitions
-        4. Normalizes both TTS and background music using AudioNormalize effect
-        5. Adjusts the volume levels of both clips according to configured settings
-        6. Adapts the background music to match the TTS duration through looping or trimming
-        7. Combines both audio streams into a final composite clip
+        3. Decodes the TTS once, applying fade in/out for smooth transitions,
+           peak normalization and the configured volume to the samples
+        4. Adapts the background music to match the TTS duration through looping or trimming
+        5. Mixes both audio streams into a single sample array
 
         Args:
             tts_path: Path to the text-to-speech audio file that will drive the timing
@@ -182,48 +295,123 @@ class AudioProcessor:
             FileNotFoundError: If either the TTS or music file cannot be found
             IOError: If there are issues reading or processing the audio files
         """
-        # Verify files exist before attempting to load them
+        # Verify files exist before attempting to load them; the music's
+        # existence check is the same stat that keys its sample cache
         if not os.path.exists(tts_path):
             raise FileNotFoundError(f"TTS audio file not found: {tts_path}")
-        if not os.path.exists(music_path):
+        try:
+            music_mtime = os.stat(music_path).st_mtime
+        except FileNotFoundError:
             raise FileNotFoundError(
-                f"Background music file not found: {music_path}")
+                f"Background music file not found: {music_path}") from None
 
         try:
-            # Load the audio clips
+            # Load the audio; the processed music is shared between renders
             tts_clip = AudioFileClip(tts_path)
-            music_clip = AudioFileClip(music_path)
-
-            # Use TTS duration as the master duration
-            master_duration = tts_clip.duration
-
-            # Apply fade effects to TTS
-            tts_clip = self._apply_tts_effects(tts_clip)
+            music = _load_music_samples(
+                os.path.abspath(music_path), music_mtime, self.music_volume)
 
-            # Normalize all audio clips
-            tts_clip = self._normalize_volume(tts_clip)
-            music_clip = self._normalize_volume(music_clip)
+            # Fade, normalize and adjust the TTS volume in one decode; the
+            # narration reader is no longer needed afterwards
+            narration = self._narration_samples(tts_clip)
+            tts_clip.close()
 
-            # Adjust volumes
-            tts_clip = self._adjust_volume(tts_clip, self.tts_volume)
-            music_clip = self._adjust_volume(music_clip, self.music_volume)
-
-            # Loop music to match TTS duration
-            music_clip = self._loop_music_to_duration(
-                music_clip, master_duration)
-
-            # Merge audio and return
-            return CompositeAudioClip([tts_clip, music_clip])
+            # Loop or trim the music to the TTS length and mix once up front
+            return self._premix(narration, music)
         except (IOError, OSError, ValueError) as e:
             # Clean up any open clips important to avoid memory leaks
             try:
                 tts_clip.close()
-                music_clip.close()
             except (IOError, OSError):
                 pass
             raise IOError(f"Error processing audio files: {str(e)}") from e
 
 
+# GOP length of the cached background copy
+KEYFRAME_INTERVAL = 30
+
+
+def _scale_command(video_path: str, height: int, output_path: str,
+                   use_cuda: bool) -> List[str]:
+    """Build the ffmpeg command that writes the scaled background copy.
+
+    With CUDA, frames are decoded, scaled and encoded on the GPU without
+    ever being copied back to system memory.
+    """
+    gop = ['-g', str(KEYFRAME_INTERVAL), '-bf', '0']
+    if use_cuda:
+        return [FFMPEG_BINARY, '-y', '-loglevel', 'error',
+                '-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda',
+                '-i', video_path, '-vf', f'scale_cuda=-2:{height}', '-an',
+                '-c:v', 'h264_nvenc', '-preset', 'p4', '-rc', 'vbr',
+                '-cq', '18', '-b:v', '0', *gop, '-no-scenecut', '1',
+                output_path]
+    return [FFMPEG_BINARY, '-y', '-loglevel', 'error', '-i', video_path,
+            '-vf', f'scale=-2:{height}', '-an',
+            '-c:v', 'libx264', '-preset', 'veryfast', '-crf', '18',
+            *gop, '-keyint_min', str(KEYFRAME_INTERVAL), '-sc_threshold', '0',
+            output_path]
+
+
+def _cached_resized_video(video_path: str, height: int, use_cuda: bool = False,
+                          timeout: Optional[float] = None) -> Optional[str]:
+    """Return a copy of the background video pre-scaled to ``height``.
+
+    The scaled copy is written once next to the source (in ``.cache/``) and
+    reused until the source changes, so each render reads frames that are
+    already the right size instead of resizing every frame in Python. It is
+    encoded with a keyframe every ``KEYFRAME_INTERVAL`` frames and no
+    B-frames, so seeks and subclips decode at most one short GOP.
+
+    Args:
+        video_path: Path to the source background video
+        height: Target frame height
+        use_cuda: Try a GPU-only decode, scale and encode first, falling
+            back to the CPU if this ffmpeg build or device can't do it
+        timeout: Seconds allowed per ffmpeg attempt, so a corrupt source
+            can't stall the render queue
+
+    Returns:
+        Optional[str]: Path to the scaled copy, or None if ffmpeg failed or
+            timed out
+    """
+    cache_dir = os.path.join(os.path.dirname(video_path) or '.', '.cache')
+    stem = os.path.splitext(os.path.basename(video_path))[0]
+    cache_path = os.path.join(
+        cache_dir, f"{stem}_h{height}_g{KEYFRAME_INTERVAL}.mp4")
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(video_path):
+            return cache_path
+    except OSError:
+        pass
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a per-process temp name so concurrent renders don't collide
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp.mp4"
+    logging.info("Caching background video scaled to height %d: %s",
+                 height, cache_path)
+    try:
+        if use_cuda:
+            try:
+                subprocess.run(_scale_command(video_path, height, tmp_path, True),
+                               check=True, stderr=subprocess.DEVNULL, timeout=timeout)
+            except subprocess.CalledProcessError:
+                logging.info("GPU scaling unavailable, scaling on the CPU")
+                use_cuda = False
+        if not use_cuda:
+            subprocess.run(_scale_command(video_path, height, tmp_path, False),
+                           check=True, timeout=timeout)
+        os.replace(tmp_path, cache_path)
+        return cache_path
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.warning("Could not cache scaled background video: %s", e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return None
+
+
 class VideoProcessor:
     def __init__(self, config: Dict):
         self.config = config
@@ -238,12 +426,34 @@ class VideoProcessor:
         self.fade_duration = config.get('fade_duration', 0.5)
         self.resolution = config.get('vertical_resolution', (1080, 1920))
         self.loop_overlap = config.get('loop_overlap_duration', 1.0)
+        self.render_timeout = config.get('render_timeout', 600)
+        self.cache_background = config.get('cache_background', True)
 
     def _resize_video(self, clip: VideoFileClip) -> VideoFileClip:
-        """Resizes video to match target resolution while maintaining aspect ratio."""
+        """Resizes video to match target resolution while maintaining aspect ratio.
+
+        A clip that is already the target height is returned as is, so its
+        frames are not run through a no-op resize.
+        """
+        if clip.size[1] == self.resolution[0]:
+            return clip
         return clip.with_effects([vfx.Resize(height=self.resolution[0])])
 
-    def _loop_video_to_duration(self, clip: VideoFileClip, target_duration: float) -> VideoFileClip:
+    def _make_loopable(self, clip: VideoFileClip, tail_clip: VideoFileClip) -> VideoFileClip:
+        """Crossfades the clip's end into its start, like vfx.MakeLoopable.
+
+        MakeLoopable overlays the clip on itself, so during the overlap every
+        frame needs two reads far apart in one reader and ffmpeg re-seeks
+        twice per frame. Reading the overlaid copy from ``tail_clip``, a
+        second reader on the same file, keeps both readers sequential.
+        """
+        overlap = self.loop_overlap
+        tail = tail_clip.with_effects([vfx.CrossFadeIn(overlap)]).with_start(
+            clip.duration - overlap)
+        return CompositeVideoClip([clip, tail]).subclipped(overlap, clip.duration)
+
+    def _loop_video_to_duration(self, clip: VideoFileClip, target_duration: float,
+                                tail_clip: Optional[VideoFileClip] = None) -> VideoFileClip:
         """Loops or trims video to match target duration.
 
         If video is shorter than target, makes it loopable with a smooth transition
@@ -253,21 +463,30 @@ class VideoProcessor:
         Args:
             clip: The video clip to process
             target_duration: Target duration in seconds
+            tail_clip: Optional second reader on the same video, used for the
+                loop transition so it does not seek back and forth
 
         Returns:
             VideoFileClip: A video clip matching the target duration, either trimmed
                          or smoothly looped with overlap transitions
         """
-        if clip.duration >= target_duration:
+        if clip.duration == target_duration:
+            return clip
+        if clip.duration > target_duration:
             return clip.subclipped(0, target_duration)
 
         # Make the clip loopable with a smooth transition
-        loopable = clip.with_effects([vfx.MakeLoopable(self.loop_overlap)])
+        if tail_clip is not None:
+            loopable = self._make_loopable(clip, tail_clip)
+        else:
+            loopable = clip.with_effects([vfx.MakeLoopable(self.loop_overlap)])
         # Loop it to reach target duration
         return loopable.loop(n=None, duration=target_duration)
 
     def _apply_video_effects(self, clip: VideoFileClip) -> VideoFileClip:
-        """Applies fade in/out effects to video."""
+        """Applies fade in/out effects to video, unless fades are disabled."""
+        if self.fade_duration <= 0:
+            return clip
         return clip.with_effects([vfx.CrossFadeIn(self.fade_duration), vfx.CrossFadeOut(self.fade_duration)])
 
     def _report_dimensions(self, clip: VideoFileClip) -> None:
@@ -279,6 +498,29 @@ class VideoProcessor:
         logging.info("Video dimensions: %dx%d", self.w_detail, self.h_detail)
         logging.info("Video duration: %s", self.duration)
 
+    def _source_path(self, video_path: str) -> Tuple[str, bool]:
+        """Return the file to read the background from, and whether it is pre-scaled."""
+        scaled_path = None
+        if self.cache_background:
+            # Scale on the GPU when renders will encode with NVENC anyway
+            use_cuda = HWACCEL_FOR_ENCODER.get(resolve_encoder(self.config)[0]) == 'cuda'
+            scaled_path = _cached_resized_video(
+                video_path, self.resolution[0], use_cuda, self.render_timeout or None)
+        return scaled_path or video_path, scaled_path is not None
+
+    def prefetch(self, video_path: str) -> None:
+        """Open the background ahead of ``process_video``.
+
+        Creates the scaled copy if needed and opens the shared source clip,
+        so the later ``process_video`` call finds both ready. Safe to run
+        in another thread while audio is processed, but not alongside
+        ``process_video``.
+
+        Args:
+            video_path: Path to input video file
+        """
+        open_source_clip('video', self._source_path(video_path)[0])
+
     def process_video(self, video_path: str, target_duration: float) -> VideoFileClip:
         """Processes video by loading, resizing, applying effects, and adjusting duration.
 
@@ -297,21 +539,28 @@ class VideoProcessor:
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
         try:
-            # Load video
-            video_clip = VideoFileClip(video_path)
+            # Load video, reusing a pre-scaled copy when one can be made
+            source_path, scaled = self._source_path(video_path)
+            video_clip = open_source_clip('video', source_path)
             self._report_dimensions(video_clip)
             # Process the video
-            video_clip = self._resize_video(video_clip)
+            if not scaled:
+                video_clip = self._resize_video(video_clip)
+            tail_clip = None
+            if video_clip.duration < target_duration:
+                tail_clip = open_source_clip('video_tail', source_path)
+                if not scaled:
+                    tail_clip = self._resize_video(tail_clip)
             video_clip = self._loop_video_to_duration(
-                video_clip, target_duration)
-            video_clip = self._apply_video_effects(video_clip)
-            self._report_dimensions(video_clip)
-
-            return video_clip
+                video_clip, target_duration, tail_clip)
+            # The final size is logged by the pipeline; the source was
+            # reported above
+            return self._apply_video_effects(video_clip)
 
         except (IOError, OSError) as e:
             try:
-                video_clip.close()
+                if not is_shared_source(video_clip):
+                    video_clip.close()
             except (IOError, OSError):
                 pass
             raise IOError(f"Error processing video file: {str(e)}") from e
@@ -380,7 +629,9 @@ class WhisperSubtitleParser(SubtitleParser):
         text_length = len(text)
 
         while current_pos < text_length:
-            remaining_text = text[current_pos:]
+            # The split point never looks past max_chars + 1 characters, so
+            # copy only that window rather than the whole remaining text
+            remaining_text = text[current_pos:current_pos + max_chars + 1]
             split_point = find_best_split_point(remaining_text, max_chars)
 
             chunk = remaining_text[:split_point].strip()
@@ -420,8 +671,8 @@ class WhisperSubtitleParser(SubtitleParser):
     def parse(self, json_path: str) -> List[Tuple[Tuple[float, float], str]]:
         """Parse Whisper JSON output to create subtitle entries."""
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_path, 'rb') as f:
+                data = orjson.loads(f.read())
 
             if 'segments' not in data:
                 raise ValueError(
@@ -449,7 +700,7 @@ class WhisperSubtitleParser(SubtitleParser):
         except FileNotFoundError:
             logging.error("Whisper JSON file not found: %s", json_path)
             raise
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logging.error("Invalid JSON format in %s: %s", json_path, str(e))
             raise ValueError(f"Invalid JSON format: {str(e)}")
         except Exception as e:
@@ -463,8 +714,8 @@ class ElevenLabsSubtitleParser(SubtitleParser):
     def parse(self, json_path: str) -> List[Tuple[Tuple[float, float], str]]:
         """Parse ElevenLabs JSON output to create subtitle entries with character-level timing."""
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                subtitle_data_list = json.load(f)
+            with open(json_path, 'rb') as f:
+                subtitle_data_list = orjson.loads(f.read())
 
             all_characters = []
             all_start_times = []
@@ -481,51 +732,69 @@ class ElevenLabsSubtitleParser(SubtitleParser):
                 all_start_times.extend(
                     segment['character_start_times_seconds'])
 
-            char_timings = list(zip(all_characters, all_start_times))
-
-            subtitle_entries = []
             current_text = []
-            segment_start = char_timings[0][1]
+            segment_start = all_start_times[0]
             last_char_end = segment_start
             max_segment_chars = 60
 
-            for i, (char, start_time) in enumerate(char_timings):
-                current_text.append(char)
-                last_char_end = start_time + 0.1
-
-                break_conditions = [
-                    char in {'.', '!', '?', ','},
-                    char == ' ' and (start_time - segment_start) > 1.5,
-                    len(current_text) >= max_segment_chars,
-                    i < len(char_timings) -
-                    1 and char_timings[i+1][1] - start_time > 0.5
-                ]
+            # Punctuation and pauses of over 0.5s before the next character end
+            # a caption wherever it started, so find them all up front; only
+            # the slow-space and length rules depend on the caption start
+            # A fixed-width string array keeps the comparisons in C; an
+            # object array would compare each character in Python
+            chars = np.array(all_characters, dtype=str)
+            times = np.asarray(all_start_times, dtype=float)
+            fixed_breaks = np.isin(chars, ['.', '!', '?', ','])
+            fixed_breaks[:-1] |= np.diff(times) > 0.5
+            # The loop below runs once per caption on scalars, where bisect on
+            # plain lists is far cheaper than a NumPy call per lookup
+            fixed_break_idx = np.flatnonzero(fixed_breaks).tolist()
+            space_idx = np.flatnonzero(chars == ' ').tolist()
+
+            caption_starts = []
+            caption_last_ends = []
+            caption_texts = []
+            pos = 0
+            while pos < len(all_characters):
+                segment_start = all_start_times[pos]
+                end = pos + max_segment_chars - 1
+
+                k = bisect.bisect_left(fixed_break_idx, pos)
+                if k < len(fixed_break_idx):
+                    end = min(end, fixed_break_idx[k])
+
+                for k in range(bisect.bisect_left(space_idx, pos),
+                               bisect.bisect_left(space_idx, end)):
+                    if all_start_times[space_idx[k]] - segment_start > 1.5:
+                        end = space_idx[k]
+                        break
+
+                current_text = all_characters[pos:end + 1]
+                if end >= len(all_characters):
+                    # Ran out of text before any break
+                    last_char_end = all_start_times[-1] + 0.1
+                    break
+                last_char_end = all_start_times[end] + 0.1
 
-                if any(break_conditions):
-                    text = ''.join(current_text).strip()
-                    if len(current_text) >= max_segment_chars:
-                        text += '...'
-
-                    word_count = len(text.split())
-
-                    base_buffer = 0.8
-                    word_based_buffer = 1 * word_count
-                    buffer = min(max(base_buffer, word_based_buffer), 3.5)
-
-                    base_min_duration = 0.8
-                    word_based_min = 1 * word_count
-                    min_duration = min(
-                        max(base_min_duration, word_based_min), 3.5)
+                text = ''.join(current_text).strip()
+                if len(current_text) >= max_segment_chars:
+                    text += '...'
 
-                    end_time = last_char_end + buffer
-                    if (end_time - segment_start) < min_duration:
-                        end_time = segment_start + min_duration
+                caption_starts.append(segment_start)
+                caption_last_ends.append(last_char_end)
+                caption_texts.append(text)
 
-                    subtitle_entries.append(((segment_start, end_time), text))
+                current_text = []
+                pos = end + 1
 
-                    current_text = []
-                    if i < len(char_timings)-1:
-                        segment_start = char_timings[i+1][1]
+            # Captions linger one second per word, between 0.8s and 3.5s,
+            # after their last character, and stay up at least that long
+            starts = np.array(caption_starts, dtype=float)
+            linger = np.clip([len(text.split()) for text in caption_texts], 0.8, 3.5)
+            end_times = np.array(caption_last_ends, dtype=float) + linger
+            end_times = np.where(end_times - starts < linger, starts + linger, end_times)
+            subtitle_entries = [((start, end_time), text) for start, end_time, text
+                                in zip(caption_starts, end_times.tolist(), caption_texts)]
 
             if current_text:
                 text = ''.join(current_text).strip()
@@ -570,6 +839,10 @@ class SubtitleParserFactory:
     def detect_format(json_path: str) -> str:
         """Detect the format of the JSON file.
 
+        Only the first bytes are read: Whisper output is a JSON object and
+        ElevenLabs output a JSON array. The chosen parser validates the full
+        structure when it loads the file, so the file is parsed only once.
+
         Args:
             json_path: Path to the JSON file
 
@@ -580,17 +853,14 @@ class SubtitleParserFactory:
             ValueError: If JSON format cannot be determined
         """
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_path, 'rb') as f:
+                head = f.read(64).lstrip(b'\xef\xbb\xbf \t\r\n')
 
-            if 'segments' in data and isinstance(data['segments'], list):
-                if data['segments'] and all(key in data['segments'][0] for key in ['start', 'end', 'text']):
-                    return 'whisper'
+            if head.startswith(b'{'):
+                return 'whisper'
 
-            if isinstance(data, list) and data:
-                first_item = data[0]
-                if all(key in first_item for key in ['characters', 'character_start_times_seconds']):
-                    return 'elevenlabs'
+            if head.startswith(b'['):
+                return 'elevenlabs'
 
             raise ValueError(
                 "Unknown JSON format - neither Whisper nor ElevenLabs format detected")
@@ -621,17 +891,32 @@ class SubtitleParserFactory:
             raise ValueError(f"Unsupported subtitle format: {format_type}")
 
 
+@lru_cache(maxsize=32)
+def _parse_subtitle_file(parser_factory: Type[SubtitleParserFactory], json_path: str,
+                         mtime: float) -> Tuple[Tuple[Tuple[float, float], str], ...]:
+    """Parse a subtitle JSON file once per modification time.
+
+    ``mtime`` is only part of the cache key, so an edited file is parsed again.
+    """
+    parser = parser_factory.create_parser(json_path)
+    return tuple(parser.parse(json_path))
+
+
 class SubtitleEngine:
     def __init__(self, config: Dict, parser_factory: Optional[Type[SubtitleParserFactory]] = None):
         """Initialize the SubtitleEngine.
 
         Args:
             config: Configuration dictionary
-            parser_factory: Optional custom parser factory class. If None, uses default SubtitleParserFactory.
+            parser_factory: Optional custom parser factory class. If None, uses default SubtitleParserFactory,
+                or the word-level parsers when ``word_subtitles`` is enabled.
         """
         self.config = config
         self._parse_config(config)
-        self.parser_factory = parser_factory or SubtitleParserFactory
+        # Word-level captions are short and repeat often, so they are cheaper
+        # to rasterize and mostly hit the shared caption cache
+        self.parser_factory = parser_factory or (
+            WordSubtitleParserFactory if self.word_subtitles else SubtitleParserFactory)
 
     def _parse_config(self, config: Dict) -> None:
         self.font_path = config.get('font_path', 'Arial-Bold')
@@ -641,12 +926,16 @@ class SubtitleEngine:
         self.stroke_width = config.get('stroke_width', 2)
         self.resolution = config.get('vertical_resolution', (1080, 1920))
         self.subtitle_position = config.get('subtitle_position', ('center', 0.85))
+        self.word_subtitles = config.get('word_subtitles', False)
+        self.caption_style = CaptionStyle(
+            self.font_path, self.font_size, self.subtitle_color,
+            self.stroke_color, self.stroke_width, self.resolution[0])
 
     def _effect_subtitles(self, subtitles: SubtitlesClip) -> SubtitlesClip:
         # Add a fade in and fade out effect to the subtitles
         return subtitles.with_effects([vfx.CrossFadeIn(0.1), vfx.CrossFadeOut(0.1)])
 
-    def generate_subtitles(self, text: str, duration: float, subtitle_json: Optional[str] = None) -> SubtitlesClip:
+    def generate_subtitles(self, text: str, duration: float, subtitle_json: Optional[str] = None) -> VideoClip:
         """
         Generates a SubtitlesClip for the video using the provided text and timing information.
 
@@ -656,63 +945,68 @@ class SubtitleEngine:
             subtitle_json: Optional path to a JSON file with timing information.
 
         Returns:
-            SubtitlesClip: A moviepy SubtitlesClip generated based on the timing data.
+            VideoClip: A subtitle overlay clip generated based on the timing data.
         """
-        def text_clip_generator(txt):
-            return TextClip(
-                text=txt,
-                font=self.font_path,
-                font_size=self.font_size,
-                color=self.subtitle_color,
-                stroke_color=self.stroke_color,
-                stroke_width=self.stroke_width,
-                method="caption",
-                size=(self.resolution[0], None),
-                text_align="center"
+        entries = self.get_entries(text, duration, subtitle_json)
+        if not entries:
+            return SubtitlesClip(
+                [],
+                make_textclip=self.caption_style.make_textclip,
+                encoding='utf-8'
             )
 
-        if subtitle_json is not None:
-            try:
-                # Use the parser factory to get the appropriate parser
-                parser = self.parser_factory.create_parser(subtitle_json)
-                subtitle_entries = parser.parse(subtitle_json)
+        # Each distinct caption is rendered once, and common ones are reused
+        # from earlier videos with the same style
+        subtitles = SubtitleAtlasClip(entries, style=self.caption_style)
+
+        subtitles = subtitles.with_position(
+            self.subtitle_position, relative=True)
 
-                subtitles = SubtitlesClip(
-                    subtitle_entries,
-                    make_textclip=text_clip_generator
-                )
+        return self._effect_subtitles(subtitles)
+
+    def prefetch(self, subtitle_json: str) -> None:
+        """Parse a subtitle file ahead of ``generate_subtitles``.
+
+        Parsing needs no audio duration, so it can run while the audio is
+        processed; the result lands in the shared parse cache.
+
+        Args:
+            subtitle_json: Path to a JSON file with timing information.
+        """
+        json_path = os.path.abspath(subtitle_json)
+        _parse_subtitle_file(self.parser_factory, json_path, os.path.getmtime(json_path))
 
-                subtitles = subtitles.with_position(
-                    self.subtitle_position, relative=True)
+    def get_entries(self, text: str, duration: float, subtitle_json: Optional[str] = None) -> List[Tuple[Tuple[float, float], str]]:
+        """Builds the timed subtitle entries without rendering them.
 
-                return self._effect_subtitles(subtitles)
+        Args:
+            text: The complete subtitle text, used when there is no JSON.
+            duration: Total duration of the audio/video.
+            subtitle_json: Optional path to a JSON file with timing information.
 
+        Returns:
+            List of ((start_time, end_time), text) entries.
+        """
+        if subtitle_json is not None:
+            try:
+                # Use the parser factory to get the appropriate parser; the
+                # result is reused if the same file is rendered again
+                json_path = os.path.abspath(subtitle_json)
+                return list(_parse_subtitle_file(
+                    self.parser_factory, json_path, os.path.getmtime(json_path)))
             except Exception as e:
                 logging.error(
                     "Error generating subtitles from JSON: %s", str(e))
                 raise
-        else:
-            cleaned_text = text.strip()
-            if not cleaned_text:
-                return SubtitlesClip(
-                    [],
-                    make_textclip=text_clip_generator,
-                    encoding='utf-8'
-                )
-
-            if duration <= 0:
-                raise ValueError("Duration must be positive to generate subtitles")
-
-            subtitles = SubtitlesClip(
-                [((0, duration), cleaned_text)],
-                make_textclip=text_clip_generator,
-                encoding='utf-8'
-            )
 
-            subtitles = subtitles.with_position(
-                self.subtitle_position, relative=True)
+        cleaned_text = text.strip()
+        if not cleaned_text:
+            return []
+
+        if duration <= 0:
+            raise ValueError("Duration must be positive to generate subtitles")
 
-            return self._effect_subtitles(subtitles)
+        return [((0, duration), cleaned_text)]
 
 
 class VideoCompositor:
@@ -723,6 +1017,8 @@ class VideoCompositor:
     def _parse_config(self, config: Dict) -> None:
         self.output_path = config.get('output_path', 'output.mp4')
         self.panic_mode = config.get('panic_mode', False)
+        # Seconds allowed per render before a stuck ffmpeg is killed
+        self.render_timeout = config.get('render_timeout', 600)
 
     def _apply_panic_effects(self, clip: VideoFileClip) -> VideoFileClip:
         """Applies a series of attention-grabbing effects to the video when in panic mode."""
@@ -754,7 +1050,10 @@ class VideoCompositor:
                 "🚨 PANIC MODE ACTIVATED! Applying chaotic video effects 🚨")
             video_clip = self._apply_panic_effects(video_clip)
 
-        # Combine with subtitles
+        # Combine with subtitles. Atlas captions are blended in place into
+        # reused frame buffers; enough are kept for the frames queued in render
+        if isinstance(subtitles_clip, SubtitleAtlasClip):
+            return subtitles_clip.overlay_on(video_clip, buffers=FRAME_QUEUE_SIZE + 2)
         return CompositeVideoClip([video_clip, subtitles_clip])
 
     def render(self, clip: VideoFileClip, output_path: str, fps: int = 30) -> None:
@@ -765,11 +1064,96 @@ class VideoCompositor:
             output_path: The path to save the rendered video file
             fps: The frame rate of the output video (default: 30)
 
+        Raises:
+            RuntimeError: If ffmpeg exits with an error or runs longer than
+                ``render_timeout`` seconds
+
         Note:
-            The video is rendered using the libx264 codec for optimal file size
-            and quality balance in short-form vertical video content.
+            The video is rendered with a hardware H.264 encoder (NVENC, Quick
+            Sync or VideoToolbox) when one works, otherwise with libx264.
+            Set ``video_codec`` to pick an encoder explicitly, or
+            ``hardware_encoding`` to False to force libx264.
+
+            The audio is mixed down to a WAV file once, then raw frames are
+            piped into a single ffmpeg process that encodes and muxes both,
+            instead of write_videofile's separate audio pass and remux. A
+            writer thread feeds the pipe from a bounded queue, so composing
+            the next frames overlaps with ffmpeg consuming earlier ones.
         """
-        clip.write_videofile(output_path, codec='libx264', fps=fps)
+        codec, codec_params = resolve_encoder(self.config)
+        width, height = clip.size
+
+        audio_path = None
+        if clip.audio is not None:
+            audio_path = os.path.splitext(output_path)[0] + '.audio.wav'
+            clip.audio.write_audiofile(audio_path, fps=AUDIO_FPS, logger=None)
+
+        cmd = [
+            FFMPEG_BINARY, '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-s', f"{width}x{height}", '-r', str(fps), '-i', '-'
+        ]
+        if audio_path:
+            cmd += ['-i', audio_path, '-c:a', 'aac', '-ac', str(AUDIO_CHANNELS)]
+        cmd += ['-c:v', codec, *codec_params, '-pix_fmt', 'yuv420p',
+                '-movflags', '+faststart', output_path]
+
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                stderr=subprocess.PIPE, bufsize=FRAME_PIPE_BUFFER)
+        frames = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+        pipe_closed = threading.Event()
+
+        def write_frames() -> None:
+            # Keep draining after a failure so the producer never blocks
+            while (frame := frames.get()) is not None:
+                if pipe_closed.is_set():
+                    continue
+                try:
+                    proc.stdin.write(frame.data)
+                except OSError:
+                    pipe_closed.set()  # ffmpeg exited early; its stderr says why
+
+        # A stuck encoder would block the pipe and with it this loop; killing
+        # it fails the writes, which ends the loop
+        timed_out = threading.Event()
+
+        def kill_encoder() -> None:
+            timed_out.set()
+            proc.kill()
+
+        watchdog = None
+        if self.render_timeout:
+            watchdog = threading.Timer(self.render_timeout, kill_encoder)
+            watchdog.daemon = True
+            watchdog.start()
+
+        writer = threading.Thread(target=write_frames, daemon=True)
+        writer.start()
+        try:
+            for frame in clip.iter_frames(fps=fps, dtype='uint8'):
+                if pipe_closed.is_set():
+                    break
+                frames.put(np.ascontiguousarray(frame))
+        finally:
+            frames.put(None)
+            writer.join()
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            stderr = proc.stderr.read()
+            proc.wait()
+            if watchdog is not None:
+                watchdog.cancel()
+            if audio_path and os.path.exists(audio_path):
+                os.remove(audio_path)
+
+        if timed_out.is_set() and proc.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg render timed out after {self.render_timeout:.0f} seconds")
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg render failed: {stderr.decode(errors='replace').strip()}")
 
 
 class VideoPipeline:
@@ -781,7 +1165,8 @@ class VideoPipeline:
             'audio_processor': AudioProcessor(config),
             'video_processor': VideoProcessor(config),
             'subtitle_engine': SubtitleEngine(config),
-            'compositor': VideoCompositor(config)
+            'compositor': VideoCompositor(config),
+            'ffmpeg_renderer': FfmpegRenderer(config)
         }
         self._active_clips: Dict[str, Union[VideoFileClip,
                                             AudioFileClip, SubtitlesClip]] = {}
@@ -859,7 +1244,8 @@ class VideoPipeline:
         cleanup_errors = []
         for clip_id, clip in self._active_clips.items():
             try:
-                if clip is not None:
+                # Shared background sources stay open for the next render
+                if clip is not None and not is_shared_source(clip):
                     clip.close()
                     logging.debug("Successfully closed clip: %s", clip_id)
             except Exception as e:
@@ -876,6 +1262,74 @@ class VideoPipeline:
 
         logging.info("Cleanup completed successfully")
 
+    def _use_ffmpeg(self) -> bool:
+        """Decide whether to render with a single ffmpeg command.
+
+        The ``renderer`` config key selects "ffmpeg", "moviepy" or "auto"
+        (the default), which uses ffmpeg whenever it is installed. Panic mode
+        needs MoviePy's time-warp effect, so it always renders with MoviePy.
+        """
+        renderer = self.config.get('renderer', 'auto')
+        if renderer == 'moviepy' or self.config.get('panic_mode', False):
+            return False
+        return renderer == 'ffmpeg' or ffmpeg_available()
+
+    def _execute_ffmpeg(self, output_path: str, tts_path: str, music_path: str,
+                        video_path: str, text: str, subtitle_json: Optional[str],
+                        fps: int) -> None:
+        """Render the video in one ffmpeg pass without decoding frames in Python."""
+        job = self._render_job(output_path, tts_path, text, subtitle_json)
+        logging.info("Rendering video, audio, and subtitles with ffmpeg")
+        self.components['ffmpeg_renderer'].render(
+            output_path, tts_path, music_path, self._background_path(video_path),
+            job.duration, job.entries, fps=fps)
+
+    def _render_job(self, output_path: str, tts_path: str, text: str,
+                    subtitle_json: Optional[str]) -> RenderJob:
+        """Measure the narration and build the subtitles for an ffmpeg render."""
+        duration = ffmpeg_parse_infos(tts_path)['duration']
+        logging.info("Narration duration: %.2f seconds", duration)
+        entries = self.components['subtitle_engine'].get_entries(
+            text, duration, subtitle_json)
+        return RenderJob(output_path, tts_path, duration, entries)
+
+    def _background_path(self, video_path: str) -> str:
+        """Return the pre-scaled background copy when caching is enabled."""
+        return self.components['video_processor']._source_path(video_path)[0]
+
+    def execute_batch(self, jobs: List[Tuple[str, str, str, Optional[str]]],
+                      music_path: str, video_path: str, fps: int = 30) -> None:
+        """Render several videos over the same background in one ffmpeg process.
+
+        Args:
+            jobs: (output_path, tts_path, text, subtitle_json) for each video
+            music_path: Background music shared by the videos
+            video_path: Background video shared by the videos
+            fps: Output frame rate
+
+        Raises:
+            RuntimeError: If the ffmpeg renderer is not in use, or ffmpeg fails
+        """
+        if not self._use_ffmpeg():
+            raise RuntimeError("Batched rendering requires the ffmpeg renderer")
+
+        music_path = os.path.normpath(music_path)
+        video_path = os.path.normpath(video_path)
+        render_jobs = []
+        for output_path, tts_path, text, subtitle_json in jobs:
+            output_path = os.path.normpath(output_path)
+            tts_path = os.path.normpath(tts_path)
+            if subtitle_json:
+                subtitle_json = os.path.normpath(subtitle_json)
+            self.components['validator'].validate_inputs(
+                output_path, tts_path, music_path, video_path, subtitle_json)
+            render_jobs.append(
+                self._render_job(output_path, tts_path, text, subtitle_json))
+
+        logging.info("Rendering %d videos with one ffmpeg process", len(render_jobs))
+        self.components['ffmpeg_renderer'].render_batch(
+            render_jobs, music_path, self._background_path(video_path), fps=fps)
+
     def execute(
             self,
             output_path: str,
@@ -905,32 +1359,65 @@ class VideoPipeline:
                 output_path,
                 tts_path,
                 music_path,
-                video_path
+                video_path,
+                subtitle_json
             )
             logging.info("Input validation completed successfully")
 
-            # 2. Audio processing
-            logging.info(
-                "Step 2/6: Processing audio files (TTS and background music)")
-            audio_clip = self.components['audio_processor'].process_audio(
-                tts_path, music_path)
-            self._register_clip('audio', audio_clip)
-            logging.info(
-                f"Audio processing completed. Duration: {audio_clip.duration:.2f} seconds")
-
-            # 3. Video processing
-            logging.info("Step 3/6: Processing video file")
-            video_clip = self.components['video_processor'].process_video(
-                video_path, audio_clip.duration)
-            self._register_clip('video', video_clip)
+            if self._use_ffmpeg():
+                self._execute_ffmpeg(output_path, tts_path, music_path,
+                                     video_path, text, subtitle_json, fps)
+                logging.info("✨ Successfully created video: %s", output_path)
+                return
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Open the background, scaling it on first use, and parse the
+                # subtitle timings while the narration is decoded and mixed
+                prefetch_future = executor.submit(
+                    self.components['video_processor'].prefetch, video_path)
+                if subtitle_json:
+                    # Errors resurface from generate_subtitles
+                    executor.submit(
+                        self.components['subtitle_engine'].prefetch, subtitle_json)
+
+                # 2. Audio processing
+                logging.info(
+                    "Step 2/6: Processing audio files (TTS and background music)")
+                audio_clip = self.components['audio_processor'].process_audio(
+                    tts_path, music_path)
+                self._register_clip('audio', audio_clip)
+                # Every later stage is timed to the narration
+                master_duration = float(audio_clip.duration)
+                logging.info(
+                    f"Audio processing completed. Duration: {master_duration:.2f} seconds")
+
+                # 3-4. Video processing and subtitle generation only need the
+                # audio duration, so the subtitle rasterization runs while the
+                # background is opened and looped
+                logging.info("Step 3/6: Processing video file")
+                logging.info("Step 4/6: Generating subtitles")
+                subtitles_future = executor.submit(
+                    self.components['subtitle_engine'].generate_subtitles,
+                    text, master_duration, subtitle_json)
+                # The source clip cache is not thread-safe, so the
+                # prefetch has to finish first; if it failed, process_video
+                # retries and reports the error
+                if prefetch_future.exception() is not None:
+                    logging.debug("Background prefetch failed: %s",
+                                  prefetch_future.exception())
+                video_future = executor.submit(
+                    self.components['video_processor'].process_video,
+                    video_path, master_duration)
+            # Register whichever stage succeeded before surfacing a failure,
+            # so cleanup still closes its clip
+            for clip_id, future in (('video', video_future),
+                                    ('subtitles', subtitles_future)):
+                if future.exception() is None:
+                    self._register_clip(clip_id, future.result())
+            video_clip = video_future.result()
             logging.info(
                 f"Video processing completed. Size: {video_clip.size}")
-
-            # 4. Subtitle generation
-            logging.info("Step 4/6: Generating subtitles")
-            subtitles_clip = self.components['subtitle_engine'].generate_subtitles(
-                text, audio_clip.duration, subtitle_json)
-            self._register_clip('subtitles', subtitles_clip)
+            subtitles_clip = subtitles_future.result()
             logging.info("Subtitle generation completed")
 
             # 5. Composition
@@ -959,10 +1446,18 @@ DEFAULT_CONFIG = {
     'music_volume': 0.3,
     'tts_volume': 1.2,
     'audio_master_duration_sec': 60,
+    'word_subtitles': False,
+    'render_batch_size': 1,
+    'x264_preset': 'veryfast',
+    'render_threads': 0,
+    'render_timeout': 600,
+    'max_encoder_sessions': 0,
     'panic_mode': False
 }
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO,
+                        format='%(filename)s - %(lineno)d - %(asctime)s - %(levelname)s - %(message)s')
     try:
         with VideoPipeline(DEFAULT_CONFIG) as pipeline:
             pipeline.execute(
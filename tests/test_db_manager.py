@@ -0,0 +1,219 @@
+import asyncio
+import sqlite3
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+from src.db import AsyncDatabaseManager, DatabaseManager, Story, StoryStatus
+
+
+class TestDatabaseManager:
+    @pytest.fixture
+    def db(self, tmp_path):
+        """Creates a DatabaseManager backed by a temporary SQLite file."""
+        manager = DatabaseManager(str(tmp_path / "stories.db"))
+        yield manager
+        manager.close()
+
+    @pytest.fixture
+    def story(self):
+        """Creates a minimal story for testing."""
+        return Story(
+            id="story-1",
+            title="Test Post",
+            author="test_user",
+            subreddit="tifu",
+            url="/r/tifu/comments/123/test_post",
+            text="Test content",
+            created_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+            status=StoryStatus.NEW
+        )
+
+    def test_parse_datetime_with_microseconds(self, db):
+        """Test parsing SQLite timestamps that include microseconds."""
+        assert db._parse_datetime("2024-01-02 03:04:05.678901") == \
+            datetime(2024, 1, 2, 3, 4, 5, 678901)
+
+    def test_parse_datetime_without_microseconds(self, db):
+        """Test parsing SQLite CURRENT_TIMESTAMP values."""
+        assert db._parse_datetime("2024-01-02 03:04:05") == \
+            datetime(2024, 1, 2, 3, 4, 5)
+
+    def test_parse_datetime_short_fraction(self, db):
+        """Test parsing timestamps with fewer than six fractional digits."""
+        assert db._parse_datetime("2024-01-02 03:04:05.5") == \
+            datetime(2024, 1, 2, 3, 4, 5, 500000)
+
+    def test_parse_datetime_invalid(self, db):
+        """Test that corrupt values fall back to the current time."""
+        assert isinstance(db._parse_datetime("not a date"), datetime)
+
+    def test_add_and_get_story(self, db, story):
+        """Test a story round-trips through the database."""
+        db.add_story(story)
+        fetched = db.get_story(story.id)
+        assert fetched == story
+
+    def test_get_story_missing(self, db):
+        """Test fetching an unknown story returns None."""
+        assert db.get_story("missing") is None
+
+    def test_update_story_status(self, db, story):
+        """Test status and error updates are persisted."""
+        db.add_story(story)
+        db.update_story_status(story.id, StoryStatus.ERROR, "boom")
+        fetched = db.get_story(story.id)
+        assert fetched.status == StoryStatus.ERROR
+        assert fetched.error == "boom"
+
+    def test_created_at_stored_as_integer(self, db, story):
+        """Test created_at is persisted as integer unix microseconds."""
+        db.add_story(story)
+        row = db.conn.execute(
+            "SELECT typeof(created_at), created_at FROM stories WHERE id = ?",
+            (story.id,)).fetchone()
+        assert row[0] == 'integer'
+        assert row[1] == db._to_unix_micros(story.created_at)
+
+    def test_migrate_legacy_text_created_at(self, tmp_path, story):
+        """Test text timestamps from older databases are migrated on open."""
+        db_path = str(tmp_path / "legacy.db")
+        manager = DatabaseManager(db_path)
+        manager.add_story(story)
+        with manager.conn:
+            manager.conn.execute(
+                "UPDATE stories SET created_at = ? WHERE id = ?",
+                ("2024-01-02 03:04:05.678901", story.id))
+        manager.close()
+
+        with DatabaseManager(db_path) as reopened:
+            assert reopened.get_story(story.id).created_at == story.created_at
+
+    def test_add_stories_batch(self, db, story):
+        """Test several stories can be inserted in one call."""
+        second = replace(story, id='story-2')
+        db.add_stories([story, second])
+        assert {s.id for s in db.get_all_stories()} == {'story-1', 'story-2'}
+
+    def test_update_story_paths_and_status(self, db, story):
+        """Test paths and status are written together."""
+        db.add_story(story)
+        db.update_story_paths_and_status(
+            story.id, StoryStatus.AUDIO_GENERATED,
+            audio_path="audio.mp3", timestamps_path="timestamps.json")
+        fetched = db.get_story(story.id)
+        assert fetched.status == StoryStatus.AUDIO_GENERATED
+        assert fetched.audio_path == "audio.mp3"
+        assert fetched.timestamps_path == "timestamps.json"
+        assert fetched.subtitles_path is None
+
+    def test_delete_story_removes_files(self, db, story, tmp_path):
+        """Test deleting a story removes its row and existing files."""
+        audio = tmp_path / "audio.mp3"
+        audio.write_bytes(b"data")
+        db.add_story(replace(story, audio_path=str(audio),
+                             timestamps_path=str(tmp_path / "missing.json")))
+        db.delete_story(story.id)
+        assert db.get_story(story.id) is None
+        assert not audio.exists()
+
+    def test_delete_story_removes_decoded_audio(self, db, story, tmp_path):
+        """Test deleting a story also removes the audio's decoded-samples cache."""
+        audio = tmp_path / "audio.mp3"
+        audio.write_bytes(b"data")
+        decoded = tmp_path / "audio.pcm16k.npy"
+        decoded.write_bytes(b"samples")
+        db.add_story(replace(story, audio_path=str(audio)))
+        db.delete_story(story.id)
+        assert not decoded.exists()
+
+    def test_get_stories_awaiting_subtitles(self, db, story):
+        """Test only stories with generated audio are returned."""
+        db.add_stories([
+            replace(story, status=StoryStatus.AUDIO_GENERATED,
+                    audio_path="audio.mp3", timestamps_path="timestamps.json"),
+            replace(story, id="story-2")
+        ])
+        assert db.get_stories_awaiting_subtitles(["story-1", "story-2"]) == [{
+            'id': "story-1",
+            'title': story.title,
+            'audio_path': "audio.mp3",
+            'timestamps_path': "timestamps.json"
+        }]
+
+
+    def test_background_writes(self, tmp_path, story):
+        """Test queued writes are committed before subsequent reads."""
+        with DatabaseManager(str(tmp_path / "queued.db"), background_writes=True) as db:
+            db.add_story(story)
+            future = db.update_story_status(story.id, StoryStatus.READY)
+            assert db.get_story(story.id).status == StoryStatus.READY
+            assert future.done() and future.exception() is None
+
+    def test_background_write_error_reported(self, tmp_path, story):
+        """Test a failing queued write surfaces through its future."""
+        with DatabaseManager(str(tmp_path / "queued.db"), background_writes=True) as db:
+            db.add_story(story)
+            duplicate = db.add_story(story)
+            ok = db.update_story_status(story.id, StoryStatus.READY)
+            db.flush()
+            assert isinstance(duplicate.exception(), sqlite3.IntegrityError)
+            assert ok.exception() is None
+
+    def test_background_writer_survives_non_sqlite_error(self, tmp_path, story):
+        """Test a write failing outside sqlite3 is reported and later writes still run."""
+        class BadRows:
+            def __iter__(self):
+                raise RuntimeError("bad rows")
+
+        with DatabaseManager(str(tmp_path / "queued.db"), background_writes=True) as db:
+            failed = db._write("UPDATE stories SET status = ?", BadRows(), many=True)
+            db.add_story(story)
+            assert db.get_story(story.id) == story
+            assert isinstance(failed.exception(), RuntimeError)
+
+
+class TestAsyncDatabaseManager:
+    def test_round_trip(self, tmp_path):
+        """Test writes through the writer connection are visible to pooled readers."""
+        story = Story(
+            id="story-1",
+            title="Test Post",
+            author="test_user",
+            subreddit="tifu",
+            url="/r/tifu/comments/123/test_post",
+            text="Test content",
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+            status=StoryStatus.NEW
+        )
+
+        async def run():
+            async with AsyncDatabaseManager(str(tmp_path / "stories.db"), pool_size=2) as db:
+                await db.add_story(story)
+                await db.update_story_status(story.id, StoryStatus.READY)
+                return await asyncio.gather(db.get_story(story.id), db.get_all_stories())
+
+        fetched, all_stories = asyncio.run(run())
+        assert fetched.status == StoryStatus.READY
+        assert [s.id for s in all_stories] == [story.id]
+
+    def test_contended_pool(self, tmp_path):
+        """Test readers and writers beyond the pool size wait their turn under asyncio.run."""
+        db = AsyncDatabaseManager(str(tmp_path / "stories.db"), pool_size=1)
+        stories = [Story(
+            id=f"story-{i}",
+            title="Test Post",
+            author="test_user",
+            subreddit="tifu",
+            url=f"/r/tifu/comments/{i}/test_post",
+            text="Test content",
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+            status=StoryStatus.NEW
+        ) for i in range(4)]
+
+        async def run():
+            async with db:
+                await asyncio.gather(*(db.add_story(story) for story in stories))
+                return await asyncio.gather(*(db.get_story(story.id) for story in stories))
+
+        assert [s.id for s in asyncio.run(run())] == [s.id for s in stories]
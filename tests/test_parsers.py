@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from src.subtitle_processing.parsers import (
+    ElevenLabsSubtitleParser,
+    SubtitleParserFactory,
+    WhisperSubtitleParser,
+)
+
+
+class TestSubtitleParsers:
+    @pytest.fixture
+    def elevenlabs_json(self, tmp_path):
+        """Creates an ElevenLabs alignment file with a double space."""
+        path = tmp_path / "timestamps.json"
+        chars = list("Hi  there you")
+        path.write_text(json.dumps([{
+            'characters': chars,
+            'character_start_times_seconds': [i * 0.5 for i in range(len(chars))]
+        }]))
+        return str(path)
+
+    @pytest.fixture
+    def whisper_json(self, tmp_path):
+        """Creates a Whisper transcription file."""
+        path = tmp_path / "audio.json"
+        path.write_text(json.dumps({
+            'text': ' Hello there.',
+            'segments': [{'start': 0.0, 'end': 1.5, 'text': ' Hello there.'}]
+        }, indent=2))
+        return str(path)
+
+    def test_elevenlabs_groups_words(self, elevenlabs_json):
+        """Test characters are grouped into words timed by their first and last character."""
+        entries = ElevenLabsSubtitleParser().parse(elevenlabs_json)
+        assert [text for _, text in entries] == ['Hi', 'there', 'you']
+        assert entries[0][0] == pytest.approx((0.0, 0.6))
+        assert entries[1][0] == pytest.approx((2.0, 4.1))
+        assert entries[2][0] == pytest.approx((5.0, 6.1))
+
+    def test_factory_detects_elevenlabs(self, elevenlabs_json):
+        """Test an array file selects the ElevenLabs parser."""
+        assert isinstance(SubtitleParserFactory.create_parser(elevenlabs_json),
+                          ElevenLabsSubtitleParser)
+
+    def test_factory_detects_whisper(self, whisper_json):
+        """Test an object file selects the Whisper parser."""
+        parser = SubtitleParserFactory.create_parser(whisper_json)
+        assert isinstance(parser, WhisperSubtitleParser)
+        assert parser.parse(whisper_json) == [((0.0, 1.5), 'Hello there.')]
+
+    def test_factory_rejects_unknown(self, tmp_path):
+        """Test non-JSON content is rejected."""
+        path = tmp_path / "subs.srt"
+        path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHi\n")
+        with pytest.raises(ValueError):
+            SubtitleParserFactory.create_parser(str(path))
+
+    def test_whisper_prefers_word_timestamps(self, tmp_path):
+        """Test segments with word timings yield one entry per word."""
+        path = tmp_path / "words.json"
+        path.write_text(json.dumps({'segments': [{
+            'start': 0.0, 'end': 1.0, 'text': ' Hello there.',
+            'words': [
+                {'word': ' Hello', 'start': 0.0, 'end': 0.4, 'probability': 0.9},
+                {'word': ' there.', 'start': 0.5, 'end': 1.0, 'probability': 0.9}
+            ]
+        }]}))
+        assert WhisperSubtitleParser().parse(str(path)) == [
+            ((0.0, 0.4), 'Hello'),
+            ((0.5, 1.0), 'there.')
+        ]
@@ -0,0 +1,212 @@
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+import aiohttp
+import requests
+from src.story_pipeline import reddit_crawl
+from src.story_pipeline.reddit_crawl import crawl, get_posts
+
+@pytest.fixture
+def mock_post_data():
+    return {
+        "data": {
+            "children": [
+                {
+                    "data": {
+                        "id": "abc123",
+                        "title": "Test Post",
+                        "author": "test_user",
+                        "permalink": "/r/test/comments/123/test_post",
+                        "upvote_ratio": 0.95,
+                        "selftext": "Test content"
+                    }
+                }
+            ]
+        }
+    }
+
+@pytest.fixture
+def mock_session():
+    session = Mock()
+    response = Mock()
+    response.raise_for_status.return_value = None
+    session.get.return_value = response
+    return session, response
+
+@patch('src.story_pipeline.reddit_crawl.get_session')
+def test_successful_post_retrieval(mock_get_session, mock_session, mock_post_data):
+    session, response = mock_session
+    mock_get_session.return_value = session
+    response.json.return_value = mock_post_data
+
+    posts = get_posts("test")
+
+    assert len(posts) == 1
+    post = posts["abc123"]
+    assert post["title"] == "Test Post"
+    assert post["author"] == "test_user"
+    assert post["permalink"] == "/r/test/comments/123/test_post"
+    assert post["upvote_ratio"] == 0.95
+    assert post["text"] == "Test content"
+
+@patch('src.story_pipeline.reddit_crawl.get_session')
+def test_retry_configuration(mock_get_session, mock_session):
+    session, response = mock_session
+    mock_get_session.return_value = session
+    response.json.side_effect = ValueError("invalid json")
+
+    posts = get_posts("test", limit=2)
+
+    # Retries are delegated to the session for the requested count
+    mock_get_session.assert_called_once_with(2)
+    # Should return empty dict on failure
+    assert posts == {}
+
+@patch('src.story_pipeline.reddit_crawl.get_session')
+def test_error_handling(mock_get_session, mock_session):
+    session, _ = mock_session
+    mock_get_session.return_value = session
+    session.get.side_effect = requests.ConnectionError("Connection error")
+
+    posts = get_posts("test")
+    assert posts == {}  # Should return empty dict on error
+
+@patch('src.story_pipeline.reddit_crawl.get_session')
+def test_empty_response(mock_get_session, mock_session):
+    session, response = mock_session
+    mock_get_session.return_value = session
+    response.json.return_value = {"data": {"children": []}}
+
+    posts = get_posts("test")
+
+    assert len(posts) == 0
+    assert session.get.called
+
+
+def _listing(post_id, after=None):
+    return {"data": {"after": after, "children": [{"data": {
+        "id": post_id,
+        "title": f"Post {post_id}",
+        "author": "test_user",
+        "permalink": f"/r/test/comments/{post_id}",
+        "upvote_ratio": 0.9,
+        "selftext": "Test content"
+    }}]}}
+
+
+class FakeResponse:
+    """Stands in for an aiohttp response with a fixed status and body."""
+
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(Mock(), (), status=self.status)
+
+    async def json(self):
+        return self.body
+
+
+class FakeSession:
+    """Serves queued responses and records each request's params."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.params = []
+
+    def get(self, url, params=None, timeout=None):
+        self.params.append(params)
+        return self.responses.pop(0)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+    monkeypatch.setattr(reddit_crawl.asyncio, 'sleep', sleep)
+    return delays
+
+
+def _crawl_with(session, pages):
+    with patch('src.story_pipeline.reddit_crawl.aiohttp.ClientSession', return_value=session):
+        return asyncio.run(crawl(["test"], pages=pages))
+
+
+def test_crawl_follows_after_cursor():
+    session = FakeSession([FakeResponse(200, _listing("a", after="t3_a")),
+                           FakeResponse(200, _listing("b"))])
+
+    posts = _crawl_with(session, pages=3)
+
+    assert list(posts["test"]) == ["a", "b"]
+    # The second page is requested after the first page's cursor; no
+    # third request is made once a page has no cursor
+    assert session.params == [None, {"after": "t3_a"}]
+
+
+def test_crawl_retries_transient_errors(no_backoff):
+    session = FakeSession([FakeResponse(429), FakeResponse(503),
+                           FakeResponse(200, _listing("a"))])
+
+    posts = _crawl_with(session, pages=1)
+
+    assert list(posts["test"]) == ["a"]
+    assert len(session.params) == 3
+
+
+def test_crawl_error_keeps_earlier_pages(no_backoff):
+    session = FakeSession([FakeResponse(200, _listing("a", after="t3_a")),
+                           FakeResponse(404)])
+
+    posts = _crawl_with(session, pages=2)
+
+    assert list(posts["test"]) == ["a"]
+
+
+def test_backoff_is_capped(no_backoff):
+    session = FakeSession([FakeResponse(503)] * 10 + [FakeResponse(200, _listing("a"))])
+
+    asyncio.run(reddit_crawl.fetch_feed(session, "test"))
+
+    assert no_backoff[:3] == [0.5, 1, 2]
+    assert max(no_backoff) == reddit_crawl.BACKOFF_MAX
+
+
+def test_retry_after_is_honoured(no_backoff):
+    session = FakeSession([FakeResponse(429, headers={"Retry-After": "7"}),
+                           FakeResponse(200, _listing("a"))])
+
+    asyncio.run(reddit_crawl.fetch_feed(session, "test"))
+
+    assert no_backoff == [7.0]
+
+
+def test_semaphore_released_while_backing_off(monkeypatch):
+    semaphore = asyncio.Semaphore(1)
+    held = []
+
+    async def sleep(delay):
+        held.append(semaphore.locked())
+    monkeypatch.setattr(reddit_crawl.asyncio, 'sleep', sleep)
+    session = FakeSession([FakeResponse(503), FakeResponse(200, _listing("a"))])
+
+    asyncio.run(reddit_crawl.fetch_feed(session, "test", semaphore=semaphore))
+
+    assert held == [False]
@@ -1,7 +1,17 @@
 import os
+import numpy as np
 import pytest
 from moviepy import AudioFileClip, CompositeAudioClip
-from src.video_pipeline import InputValidator, AudioProcessor
+from src.video_pipeline.video_pipeline import AudioProcessor, InputValidator
+from src.video_pipeline import ffmpeg_renderer
+from src.video_pipeline.ffmpeg_renderer import (
+    ass_color,
+    format_ass_time,
+    resolve_encoder,
+    write_ass,
+    write_caption_track,
+)
+from src.video_pipeline.video_manager import capped_render_workers
 
 
 class TestInputValidator:
@@ -61,6 +71,17 @@ class TestInputValidator:
                 tmp_files["video"]
             )
 
+    def test_validate_inputs_missing_subtitles(self, validator, tmp_files):
+        """Test validation with a subtitle file that does not exist."""
+        with pytest.raises(FileNotFoundError, match="Subtitle file not found"):
+            validator.validate_inputs(
+                tmp_files["output"],
+                tmp_files["tts"],
+                tmp_files["music"],
+                tmp_files["video"],
+                os.path.join(os.path.dirname(tmp_files["tts"]), "missing.json")
+            )
+
     def test_validate_durations_success(self, validator):
         """Test successful duration validation."""
         validator.validate_durations(audio_duration=10.0, video_duration=20.0)
@@ -126,3 +147,123 @@ class TestAudioProcessor:
                 'nonexistent_tts.mp3',
                 'nonexistent_music.mp3'
             )
+
+    def test_narration_samples(self, processor):
+        """Test narration is faded at both ends and peak-normalized to the TTS volume."""
+        class ConstantClip:
+            duration = 2.0
+
+            def to_soundarray(self, fps):
+                return np.full(int(self.duration * fps), 0.5)
+
+        samples = processor._narration_samples(ConstantClip())
+        assert samples.shape[1] == 1
+        assert samples[0, 0] == 0
+        assert samples.max() == pytest.approx(processor.tts_volume)
+        assert samples[len(samples) // 2, 0] == pytest.approx(processor.tts_volume)
+        assert samples[-1, 0] < 0.01
+
+
+class TestFfmpegRenderer:
+    def test_format_ass_time(self):
+        """Test seconds are formatted as H:MM:SS.cc."""
+        assert format_ass_time(0) == "0:00:00.00"
+        assert format_ass_time(61.237) == "0:01:01.24"
+        assert format_ass_time(3723.5) == "1:02:03.50"
+
+    def test_ass_color(self):
+        """Test colour names and hex strings convert to &H00BBGGRR."""
+        assert ass_color('white') == "&H00FFFFFF"
+        assert ass_color('#FF8000') == "&H000080FF"
+        with pytest.raises(ValueError):
+            ass_color('not-a-colour')
+
+    def test_write_ass(self, tmp_path):
+        """Test entries become Dialogue lines with escaped text."""
+        ass_path = write_ass(
+            [((0.0, 1.5), "Hello {world}")],
+            str(tmp_path / "subs.ass"),
+            {'font_path': 'fonts/font_at.ttf', 'vertical_resolution': (1080, 1920)},
+            (1920, 1080))
+        content = open(ass_path, encoding='utf-8').read()
+        assert "PlayResX: 1920\nPlayResY: 1080" in content
+        assert "Style: Default,font_at,70," in content
+        assert ",8,420,420,918,1" in content
+        assert "Dialogue: 0,0:00:00.00,0:00:01.50,Default,,0,0,0,," \
+            "{\\fad(100,100)}Hello \\{world\\}" in content
+
+    def test_write_ass_track_fades(self, tmp_path):
+        """Test only the first and last captions fade, like the MoviePy caption track."""
+        ass_path = write_ass(
+            [((0.0, 0.5), "one"), ((0.5, 1.0), "two"), ((1.0, 1.5), "three")],
+            str(tmp_path / "subs.ass"), {}, (1080, 1920))
+        dialogue = [line.split(',,')[-1] for line in
+                    open(ass_path, encoding='utf-8').read().splitlines()
+                    if line.startswith('Dialogue')]
+        assert dialogue == ["{\\fad(100,0)}one", "two", "{\\fad(0,100)}three"]
+
+    def test_resolve_encoder_x264_preset(self):
+        """Test x264_preset replaces the libx264 preset and keeps the CRF."""
+        assert resolve_encoder({'video_codec': 'libx264', 'x264_preset': 'ultrafast'}) == \
+            ('libx264', ['-preset', 'ultrafast', '-crf', '23'])
+        assert resolve_encoder({'hardware_encoding': False}) == \
+            ('libx264', ['-preset', 'veryfast', '-crf', '23'])
+
+    def test_resolve_encoder_render_threads(self):
+        """Test render_threads appends an encoder thread cap."""
+        assert resolve_encoder({'video_codec': 'libx264', 'render_threads': 2}) == \
+            ('libx264', ['-preset', 'veryfast', '-crf', '23', '-threads', '2'])
+
+    def test_write_caption_track(self, tmp_path, monkeypatch):
+        """Test captions are timed in order, with blank gaps and overlaps cut."""
+        monkeypatch.setattr(ffmpeg_renderer, 'render_caption', lambda text, style: (
+            np.zeros((10, 3 * len(text), 3), dtype=np.uint8),
+            np.ones((10, 3 * len(text)), dtype=np.float32)))
+        list_path = write_caption_track(
+            [((0.9, 2.0), "there"), ((0.5, 1.0), "hi"), ((2.5, 3.0), "hi")],
+            str(tmp_path), {})
+        lines = open(list_path, encoding='utf-8').read().splitlines()
+        files = [os.path.basename(line.strip("'")) for line in lines if line.startswith('file')]
+        durations = [line for line in lines if line.startswith('duration')]
+        assert files == ['blank.png', 'caption_0.png', 'caption_1.png',
+                         'blank.png', 'caption_0.png', 'blank.png']
+        assert durations == ['duration 0.500', 'duration 0.400', 'duration 1.100',
+                             'duration 0.500', 'duration 0.500']
+
+    def test_filter_graph_without_fades(self):
+        """Test a zero fade_duration leaves fade filters out of the graph."""
+        graph = ffmpeg_renderer.FfmpegRenderer({'fade_duration': 0})._filter_graph(
+            [10.0], ['subs.ass'])
+        assert "fade=" not in graph
+        assert "[bg0]trim=duration=10.000,subtitles=" in graph
+        assert "[2:a]volume=1.000000[tts0]" in graph
+
+    def test_filter_graph_peak_gains(self):
+        """Test narration and music are scaled by their peak gain times the configured volume."""
+        graph = ffmpeg_renderer.FfmpegRenderer(
+            {'tts_volume': 1.2, 'music_volume': 0.3, 'fade_duration': 0.5})._filter_graph(
+                [10.0], ['subs.ass'], narration_gains=[2.0], music_gain=4.0)
+        assert "loudnorm" not in graph
+        assert "[1:a]volume=1.200000,asplit=1[music0]" in graph
+        assert "afade=t=out:st=9.500:d=0.5,volume=2.400000[tts0]" in graph
+
+    def test_peak_gain(self, monkeypatch):
+        """Test volumedetect's max_volume is turned into a linear gain."""
+        class Result:
+            stderr = "[Parsed_volumedetect_0 @ 0x1] max_volume: -6.0 dB\n"
+
+        monkeypatch.setattr(ffmpeg_renderer.subprocess, 'run', lambda *args, **kwargs: Result())
+        assert ffmpeg_renderer.peak_gain('narration.mp3') == pytest.approx(10 ** 0.3)
+
+
+class TestRenderWorkers:
+    def test_capped_for_nvenc_sessions(self):
+        """Test NVENC renders are limited to the encoder sessions, per batch video."""
+        assert capped_render_workers(8, 'h264_nvenc') == 3
+        assert capped_render_workers(8, 'h264_nvenc', batch_size=2) == 1
+        assert capped_render_workers(8, 'h264_nvenc', max_sessions=5) == 5
+        assert capped_render_workers(2, 'h264_nvenc') == 2
+
+    def test_software_encoder_uncapped(self):
+        """Test libx264 renders keep the requested worker count."""
+        assert capped_render_workers(8, 'libx264') == 8